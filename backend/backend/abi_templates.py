@@ -0,0 +1,371 @@
+# abi_templates.py
+#
+# Blocksign ARC-56 spec'inden (smart_contracts/__main__.py build çıktısı) AppCall şablonları.
+# Selector, argüman encoder'ları ve box isim düzeni uygulama açılışında bir kez hesaplanır;
+# istek başına yalnızca sender / argüman değerleri / suggested params yamalanır.
+
+import base64
+import copy
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from algosdk import encoding, transaction
+from algosdk.abi import ABIType, Method
+
+_ARC56_REPO_PATH = "blockchain/blocksign/projects/blocksign/smart_contracts/artifacts/blocksign/Blocksign.arc56.json"
+
+
+def arc56_path() -> Path:
+    """
+    BLOCKSIGN_ARC56_PATH, yoksa repo içindeki build çıktısı.
+    Şablonlar kurulurken çağrılır (import sırasında değil).
+    """
+    env_path = os.getenv("BLOCKSIGN_ARC56_PATH")
+    if env_path:
+        return Path(env_path)
+    # Repo içinden çalışırken: backend/backend/ -> repo kökü. Docker'da (/app) bu üst dizin yok.
+    parents = Path(__file__).resolve().parents
+    if len(parents) < 3:
+        raise RuntimeError(
+            f"ARC-56 spec yolu çözülemedi ({__file__} repo içinde değil); BLOCKSIGN_ARC56_PATH ayarlayın"
+        )
+    return parents[2] / _ARC56_REPO_PATH
+
+# Box key kaynağı: metod argümanının adı ya da Txn.sender
+SENDER = "@sender"
+# Adres dizisi argümanı: her eleman için ayrı box ("signers[]")
+EACH = "[]"
+# mbr_ key'i iki kaynaktan türetilir: (hash argümanı, imzacı kaynağı) -> member_key(...)
+KeySource = Union[str, Tuple[str, str]]
+
+# ARC-56 hangi metodun hangi box'a dokunduğunu içermez; contract.py'den çıkarılan tablo.
+# (box map adı, key kaynağı)
+# cancel / reject: "signers" ABI argümanı değildir; zincirdeki sgn_ listesi build'e verilir
+# ve sözleşme her imzacının mbr_ kutusunu siler.
+METHOD_BOXES: Dict[str, Tuple[Tuple[str, KeySource], ...]] = {
+    "create_contract": (
+        ("asset_by_hash", "file_hash"),
+        ("admin_by_hash", "file_hash"),
+        ("signers_blob_by_hash", "file_hash"),
+        ("signed_blob_by_hash", "file_hash"),
+        ("canceled_by_hash", "file_hash"),
+        ("user_hashes", SENDER),
+        ("signed_bits_by_hash", "file_hash"),
+        ("count_by_hash", "file_hash"),
+        ("member_by_key", ("file_hash", "signers" + EACH)),
+    ),
+    "cancel": (
+        ("asset_by_hash", "file_hash"),
+        ("signers_blob_by_hash", "file_hash"),
+        ("signed_blob_by_hash", "file_hash"),
+        ("canceled_by_hash", "file_hash"),
+        ("signed_bits_by_hash", "file_hash"),
+        ("count_by_hash", "file_hash"),
+        ("member_by_key", ("file_hash", "signers" + EACH)),
+    ),
+    "sign": (
+        ("asset_by_hash", "file_hash"),
+        ("signed_blob_by_hash", "file_hash"),
+        ("canceled_by_hash", "file_hash"),
+        ("signed_bits_by_hash", "file_hash"),
+        ("count_by_hash", "file_hash"),
+        ("member_by_key", ("file_hash", "signer")),
+    ),
+    "issign": (
+        ("canceled_by_hash", "file_hash"),
+        ("signed_bits_by_hash", "file_hash"),
+        ("member_by_key", ("file_hash", SENDER)),
+    ),
+    "iscomplete": (
+        ("canceled_by_hash", "file_hash"),
+        ("count_by_hash", "file_hash"),
+    ),
+    "reject": (
+        ("asset_by_hash", "file_hash"),
+        ("signers_blob_by_hash", "file_hash"),
+        ("signed_blob_by_hash", "file_hash"),
+        ("canceled_by_hash", "file_hash"),
+        ("signed_bits_by_hash", "file_hash"),
+        ("count_by_hash", "file_hash"),
+        ("member_by_key", ("file_hash", "signer")),
+        ("member_by_key", ("file_hash", "signers" + EACH)),
+    ),
+    "my_contracts": (
+        ("user_hashes", SENDER),
+    ),
+    "get_asset_id": (
+        ("asset_by_hash", "file_hash"),
+    ),
+    "is_active": (
+        ("canceled_by_hash", "file_hash"),
+    ),
+    "total_signers": (
+        ("count_by_hash", "file_hash"),
+    ),
+    "signed_count": (
+        ("count_by_hash", "file_hash"),
+    ),
+}
+
+# Inner AssetConfig yapan metodlar için flat fee (yetmezse 3000 yap)
+METHOD_FEES: Dict[str, int] = {
+    "create_contract": 2000,
+    "cancel": 2000,
+    "reject": 2000,
+}
+DEFAULT_FEE = 1000
+
+# ARC-4 dönüş değeri log'u: 0x151f7c75 + ABI-encoded değer
+RETURN_PREFIX = bytes.fromhex("151f7c75")
+
+# Bir işlemdeki box referansı üst sınırı; fazlası aynı gruptaki box_refs çağrılarına taşınır
+MAX_TXN_REFS = 8
+BOX_REFS_METHOD = "box_refs"
+# ARC-56'da AVM-native (ABI olmayan) key tipi: key baytları olduğu gibi kullanılır
+AVM_BYTES = "AVMBytes"
+
+
+def member_key(encoded_file_hash: bytes, address: str) -> bytes:
+    """Sözleşmedeki mbr_ key'i: sha256(ABI byte[] file_hash || 32B public key)."""
+    return hashlib.sha256(encoded_file_hash + encoding.decode_address(address)).digest()
+
+
+def _key_encoder(key_type: str) -> Optional[ABIType]:
+    return None if key_type == AVM_BYTES else ABIType.from_string(key_type)
+
+
+@dataclass(frozen=True)
+class BoxSlot:
+    prefix: bytes
+    key_type: str        # ARC-56 keyType ("byte[]", "address", "AVMBytes", ...)
+    key_encoder: Optional[ABIType]
+    source: KeySource    # argüman adı, SENDER ya da (hash argümanı, imzacı kaynağı)
+    reuse_arg: bool      # key tipi argüman tipiyle aynı: encode edilmiş argüman aynen key olur
+
+    def _addresses(self, source: str, sender: str, args: Dict[str, Any]) -> List[str]:
+        if source == SENDER:
+            return [sender]
+        if source.endswith(EACH):
+            return list(args[source[:-len(EACH)]])
+        return [args[source]]
+
+    def keys(self, sender: str, encoded: Dict[str, bytes], args: Dict[str, Any]) -> List[bytes]:
+        if isinstance(self.source, tuple):
+            hash_arg, signer_source = self.source
+            return [
+                member_key(encoded[hash_arg], addr)
+                for addr in self._addresses(signer_source, sender, args)
+            ]
+        if self.source == SENDER:
+            return [encoding.decode_address(sender)]
+        if self.reuse_arg:
+            return [encoded[self.source]]
+        return [self.key_encoder.encode(args[self.source])]
+
+
+@dataclass(frozen=True)
+class MethodTemplate:
+    name: str
+    method: Method
+    selector: bytes
+    arg_names: Tuple[str, ...]
+    arg_types: Tuple[str, ...]
+    arg_encoders: Tuple[ABIType, ...]
+    returns: Optional[ABIType]
+    boxes: Tuple[BoxSlot, ...]
+    fee: int
+
+    def encode_args(self, args: Dict[str, Any]) -> Dict[str, bytes]:
+        try:
+            return {
+                name: enc.encode(args[name])
+                for name, enc in zip(self.arg_names, self.arg_encoders)
+            }
+        except KeyError as e:
+            raise ValueError(f"{self.name}: eksik argüman {e}")
+
+    def box_names(self, sender: str, encoded: Dict[str, bytes], args: Dict[str, Any]) -> list:
+        names = []
+        for slot in self.boxes:
+            for key in slot.keys(sender, encoded, args):
+                name = slot.prefix + key
+                if name not in names:  # imzacı listesinde tekrar eden adres
+                    names.append(name)
+        return names
+
+    def decode_return(self, log: bytes) -> Any:
+        """Son log'daki ARC-4 dönüşünü çözer; byte[] dönüşler bytes olarak verilir."""
+        if self.returns is None:
+            return None
+        if not log.startswith(RETURN_PREFIX):
+            raise ValueError(f"{self.name}: ARC-4 return log'u bulunamadı")
+        value = self.returns.decode(log[len(RETURN_PREFIX):])
+        if isinstance(value, list) and str(self.returns) == "byte[]":
+            return bytes(value)
+        return value
+
+    def build(
+        self,
+        app_id: int,
+        sender: str,
+        sp: transaction.SuggestedParams,
+        **args: Any,
+    ) -> transaction.ApplicationCallTxn:
+        """sp yerinde değiştirilir (flat fee); çağıran kopya vermeli."""
+        encoded = self.encode_args(args)
+        sp.flat_fee = True
+        sp.fee = self.fee
+        return transaction.ApplicationCallTxn(
+            sender=sender,
+            sp=sp,
+            index=app_id,
+            on_complete=transaction.OnComplete.NoOpOC,
+            app_args=[self.selector] + [encoded[n] for n in self.arg_names],
+            # BoxReference'ın ilk alanı foreign_apps indeksidir (app id değil); 0 = çağrılan app.
+            # algosdk hazır BoxReference nesnelerini çevirmeden kodlar.
+            boxes=[
+                transaction.BoxReference(0, name)
+                for name in self.box_names(sender, encoded, args)
+            ],
+        )
+
+
+class TemplateEngine:
+    """
+    ARC-56 spec'indeki her metod için MethodTemplate üretir.
+    Box key'leri ARC-56 keyType'a göre ABI-encode edilir (byte[] key = 2B uzunluk + veri),
+    bu da sözleşmenin BoxMap(arc4.DynamicBytes, ...) için kullandığı isimle birebir aynıdır.
+    """
+
+    def __init__(self, spec: Dict[str, Any], app_id: int):
+        self.app_id = app_id
+        self.spec = spec
+        box_maps = spec.get("state", {}).get("maps", {}).get("box", {})
+        # box map adı -> (prefix, key encoder); doğrudan box okuma için
+        self._box_maps: Dict[str, Tuple[bytes, Optional[ABIType]]] = {
+            name: (base64.b64decode(bm["prefix"]), _key_encoder(bm["keyType"]))
+            for name, bm in box_maps.items()
+        }
+
+        self._templates: Dict[str, MethodTemplate] = {}
+        for m in spec["methods"]:
+            name = m["name"]
+            arg_names = tuple(a["name"] for a in m["args"])
+            arg_types = tuple(a["type"] for a in m["args"])
+            ret_type = m["returns"]["type"]
+            method = Method.from_signature(f"{name}({','.join(arg_types)}){ret_type}")
+
+            slots = []
+            for map_name, source in METHOD_BOXES.get(name, ()):
+                bm = box_maps[map_name]
+                slots.append(BoxSlot(
+                    prefix=base64.b64decode(bm["prefix"]),
+                    key_type=bm["keyType"],
+                    key_encoder=_key_encoder(bm["keyType"]),
+                    source=source,
+                    reuse_arg=(
+                        source in arg_names
+                        and arg_types[arg_names.index(source)] == bm["keyType"]
+                    ),
+                ))
+
+            self._templates[name] = MethodTemplate(
+                name=name,
+                method=method,
+                selector=method.get_selector(),
+                arg_names=arg_names,
+                arg_types=arg_types,
+                arg_encoders=tuple(ABIType.from_string(t) for t in arg_types),
+                returns=None if ret_type == "void" else ABIType.from_string(ret_type),
+                boxes=tuple(slots),
+                fee=METHOD_FEES.get(name, DEFAULT_FEE),
+            )
+
+    @classmethod
+    def from_file(cls, path: Path, app_id: int) -> "TemplateEngine":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f), app_id)
+
+    def __getitem__(self, name: str) -> MethodTemplate:
+        return self._templates[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._templates
+
+    @property
+    def methods(self) -> Tuple[str, ...]:
+        return tuple(self._templates)
+
+    def box_name(self, map_name: str, key: Any) -> bytes:
+        """Sözleşmenin kullandığı box adı: prefix + ABI-encoded key (AVMBytes key: ham bayt)."""
+        prefix, encoder = self._box_maps[map_name]
+        return prefix + (key if encoder is None else encoder.encode(key))
+
+    def build(
+        self,
+        name: str,
+        sender: str,
+        sp: transaction.SuggestedParams,
+        **args: Any,
+    ) -> transaction.ApplicationCallTxn:
+        return self._templates[name].build(self.app_id, sender, sp, **args)
+
+    def build_spread(
+        self,
+        name: str,
+        sender: str,
+        sp: transaction.SuggestedParams,
+        **args: Any,
+    ) -> List[transaction.ApplicationCallTxn]:
+        """
+        MAX_TXN_REFS'ten fazla box isteyen çağrı (ör. çok imzacılı create_contract / cancel / reject):
+        fazla referanslar box_refs çağrılarına dağıtılır, grup içi kaynak paylaşımıyla
+        asıl çağrı da görür. Dönüş [asıl çağrı, box_refs...]; grup id'yi çağıran atar.
+        """
+        txn = self.build(name, sender, copy.copy(sp), **args)
+        overflow, txn.boxes = txn.boxes[MAX_TXN_REFS:], txn.boxes[:MAX_TXN_REFS]
+        txns = [txn]
+        for start in range(0, len(overflow), MAX_TXN_REFS):
+            carrier = self.build(BOX_REFS_METHOD, sender, copy.copy(sp))
+            carrier.boxes = overflow[start:start + MAX_TXN_REFS]
+            txns.append(carrier)
+        return txns
+
+
+# --- Box / dönüş blob'ları için yardımcılar ---
+_UINT64 = ABIType.from_string("uint64")
+
+
+def decode_uint64_return(log: bytes) -> int:
+    """Metod bağımsız ARC-4 uint64 dönüşü (sözleşmedeki metodların çoğu uint64 döner)."""
+    if not log.startswith(RETURN_PREFIX):
+        raise ValueError("ARC-4 return log'u bulunamadı")
+    return _UINT64.decode(log[len(RETURN_PREFIX):])
+
+
+def split_addresses(blob: bytes) -> List[str]:
+    """sgn_ / sgh_ blob'u: ardışık 32B public key -> Algorand adresleri."""
+    return [encoding.encode_address(blob[i:i + 32]) for i in range(0, len(blob) - 31, 32)]
+
+
+def decode_sign_count(value: bytes) -> Tuple[int, int]:
+    """cnt_ değeri (SignCount): (tekil imzacı sayısı, imzalayan sayısı), 2 x uint64."""
+    return int.from_bytes(value[:8], "big"), int.from_bytes(value[8:16], "big")
+
+
+def split_encoded_hashes(blob: bytes) -> List[bytes]:
+    """
+    uhs_ blob'u / my_contracts dönüşü: sözleşme file_hash.bytes (ARC-4 byte[]) ekler,
+    yani her kayıt 2B uzunluk + veri. Kayıtlar sırasıyla çözülür.
+    """
+    out = []
+    i = 0
+    while i + 2 <= len(blob):
+        n = int.from_bytes(blob[i:i + 2], "big")
+        out.append(blob[i + 2:i + 2 + n])
+        i += 2 + n
+    return out
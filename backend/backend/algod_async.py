@@ -0,0 +1,153 @@
+# algod_async.py
+#
+# FastAPI event loop'unu bloklamayan, httpx tabanlı minimal algod istemcisi.
+# Tek bir AsyncClient (keep-alive havuzu) süreç boyunca paylaşılır; böylece
+# her istek için yeni TCP/TLS bağlantısı açılmaz ve threadpool işgal edilmez.
+
+import base64
+import os
+from typing import Any, Dict, Optional
+
+import httpx
+import msgpack
+from algosdk import encoding, transaction
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client import models
+
+ALGOD_MAX_CONNECTIONS = int(os.getenv("ALGOD_MAX_CONNECTIONS", 200))
+ALGOD_MAX_KEEPALIVE = int(os.getenv("ALGOD_MAX_KEEPALIVE", 50))
+ALGOD_KEEPALIVE_EXPIRY = float(os.getenv("ALGOD_KEEPALIVE_EXPIRY", 30))
+ALGOD_TIMEOUT = float(os.getenv("ALGOD_TIMEOUT", 10))
+ALGOD_CONNECT_TIMEOUT = float(os.getenv("ALGOD_CONNECT_TIMEOUT", 5))
+# status_after_block algod tarafında ~1 dk long-poll yapar
+ALGOD_LONGPOLL_TIMEOUT = float(os.getenv("ALGOD_LONGPOLL_TIMEOUT", 70))
+
+
+class AsyncAlgodClient:
+    """
+    algosdk.v2client.algod.AlgodClient'ın kullandığımız kısmının async karşılığı.
+    Hatalar algosdk ile aynı şekilde AlgodHTTPError olarak yükseltilir.
+    """
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: Optional[Dict[str, str]] = None,
+        max_connections: int = ALGOD_MAX_CONNECTIONS,
+        max_keepalive: int = ALGOD_MAX_KEEPALIVE,
+        keepalive_expiry: float = ALGOD_KEEPALIVE_EXPIRY,
+        timeout: float = ALGOD_TIMEOUT,
+        connect_timeout: float = ALGOD_CONNECT_TIMEOUT,
+    ):
+        base_headers = {"X-Algo-API-Token": algod_token} if algod_token else {}
+        base_headers.update(headers or {})
+        self._http = httpx.AsyncClient(
+            base_url=algod_address.rstrip("/") + "/v2",
+            headers=base_headers,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+        )
+
+    async def aclose(self):
+        await self._http.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        kwargs: Dict[str, Any] = {"params": params, "content": content, "headers": headers}
+        if timeout is not None:
+            kwargs["timeout"] = httpx.Timeout(timeout, connect=ALGOD_CONNECT_TIMEOUT)
+        try:
+            resp = await self._http.request(method, path, **kwargs)
+        except httpx.HTTPError as e:
+            raise AlgodHTTPError(f"algod isteği başarısız: {e!r}") from e
+
+        if resp.status_code >= 400:
+            try:
+                msg = resp.json().get("message", resp.text)
+            except ValueError:
+                msg = resp.text
+            raise AlgodHTTPError(msg, resp.status_code)
+        return resp.content if raw else resp.json()
+
+    # --- node durumu ---
+    async def status(self) -> Dict[str, Any]:
+        return await self._request("GET", "/status")
+
+    async def status_after_block(self, block_num: int) -> Dict[str, Any]:
+        return await self._request(
+            "GET", f"/status/wait-for-block-after/{block_num}",
+            timeout=ALGOD_LONGPOLL_TIMEOUT,
+        )
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        res = await self._request("GET", "/transactions/params")
+        return transaction.SuggestedParams(
+            res["fee"],
+            res["last-round"],
+            res["last-round"] + 1000,
+            res["genesis-hash"],
+            res["genesis-id"],
+            False,
+            res["consensus-version"],
+            res["min-fee"],
+        )
+
+    # --- işlem gönderme ---
+    async def send_raw_transaction(self, txn_bytes: bytes) -> str:
+        """
+        İmzalı işlem(ler)in ham msgpack baytlarını yayınlar.
+        Grup için imzalı işlemlerin baytları sırasıyla birleştirilip tek seferde gönderilir.
+        """
+        res = await self._request(
+            "POST", "/transactions",
+            content=txn_bytes,
+            headers={"Content-Type": "application/x-binary"},
+        )
+        return res["txId"]
+
+    async def pending_transaction_info(self, txid: str) -> Dict[str, Any]:
+        """
+        Havuzdaki ya da yakın zamanda onaylanmış işlem: "confirmed-round", "pool-error", "logs"...
+        İşlem bilinmiyorsa 404 AlgodHTTPError.
+        """
+        return await self._request("GET", f"/transactions/pending/{txid}")
+
+    async def block_txids(self, block_num: int) -> list:
+        res = await self._request("GET", f"/blocks/{block_num}/txids")
+        return res.get("blockTxids") or []
+
+    async def block_info(self, block_num: int) -> Dict[str, Any]:
+        """Blok msgpack olarak çekilip çözülür (bayt alanlar bytes kalır)."""
+        raw = await self._request(
+            "GET", f"/blocks/{block_num}", params={"format": "msgpack"}, raw=True
+        )
+        return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+
+    async def application_box_by_name(self, app_id: int, box_name: bytes) -> Dict[str, Any]:
+        """{"name": b64, "round": int, "value": b64}; box yoksa 404 AlgodHTTPError."""
+        encoded = "b64:" + base64.b64encode(box_name).decode()
+        return await self._request(
+            "GET", f"/applications/{app_id}/box", params={"name": encoded}
+        )
+
+    async def simulate_transactions(self, request: models.SimulateRequest) -> Dict[str, Any]:
+        """POST /transactions/simulate (msgpack gövde, JSON yanıt)."""
+        body = base64.b64decode(encoding.msgpack_encode(request))
+        return await self._request(
+            "POST", "/transactions/simulate",
+            content=body,
+            headers={"Content-Type": "application/msgpack"},
+        )
@@ -0,0 +1,138 @@
+# box_reader.py
+#
+# Sözleşme durumunu işlem göndermeden, doğrudan box'lardan okur
+# (algod GET /v2/applications/{app_id}/box). Çözülmüş kayıtlar (anahtar, round)
+# ile önbelleklenir; aynı round içindeki tekrar eden poll'lar algod'a gitmez.
+
+import asyncio
+import base64
+import os
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+from algosdk import encoding
+from algosdk.error import AlgodHTTPError
+
+from abi_templates import TemplateEngine, decode_sign_count, split_addresses, split_encoded_hashes
+from algod_async import AsyncAlgodClient
+
+BOX_CACHE_MAX = int(os.getenv("BOX_CACHE_MAX", 10_000))
+
+
+class RoundCache:
+    """
+    (anahtar, round) -> değer LRU önbelleği.
+    Aynı anahtar için eşzamanlı okumalar tek bir algod isteğinde birleşir.
+    """
+
+    def __init__(self, max_entries: int = BOX_CACHE_MAX):
+        self._max = max_entries
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def get_or_load(self, key: Hashable, loader) -> Any:
+        if key in self._data:
+            self._data.move_to_end(key)
+            return self._data[key]
+        fut = self._inflight.get(key)
+        if fut is not None:
+            return await asyncio.shield(fut)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            value = await loader()
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()  # bekleyen yoksa "never retrieved" uyarısını engelle
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        fut.set_result(value)
+        self._data[key] = value
+        if len(self._data) > self._max:
+            self._data.popitem(last=False)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class BoxStateReader:
+    def __init__(self, client: AsyncAlgodClient, templates: TemplateEngine, cache: Optional[RoundCache] = None):
+        self._client = client
+        self._templates = templates
+        self._cache = cache or RoundCache()
+
+    async def _box(self, map_name: str, key: Any) -> Optional[bytes]:
+        name = self._templates.box_name(map_name, key)
+        try:
+            res = await self._client.application_box_by_name(self._templates.app_id, name)
+        except AlgodHTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+        return base64.b64decode(res["value"])
+
+    async def _load_document(self, file_hash: bytes) -> Dict[str, Any]:
+        asa, adm, sgn, sgh, dele, cnt = await asyncio.gather(
+            self._box("asset_by_hash", file_hash),
+            self._box("admin_by_hash", file_hash),
+            self._box("signers_blob_by_hash", file_hash),
+            self._box("signed_blob_by_hash", file_hash),
+            self._box("canceled_by_hash", file_hash),
+            self._box("count_by_hash", file_hash),
+        )
+        signers = split_addresses(sgn or b"")
+        signed = split_addresses(sgh or b"")
+        signed_set = set(signed)
+        canceled = bool(dele and int.from_bytes(dele, "big") == 1)
+        total, signed_count = decode_sign_count(cnt) if cnt else (0, 0)
+        return {
+            "file_hash_hex": file_hash.hex(),
+            "exists": asa is not None,
+            "asset_id": int.from_bytes(asa, "big") if asa else 0,
+            "admin": encoding.encode_address(adm) if adm else None,
+            "canceled": canceled,
+            "signers": signers,
+            "signed": signed,
+            "pending": [a for a in signers if a not in signed_set],
+            # cnt_ sayaçları: tekil imzacı / imzalayan (sözleşmedeki total_signers / signed_count)
+            "total_signers": total,
+            "signed_count": signed_count,
+            # sözleşmedeki iscomplete ile aynı kural
+            "complete": not canceled and total > 0 and signed_count == total,
+        }
+
+    async def document(self, file_hash: bytes, last_round: int) -> Dict[str, Any]:
+        return await self._cache.get_or_load(
+            ("doc", file_hash, last_round),
+            lambda: self._load_document(file_hash),
+        )
+
+    async def _load_anchored(self, file_hash: bytes) -> bool:
+        if await self._box("asset_by_hash", file_hash) is None:
+            return False
+        dele = await self._box("canceled_by_hash", file_hash)
+        return not (dele and int.from_bytes(dele, "big") == 1)
+
+    async def anchored(self, file_hash: bytes, last_round: int) -> bool:
+        """Belge zincirde var ve iptal edilmemiş mi; yalnızca asa_ / del_ okunur (upload GC)."""
+        return await self._cache.get_or_load(
+            ("anc", file_hash, last_round),
+            lambda: self._load_anchored(file_hash),
+        )
+
+    async def signers(self, file_hash: bytes) -> List[str]:
+        """sgn_ listesi, önbelleksiz (cancel / reject build'i güncel listeyle mbr_ referansı ekler)."""
+        return split_addresses(await self._box("signers_blob_by_hash", file_hash) or b"")
+
+    async def _load_user_hashes(self, address: str) -> list:
+        blob = await self._box("user_hashes", address)
+        return [h.hex() for h in split_encoded_hashes(blob or b"")]
+
+    async def user_hashes(self, address: str, last_round: int) -> list:
+        return await self._cache.get_or_load(
+            ("uhs", address, last_round),
+            lambda: self._load_user_hashes(address),
+        )
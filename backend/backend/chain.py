@@ -0,0 +1,42 @@
+# chain.py
+#
+# algod bağlantısı ve Blocksign uygulama ayarları. API (main.py) ile bağımsız çalışan
+# süreçler (indexer.py, upload_gc.py) istemcileri buradan kurar; böylece worker'lar
+# FastAPI uygulamasını (yükleme dizinleri, depo, hook'lar) import etmek zorunda kalmaz.
+
+import os
+
+from abi_templates import TemplateEngine, arc56_path
+from algod_async import AsyncAlgodClient
+
+# --- ALGOD CLIENT ---
+ALGOD_URL = os.getenv("ALGOD_URL", "https://testnet-api.algonode.cloud")
+ALGOD_TOKEN = os.getenv("ALGOD_TOKEN", "")  # PureStake kullanırsan anahtarını ekle ve header'ı değiştir
+ALGOD_TOKEN_HEADER = os.getenv("ALGOD_TOKEN_HEADER", "X-Algo-API-Token")  # PureStake için genelde "X-API-Key"
+
+
+def app_id_from_env() -> int:
+    """
+    BLOCKSIGN_APP_ID zorunludur: mbr_/sbm_/cnt_ düzenli sözleşmenin deploy edildiği app.
+    Eski uygulamada bu kutular yok; varsayılan verilirse builder'lar zincirde olmayan
+    box'lara referans verir (README'deki geçiş notuna bakın).
+    """
+    raw = os.getenv("BLOCKSIGN_APP_ID", "").strip()
+    if not raw:
+        raise RuntimeError("BLOCKSIGN_APP_ID ayarlanmalı (yeni box düzeniyle deploy edilen app id)")
+    try:
+        return int(raw)
+    except ValueError:
+        raise RuntimeError(f"BLOCKSIGN_APP_ID geçersiz: {raw!r}") from None
+
+
+def make_algod_client() -> AsyncAlgodClient:
+    # Havuz limitleri/timeout'lar ALGOD_MAX_CONNECTIONS, ALGOD_MAX_KEEPALIVE,
+    # ALGOD_KEEPALIVE_EXPIRY, ALGOD_TIMEOUT, ALGOD_CONNECT_TIMEOUT env'lerinden okunur.
+    headers = {ALGOD_TOKEN_HEADER: ALGOD_TOKEN} if ALGOD_TOKEN else {}
+    return AsyncAlgodClient(ALGOD_TOKEN, ALGOD_URL, headers)
+
+
+def make_templates() -> TemplateEngine:
+    # Selector / encoder / box düzeni bir kez hesaplanır; spec yolu BLOCKSIGN_ARC56_PATH
+    return TemplateEngine.from_file(arc56_path(), app_id_from_env())
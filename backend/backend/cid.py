@@ -0,0 +1,112 @@
+# cid.py
+#
+# Yükleme akışında, SHA-256 ile aynı geçişte IPFS CIDv1 (sha2-256) hesabı.
+# Harici bağımlılık yok; multibase base32 + multicodec + dag-pb/UnixFS protobuf elle kodlanır.
+#
+# - "raw":    tüm dosya tek raw blok -> digest = dosyanın SHA-256'sı
+# - "unixfs": kubo `ipfs add --cid-version=1 --raw-leaves --chunker=size-262144`
+#             ile aynı düzen (raw yapraklar, 174 bağlantılı dengeli dag-pb ağacı)
+#
+# Her iki durumda da dönen 32 baytlık digest /blocksign/*/build'e file_hash_hex olarak verilebilir.
+
+import base64
+import hashlib
+from typing import List, Tuple
+
+CODEC_RAW = 0x55
+CODEC_DAG_PB = 0x70
+MH_SHA2_256 = 0x12
+UNIXFS_CHUNK_SIZE = 256 * 1024
+UNIXFS_MAX_LINKS = 174
+CID_MODES = ("raw", "unixfs")
+
+
+def _varint(n: int) -> bytes:
+    out = bytearray()
+    while True:
+        b = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(b | 0x80)
+        else:
+            out.append(b)
+            return bytes(out)
+
+
+def _pb_bytes(field: int, data: bytes) -> bytes:
+    return _varint(field << 3 | 2) + _varint(len(data)) + data
+
+
+def _pb_uint(field: int, n: int) -> bytes:
+    return _varint(field << 3) + _varint(n)
+
+
+def cid_bytes(codec: int, digest: bytes) -> bytes:
+    """Binary CIDv1: <version><codec><multihash>."""
+    return _varint(1) + _varint(codec) + _varint(MH_SHA2_256) + _varint(len(digest)) + digest
+
+
+def cid_string(codec: int, digest: bytes) -> str:
+    """Multibase base32 (küçük harf, padding yok, 'b' önekli): bafy... / bafk..."""
+    return "b" + base64.b32encode(cid_bytes(codec, digest)).decode().lower().rstrip("=")
+
+
+# (cid bytes, tsize, dosya baytı)
+_Link = Tuple[bytes, int, int]
+
+
+def _dag_pb_file_node(children: List[_Link]) -> Tuple[bytes, int, int]:
+    """Çocuk bağlantılarından UnixFS File düğümü; (kodlanmış düğüm, tsize, dosya baytı)."""
+    filesize = sum(c[2] for c in children)
+    unixfs = _pb_uint(1, 2) + _pb_uint(3, filesize)  # Type=File
+    for c in children:
+        unixfs += _pb_uint(4, c[2])  # blocksizes
+    # dag-pb kanonik sıra: önce Links (2), sonra Data (1)
+    node = b"".join(
+        _pb_bytes(2, _pb_bytes(1, cid) + _pb_bytes(2, b"") + _pb_uint(3, tsize))
+        for cid, tsize, _ in children
+    ) + _pb_bytes(1, unixfs)
+    return node, len(node) + sum(c[1] for c in children), filesize
+
+
+class UnixFSCidHasher:
+    """
+    hashlib benzeri: update(chunk) ile beslenir, cid() sonucu döner.
+    Bellekte yalnızca yarım 256 KiB'lık parça ve yaprak CID'leri tutulur.
+    """
+
+    def __init__(self, chunk_size: int = UNIXFS_CHUNK_SIZE, max_links: int = UNIXFS_MAX_LINKS):
+        self._chunk_size = chunk_size
+        self._max_links = max_links
+        self._buf = bytearray()
+        self._leaves: List[_Link] = []
+
+    def _leaf(self, data: bytes):
+        cid = cid_bytes(CODEC_RAW, hashlib.sha256(data).digest())
+        self._leaves.append((cid, len(data), len(data)))
+
+    def update(self, data: bytes):
+        self._buf += data
+        while len(self._buf) >= self._chunk_size:
+            self._leaf(bytes(self._buf[: self._chunk_size]))
+            del self._buf[: self._chunk_size]
+
+    def cid(self) -> Tuple[str, bytes]:
+        """(cid string, 32 baytlık kök digest)"""
+        if self._buf or not self._leaves:
+            self._leaf(bytes(self._buf))
+            self._buf.clear()
+        level = self._leaves
+        if len(level) == 1:
+            # tek parça: kök raw yaprağın kendisi
+            digest = level[0][0][-32:]
+            return cid_string(CODEC_RAW, digest), digest
+        while True:
+            parents: List[_Link] = []
+            for i in range(0, len(level), self._max_links):
+                node, tsize, filesize = _dag_pb_file_node(level[i:i + self._max_links])
+                parents.append((cid_bytes(CODEC_DAG_PB, hashlib.sha256(node).digest()), tsize, filesize))
+            if len(parents) == 1:
+                digest = parents[0][0][-32:]
+                return cid_string(CODEC_DAG_PB, digest), digest
+            level = parents
@@ -0,0 +1,165 @@
+# confirmations.py
+#
+# Tüm bekleyen txid'ler için tek bir blok takip döngüsü.
+# İstek başına ayrı polling yerine: round başına bir status_after_block (long-poll)
+# + bir /blocks/{round}/txids; yalnızca eşleşen txid'ler için pending_transaction_info.
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from algosdk.error import AlgodHTTPError
+
+from algod_async import AsyncAlgodClient
+
+CONFIRM_MAX_ROUNDS = int(os.getenv("CONFIRM_MAX_ROUNDS", 10))
+
+logger = logging.getLogger(__name__)
+
+
+def _is_transient(e: AlgodHTTPError) -> bool:
+    """Ağ hatası (code yok), 404 (işlem henüz bu node'da görünmüyor), 429 ve 5xx tekrar denenir."""
+    code = getattr(e, "code", None)
+    return code is None or code in (404, 429) or code >= 500
+
+
+class ConfirmationTimeout(Exception):
+    pass
+
+
+class TransactionRejected(Exception):
+    pass
+
+
+@dataclass
+class _Waiter:
+    future: asyncio.Future
+    start_round: int
+    deadline_round: int
+
+
+class ConfirmationWaiter:
+    """
+    wait(txid) çağıranlar aynı takipçi task'ını paylaşır; aynı txid için
+    birden fazla bekleyen aynı future'ı alır.
+    """
+
+    def __init__(self, client: AsyncAlgodClient, max_rounds: int = CONFIRM_MAX_ROUNDS):
+        self._client = client
+        self._max_rounds = max_rounds
+        self._pending: Dict[str, _Waiter] = {}
+        self._wakeup = asyncio.Event()
+        self._round = 0  # takipçinin işlediği son round (0: boşta)
+        self._task: Optional[asyncio.Task] = None
+        self._side_tasks: set = set()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def wait(self, txid: str, start_round: int, max_rounds: Optional[int] = None) -> Dict[str, Any]:
+        """
+        txid onaylanınca pending_transaction_info sonucunu döner.
+        start_round: gönderimden önceki round (bu round'dan sonrası taranır).
+        """
+        waiter = self._pending.get(txid)
+        if waiter is None:
+            fut = asyncio.get_running_loop().create_future()
+            waiter = _Waiter(fut, start_round, start_round + (max_rounds or self._max_rounds))
+            self._pending[txid] = waiter
+            if self._round and start_round < self._round:
+                # takipçi bu round'ları çoktan geçti; tek seferlik doğrudan kontrol
+                task = asyncio.create_task(self._resolve(txid, final=False))
+                self._side_tasks.add(task)
+                task.add_done_callback(self._side_tasks.discard)
+            self._wakeup.set()
+        return await asyncio.shield(waiter.future)
+
+    def _finish(self, txid: str, result: Any = None, error: Optional[Exception] = None):
+        waiter = self._pending.pop(txid, None)
+        if waiter is None or waiter.future.done():
+            return
+        if error is not None:
+            waiter.future.set_exception(error)
+        else:
+            waiter.future.set_result(result)
+
+    async def _resolve(self, txid: str, final: bool):
+        try:
+            info = await self._client.pending_transaction_info(txid)
+        except AlgodHTTPError as e:
+            # geçici hatalar sonraki round'da yeniden denenir; diğerleri hemen döner
+            if not _is_transient(e):
+                self._finish(txid, error=e)
+            elif final:
+                # deadline'da hâlâ 404 (node hiç görmedi / havuzdan düştü) ya da erişim hatası: zaman aşımı
+                self._finish(txid, error=self._timeout(txid, e))
+            return
+        except Exception as e:
+            # programlama hatası: deadline'ı beklemeden bekleyene ilet
+            logger.exception("pending_transaction_info %s başarısız", txid)
+            self._finish(txid, error=e)
+            return
+        if info.get("confirmed-round"):
+            self._finish(txid, info)
+        elif info.get("pool-error"):
+            self._finish(txid, error=TransactionRejected(info["pool-error"]))
+        elif final:
+            self._finish(txid, error=self._timeout(txid))
+
+    def _timeout(self, txid: str, cause: Optional[Exception] = None) -> ConfirmationTimeout:
+        waiter = self._pending.get(txid)
+        deadline = waiter.deadline_round if waiter else "?"
+        msg = f"{txid} round {deadline}'e kadar onaylanmadı"
+        if cause is not None:
+            msg += f" ({cause})"
+        return ConfirmationTimeout(msg)
+
+    async def _scan(self, rnd: int):
+        txids = await self._client.block_txids(rnd)
+        hits = [t for t in txids if t in self._pending]
+        if hits:
+            await asyncio.gather(*(self._resolve(t, final=False) for t in hits))
+
+    async def _run(self):
+        while True:
+            try:
+                if not self._pending:
+                    self._round = 0
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                if not self._round:
+                    self._round = min(w.start_round for w in self._pending.values())
+
+                status = await self._client.status_after_block(self._round)
+                last = status["last-round"]
+                for rnd in range(self._round + 1, last + 1):
+                    await self._scan(rnd)
+                self._round = last
+
+                expired = [t for t, w in self._pending.items() if w.deadline_round <= last]
+                if expired:
+                    await asyncio.gather(*(self._resolve(t, final=True) for t in expired))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("confirmation follower hatası")
+                await asyncio.sleep(1)
+
+    def start(self):
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        for txid in list(self._pending):
+            self._finish(txid, error=ConfirmationTimeout("sunucu kapanıyor"))
@@ -0,0 +1,258 @@
+# indexer.py
+#
+# Blocksign app çağrılarını algod bloklarından okuyup MySQL'e yazan takipçi.
+# - app_id'ye giden (inner dahil) AppCall'lar M_* selector'larıyla ayıklanır
+# - create_contract / sign / reject / cancel -> documents, document_signers, signature_events
+# - Son işlenen round sync_checkpoints tablosunda, verilerle aynı DB transaction'ında tutulur
+# - Geride kalınca INDEXER_BATCH'lik bloklar halinde paralel çekip sırayla işler
+#
+# Bağımsız çalıştırma: python indexer.py  (ya da API içinde INDEXER_ENABLED=1)
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from algosdk import encoding
+from sqlalchemy.orm import Session
+
+from abi_templates import TemplateEngine, decode_uint64_return
+from algod_async import AsyncAlgodClient
+from database import Base, SessionLocal
+from models import Document, DocumentSigner, SignatureEvent, SyncCheckpoint
+
+INDEXER_BATCH = int(os.getenv("INDEXER_BATCH", 20))
+# checkpoint yoksa başlanacak round (0: node'un o anki son round'u)
+INDEXER_START_ROUND = int(os.getenv("INDEXER_START_ROUND", 0))
+CHECKPOINT_NAME = "indexer"
+INDEXED_METHODS = ("create_contract", "sign", "reject", "cancel")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AppCallEvent:
+    round: int
+    txid: Optional[str]
+    method: str
+    sender: str
+    args: Dict[str, Any]
+    return_value: Optional[int]
+
+
+class BlockIndexer:
+    def __init__(
+        self,
+        client: AsyncAlgodClient,
+        templates: TemplateEngine,
+        session_factory=SessionLocal,
+        batch: int = INDEXER_BATCH,
+        start_round: int = INDEXER_START_ROUND,
+    ):
+        self._client = client
+        self._templates = templates
+        self._app_id = templates.app_id
+        self._session_factory = session_factory
+        self._batch = batch
+        self._start_round = start_round
+        # selector -> metod adı
+        self._selectors = {templates[m].selector: m for m in INDEXED_METHODS}
+        self.last_round: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # --- blok çözümleme ---
+    def _decode_call(self, rnd: int, txid: Optional[str], stxn: Dict[str, Any]) -> Optional[AppCallEvent]:
+        txn = stxn.get("txn", {})
+        if txn.get("type") != "appl" or txn.get("apid") != self._app_id:
+            return None
+        app_args = txn.get("apaa") or []
+        if not app_args:
+            return None
+        method = self._selectors.get(app_args[0])
+        if method is None:
+            return None
+
+        tpl = self._templates[method]
+        args = {}
+        for name, enc, raw in zip(tpl.arg_names, tpl.arg_encoders, app_args[1:]):
+            value = enc.decode(raw)
+            args[name] = bytes(value) if name == "file_hash" else value
+
+        logs = (stxn.get("dt") or {}).get("lg") or []
+        return_value = None
+        if logs:
+            try:
+                return_value = decode_uint64_return(logs[-1])
+            except ValueError:
+                pass
+
+        return AppCallEvent(
+            round=rnd,
+            txid=txid,
+            method=method,
+            sender=encoding.encode_address(txn["snd"]),
+            args=args,
+            return_value=return_value,
+        )
+
+    def _walk(self, rnd: int, txid: Optional[str], stxn: Dict[str, Any], out: List[AppCallEvent]):
+        event = self._decode_call(rnd, txid, stxn)
+        if event is not None:
+            out.append(event)
+        # başka bir app'in inner call'u ile çağrılmış olabilir; txid üst işleminki
+        for inner in (stxn.get("dt") or {}).get("itx") or []:
+            self._walk(rnd, txid, inner, out)
+
+    def parse_block(self, rnd: int, block: Dict[str, Any], txids: List[str]) -> List[AppCallEvent]:
+        events: List[AppCallEvent] = []
+        payset = block.get("block", {}).get("txns") or []
+        for i, stxn in enumerate(payset):
+            self._walk(rnd, txids[i] if i < len(txids) else None, stxn, events)
+        return events
+
+    # --- DB ---
+    def _ensure_schema(self):
+        # enjekte edilen session factory'nin engine'i (testler / farklı DSN)
+        with self._session_factory() as db:
+            Base.metadata.create_all(bind=db.get_bind())
+
+    def _load_checkpoint(self) -> Optional[int]:
+        with self._session_factory() as db:
+            cp = db.get(SyncCheckpoint, CHECKPOINT_NAME)
+            return cp.last_round if cp else None
+
+    def _apply(self, db: Session, ev: AppCallEvent):
+        fh = ev.args["file_hash"].hex()
+        doc = db.query(Document).filter_by(file_hash=fh).one_or_none()
+
+        if ev.method == "create_contract":
+            if doc is not None:
+                return  # sözleşmede idempotent yol: mevcut asset_id döner
+            doc = Document(
+                file_hash=fh,
+                creator=ev.sender,
+                asset_id=ev.return_value,
+                status="active",
+                created_round=ev.round,
+                created_txid=ev.txid,
+                updated_round=ev.round,
+            )
+            db.add(doc)
+            db.flush()
+            # tekrar eden adres: sözleşmedeki mbr_ gibi ilk sırası geçerli, tek satır
+            seen = set()
+            for pos, signer in enumerate(ev.args["signers"]):
+                if signer in seen:
+                    continue
+                seen.add(signer)
+                db.add(DocumentSigner(document_id=doc.id, signer=signer, position=pos))
+            return
+
+        if doc is None:
+            # başlangıç round'undan önce oluşturulmuş belge; atla
+            logger.warning("indexer: %s için bilinmeyen belge %s (round %s)", ev.method, fh, ev.round)
+            return
+
+        db.add(SignatureEvent(
+            document_id=doc.id, kind=ev.method, actor=ev.sender, round=ev.round, txid=ev.txid,
+        ))
+        doc.updated_round = ev.round
+        if ev.method == "sign":
+            (
+                db.query(DocumentSigner)
+                .filter_by(document_id=doc.id, signer=ev.sender, signed_round=None)
+                .update({DocumentSigner.signed_round: ev.round}, synchronize_session=False)
+            )
+        elif ev.method == "reject":
+            doc.status = "rejected"
+        elif ev.method == "cancel":
+            doc.status = "canceled"
+
+    def _commit(self, events: List[AppCallEvent], last_round: int):
+        with self._session_factory() as db:
+            with db.begin():
+                for ev in events:
+                    self._apply(db, ev)
+                    db.flush()  # aynı batch'teki sonraki olaylar görebilsin
+                cp = db.get(SyncCheckpoint, CHECKPOINT_NAME)
+                if cp is None:
+                    db.add(SyncCheckpoint(name=CHECKPOINT_NAME, last_round=last_round))
+                else:
+                    cp.last_round = last_round
+
+    # --- takip döngüsü ---
+    async def _fetch(self, rnd: int):
+        return await asyncio.gather(self._client.block_info(rnd), self._client.block_txids(rnd))
+
+    async def _initial_round(self) -> int:
+        await asyncio.to_thread(self._ensure_schema)
+        checkpoint = await asyncio.to_thread(self._load_checkpoint)
+        if checkpoint is not None:
+            return checkpoint + 1
+        if self._start_round:
+            return self._start_round
+        return (await self._client.status())["last-round"]
+
+    async def _run(self):
+        next_round = None
+        while True:
+            try:
+                if next_round is None:
+                    next_round = await self._initial_round()
+
+                node_last = (await self._client.status())["last-round"]
+                if next_round > node_last:
+                    await self._client.status_after_block(node_last)
+                    continue
+
+                end = min(node_last, next_round + self._batch - 1)
+                rounds = list(range(next_round, end + 1))
+                fetched = await asyncio.gather(*(self._fetch(r) for r in rounds))
+                events = [
+                    ev
+                    for rnd, (block, txids) in zip(rounds, fetched)
+                    for ev in self.parse_block(rnd, block, txids)
+                ]
+                await asyncio.to_thread(self._commit, events, end)
+                self.last_round = end
+                next_round = end + 1
+                if events:
+                    logger.info("indexer: %s-%s arası %s çağrı işlendi", rounds[0], end, len(events))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("indexer hatası; 5 sn sonra tekrar denenecek")
+                await asyncio.sleep(5)
+
+    def start(self):
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def run_forever(self):
+        await self._run()
+
+
+async def _main():
+    from chain import make_algod_client, make_templates
+
+    algod_client = make_algod_client()
+    templates = make_templates()
+    try:
+        await BlockIndexer(algod_client, templates).run_forever()
+    finally:
+        await algod_client.aclose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-8s %(message)s")
+    asyncio.run(_main())
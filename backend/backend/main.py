@@ -2,7 +2,8 @@ from fastapi import FastAPI, HTTPException, Depends, Query, UploadFile, File, Fo
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
-from database import get_db
+from database import get_async_db
+from sqlalchemy.ext.asyncio import AsyncSession
 import requests
 import base64
 import hmac
@@ -13,13 +14,21 @@ import uuid
 from pydantic import BaseModel
 from starlette.requests import Request
 from starlette.responses import Response
-from fastapi.staticfiles import StaticFiles
 # CORS ve ayarlar için gerekli import ###################
 from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
 import os, uuid, hashlib, shutil
-from typing import List, Optional, Tuple
-from fastapi.responses import JSONResponse
+import asyncio
+import mimetypes
+import re
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
+from upload_writer import PipelinedWriter, hash_fd, spooled_fileno
+from sniff import PdfSniffer, SniffError
+from storage import storage_from_env
+from cid import CID_MODES, CODEC_RAW, UnixFSCidHasher, cid_string
 
 app = FastAPI()
 
@@ -41,7 +50,12 @@ UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 ALLOWED_CONTENT_TYPES = {"application/pdf"}
 ALLOWED_EXTS = {".pdf"}
 MAX_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", 20 * 1024 * 1024))
-app.mount("/files", StaticFiles(directory=str(UPLOAD_DIR), html=False), name="files")
+# "cas": içerik adresli depolama (ab/cd/<sha256>.pdf, aynı içerik bir kez yazılır)
+# "uuid": eski davranış (uploads/<uuid4>.pdf)
+UPLOAD_STORE = os.getenv("UPLOAD_STORE", "cas").lower()
+INCOMING_DIR = UPLOAD_DIR / ".incoming"  # yarım yüklemeler ve yükleme oturumları (her zaman yerel)
+# STORAGE_BACKEND=local (UPLOAD_DIR) | s3 (S3/MinIO); ayarlar storage.py'de
+storage = storage_from_env(UPLOAD_DIR)
 
 def _validate_file_meta(file: UploadFile):
     # Basit uzantı ve içerik türü kontrolü (tam güven için python-magic kullanabilirsin)
@@ -52,46 +66,181 @@ def _validate_file_meta(file: UploadFile):
         raise HTTPException(415, detail=f"İzin verilmeyen içerik türü: {file.content_type}")
 
 
+UPLOAD_READ_CHUNK = 1024 * 1024  # 1 MB
+# PDF içerik kontrolü: başlık her zaman, sonek (%%EOF/startxref) UPLOAD_SNIFF_TRAILER=1 iken
+UPLOAD_SNIFF_TRAILER = os.getenv("UPLOAD_SNIFF_TRAILER", "1") == "1"
+# Varsayılan CID hesabı: "" (kapalı), "raw" ya da "unixfs"; istekte ?cid= ile değiştirilebilir
+UPLOAD_CID_MODE = os.getenv("UPLOAD_CID_MODE", "").lower()
+
+
+@dataclass
+class StoredUpload:
+    key: str  # depodaki göreli yol (ab/cd/<sha256>.pdf ya da <uuid>.pdf)
+    size: int
+    sha256: Optional[str]
+    deduplicated: bool = False
+    cid: Optional[str] = None
+    cid_digest: Optional[bytes] = None  # 32 bayt; create/build'e file_hash_hex olarak verilebilir
+
+
+def _cid_mode(requested: Optional[str]) -> Optional[str]:
+    mode = (requested if requested is not None else UPLOAD_CID_MODE).lower()
+    if not mode or mode == "none":
+        return None
+    if mode not in CID_MODES:
+        raise HTTPException(400, detail=f"cid {', '.join(CID_MODES)} olmalı")
+    return mode
+
+
+async def _finish_cid(stored: StoredUpload, cid_mode: Optional[str], hasher, cid_hasher):
+    # raw CID'nin digest'i dosyanın SHA-256'sı; ayrı hasher gerekmez
+    if cid_mode == "raw":
+        stored.cid_digest = hasher.digest()
+        stored.cid = cid_string(CODEC_RAW, stored.cid_digest)
+    elif cid_hasher is not None:
+        stored.cid, stored.cid_digest = await asyncio.to_thread(cid_hasher.cid)
+
+
+class _ByteBudget:
+    """Bir istekteki tüm dosyaların ortak bayt limiti (çoklu yükleme)."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+
+    def take(self, n: int):
+        self.used += n
+        if self.used > self.limit:
+            raise HTTPException(413, detail=f"Toplam yükleme {self.limit} bayt limitini aşıyor")
+
+
+async def _iter_upload(
+    file: UploadFile,
+    chunk_size: int = UPLOAD_READ_CHUNK,
+    budget: Optional[_ByteBudget] = None,
+) -> AsyncIterator[bytes]:
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            break
+        if budget is not None:
+            budget.take(len(chunk))
+        yield chunk
+
+
+async def _write_stream(
+    chunks: AsyncIterator[bytes],
+    sink,
+    max_bytes: int,
+    sniffer: Optional[PdfSniffer] = None,
+) -> int:
+    """
+    Parçaları depo sink'ine yazar (yerelde PipelinedWriter, S3'te multipart); hash'leme sink'te,
+    event loop dışında yapılır. max_bytes aşılırsa 413, sniffer içeriği reddederse 415;
+    her iki durumda yazılan kısım atılır. Sniffer parçayı yazılmadan önce görür: geçersiz
+    başlık ilk parçada reddedilir.
+    """
+    try:
+        async for chunk in chunks:
+            if sink.size + len(chunk) > max_bytes:
+                raise HTTPException(413, detail=f"Dosya {max_bytes} bayt limitini aşıyor")
+            if sniffer is not None:
+                sniffer.feed(chunk)
+            await sink.write(chunk)
+        if sniffer is not None:
+            sniffer.finish()
+        await sink.finish()
+    except BaseException as e:
+        await sink.abort()
+        if isinstance(e, SniffError):
+            raise HTTPException(415, detail=f"Geçersiz PDF içeriği: {e}")
+        raise
+    return sink.size
+
+
+async def _commit_sink(sink, key: str) -> bool:
+    try:
+        return await sink.commit(key)
+    except BaseException:
+        await sink.abort()
+        raise
+
+
+def _pdf_sniffer() -> PdfSniffer:
+    return PdfSniffer(check_trailer=UPLOAD_SNIFF_TRAILER)
+
+
+async def _ingest_spooled(
+    fd: int,
+    max_bytes: int,
+    hashers: Sequence,
+    budget: Optional[_ByteBudget] = None,
+) -> int:
+    """
+    Diske taşmış multipart parçası için hızlı yol: boyut fstat ile önceden bilinir,
+    hash tek tamponla (readinto) hesaplanır. Kopyayı çağıran yapar (hash'e göre gerekmeyebilir).
+    """
+    size = (await asyncio.to_thread(os.fstat, fd)).st_size
+    if size > max_bytes:
+        raise HTTPException(413, detail=f"Dosya {max_bytes} bayt limitini aşıyor")
+    if budget is not None:
+        budget.take(size)
+    try:
+        await asyncio.to_thread(hash_fd, fd, hashers, _pdf_sniffer())
+    except SniffError as e:
+        raise HTTPException(415, detail=f"Geçersiz PDF içeriği: {e}")
+    return size
+
+
+def _storage_key(sha256: Optional[str], ext: str, fixed: Optional[str] = None) -> str:
+    """cas: ab/cd/<sha256><ext> (dizin başına dosya sayısı sınırlı); uuid: sabit ad."""
+    if fixed is not None:
+        return fixed
+    return f"{sha256[:2]}/{sha256[2:4]}/{sha256}{ext}"
+
+
 async def _save_streaming(
     file: UploadFile,
-    dest_dir: Path,
     max_bytes: int = MAX_BYTES,
-    compute_sha256: bool = True
-) -> Tuple[Path, int, Optional[str]]:
+    budget: Optional[_ByteBudget] = None,
+    cid_mode: Optional[str] = None,
+) -> StoredUpload:
     """
-    Dosyayı memory'e yüklemeden, parça parça diske kaydeder.
+    Dosyayı memory'e yüklemeden, parça parça depoya (storage) kaydeder.
+    Yazma, SHA-256 ve (cid_mode verilirse) CIDv1 aynı geçişte, event loop dışında yapılır.
+    Starlette parçayı zaten diske spool'lamışsa önce hash'lenir, sonra çekirdek içinde
+    (yerel) ya da doğrudan hedef key'e (S3) kopyalanır; UPLOAD_STORE=cas iken aynı içerik
+    depoda varsa hiç yazılmaz (deduplicated).
     max_bytes aşılırsa 413 döndürür.
     """
-    dest_dir.mkdir(parents=True, exist_ok=True)
-
     # Güvenli bir dosya adı üret (UUID + orijinal uzantı)
     ext = Path(file.filename or "").suffix.lower()
-    safe_name = f"{uuid.uuid4().hex}{ext}"
-    dest_path = dest_dir / safe_name
-
-    hasher = hashlib.sha256() if compute_sha256 else None
-    total = 0
-    chunk_size = 1024 * 1024  # 1 MB
-
-    with dest_path.open("wb") as out:
-        while True:
-            chunk = await file.read(chunk_size)
-            if not chunk:
-                break
-            total += len(chunk)
-            if total > max_bytes:
-                try:
-                    dest_path.unlink(missing_ok=True)
-                except Exception:
-                    pass
-                raise HTTPException(413, detail=f"Dosya {max_bytes} bayt limitini aşıyor")
-            out.write(chunk)
-            if hasher:
-                hasher.update(chunk)
+    fixed = None if UPLOAD_STORE == "cas" else f"{uuid.uuid4().hex}{ext}"
 
-    await file.close()
-    sha256 = hasher.hexdigest() if hasher else None
-    return dest_path, total, sha256
+    hasher = hashlib.sha256()
+    cid_hasher = UnixFSCidHasher() if cid_mode == "unixfs" else None
+    hashers = [h for h in (hasher, cid_hasher) if h is not None]
+    fd = spooled_fileno(file.file)
+    try:
+        if fd is not None:
+            total = await _ingest_spooled(fd, max_bytes, hashers, budget)
+            stored = StoredUpload(_storage_key(hasher.hexdigest(), ext, fixed), total, hasher.hexdigest())
+            if fixed is None and await storage.exists(stored.key):
+                stored.deduplicated = True
+            else:
+                stored.deduplicated = await storage.put_fd(fd, total, stored.key, file.content_type)
+        else:
+            sink = storage.sink(hashers, file.content_type)
+            total = await _write_stream(
+                _iter_upload(file, budget=budget), sink, max_bytes, sniffer=_pdf_sniffer(),
+            )
+            stored = StoredUpload(_storage_key(hasher.hexdigest(), ext, fixed), total, hasher.hexdigest())
+            stored.deduplicated = await _commit_sink(sink, stored.key)
+    finally:
+        await file.close()
+
+    await _finish_cid(stored, cid_mode, hasher, cid_hasher)
+    return stored
 
 
 async def _check_content_length(request: Request):
@@ -106,82 +255,537 @@ async def _check_content_length(request: Request):
     return True
 
 
+async def _store_upload(
+    file: UploadFile,
+    max_bytes: int = MAX_BYTES,
+    budget: Optional[_ByteBudget] = None,
+    cid_mode: Optional[str] = None,
+) -> StoredUpload:
+    """UPLOAD_STORE / STORAGE_BACKEND'e göre dosyayı kaydeder."""
+    return await _save_streaming(file, max_bytes, budget=budget, cid_mode=cid_mode)
+
+
+def _upload_result(
+    original_filename: Optional[str],
+    content_type: Optional[str],
+    stored: StoredUpload,
+) -> dict:
+    return {
+        "ok": True,
+        "original_filename": original_filename,
+        "stored_filename": stored.key.rsplit("/", 1)[-1],
+        "content_type": content_type,
+        "size_bytes": stored.size,
+        "sha256": stored.sha256,
+        "relative_path": stored.key,
+        "public_url": f"/files/{stored.key}",
+        "deduplicated": stored.deduplicated,
+        "cid": stored.cid,
+        "file_hash_hex": stored.cid_digest.hex() if stored.cid_digest else None,
+    }
+
+
 @app.post("/upload")
 async def upload_file(
     request_ok: bool = Depends(_check_content_length),
     file: UploadFile = File(..., description="Yüklenecek dosya"),
+    cid: Optional[str] = Query(None, description="CIDv1 hesabı: raw | unixfs | none"),
 ):
     """
     Tek dosya yükleme.
     - Form-Data: key 'file' ile dosya
+    - UPLOAD_STORE=cas iken aynı içerik tekrar yüklenirse mevcut dosya döner
+    - cid verilirse yanıtta cid ve file_hash_hex (32 bayt digest) bulunur
     """
     _validate_file_meta(file)
-    target_dir = UPLOAD_DIR  # alt klasör yok, direkt uploads/ içine yazacak
-    saved_path, size, sha256 = await _save_streaming(file, target_dir)
+    stored = await _store_upload(file, cid_mode=_cid_mode(cid))
+    return JSONResponse(_upload_result(file.filename, file.content_type, stored))
+
+
+# --- ÇOKLU DOSYA YÜKLEME ---
+MAX_UPLOAD_FILES = int(os.getenv("MAX_UPLOAD_FILES", 10))
+MAX_UPLOAD_TOTAL_BYTES = int(os.getenv("MAX_UPLOAD_TOTAL_BYTES", 5 * MAX_BYTES))
+
 
+async def _check_total_content_length(request: Request):
+    cl = request.headers.get("content-length")
+    if cl and cl.isdigit() and int(cl) > MAX_UPLOAD_TOTAL_BYTES + 64 * 1024:  # multipart başlıkları için pay
+        raise HTTPException(413, detail="İstek gövdesi çok büyük")
+    return True
+
+
+@app.post("/upload/multi")
+async def upload_files(
+    request_ok: bool = Depends(_check_total_content_length),
+    files: List[UploadFile] = File(..., description="Yüklenecek dosyalar"),
+    cid: Optional[str] = Query(None, description="CIDv1 hesabı: raw | unixfs | none"),
+):
+    """
+    Çoklu dosya yükleme (sözleşme paketi).
+    - Form-Data: her dosya aynı 'files' key'i ile
+    - Dosyalar eşzamanlı yazılır/hash'lenir; dosya başına MAX_UPLOAD_BYTES,
+      toplamda MAX_UPLOAD_TOTAL_BYTES
+    - Bir dosya başarısız olursa bu istekte yeni yazılan dosyalar silinir
+    """
+    if len(files) > MAX_UPLOAD_FILES:
+        raise HTTPException(400, detail=f"En fazla {MAX_UPLOAD_FILES} dosya yüklenebilir")
+    for f in files:
+        _validate_file_meta(f)
+    declared = sum(f.size or 0 for f in files)
+    if declared > MAX_UPLOAD_TOTAL_BYTES:
+        raise HTTPException(413, detail=f"Toplam yükleme {MAX_UPLOAD_TOTAL_BYTES} bayt limitini aşıyor")
+
+    cid_mode = _cid_mode(cid)
+    budget = _ByteBudget(MAX_UPLOAD_TOTAL_BYTES)
+    results = await asyncio.gather(
+        *(_store_upload(f, budget=budget, cid_mode=cid_mode) for f in files), return_exceptions=True
+    )
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        for r in results:
+            if isinstance(r, StoredUpload) and not r.deduplicated:
+                await storage.delete(r.key)
+        raise errors[0]
+
+    items = [_upload_result(f.filename, f.content_type, r) for f, r in zip(files, results)]
     return JSONResponse({
         "ok": True,
-        "original_filename": file.filename,
-        "stored_filename": saved_path.name,
-        "content_type": file.content_type,
-        "size_bytes": size,
-        "sha256": sha256,
-        "relative_path": str(saved_path.relative_to(UPLOAD_DIR)),
-        "public_url": f"/files/{saved_path.name}"
+        "files": items,
+        "count": len(items),
+        "total_bytes": sum(i["size_bytes"] for i in items),
+        "deduplicated_count": sum(1 for i in items if i["deduplicated"]),
     })
 
 
+# --- PARÇALI / DEVAM ETTİRİLEBİLİR YÜKLEME ---
+# 1) POST   /upload/sessions                    -> upload_id, chunk_size, chunk_count
+# 2) PUT    /upload/sessions/{id}/chunks/{i}    -> ham gövde; parçalar paralel gönderilebilir
+# 3) GET    /upload/sessions/{id}               -> alınan / eksik parçalar
+# 4) POST   /upload/sessions/{id}/complete      -> birleştir + SHA-256, /upload ile aynı yanıt
+# Oturum durumu diskte (INCOMING_DIR/sessions/<id>/) tutulur; restart ve birden fazla worker'da çalışır.
+# STORAGE_BACKEND=s3 iken de parçalar yereldir (aynı oturumun istekleri aynı host'a gitmeli);
+# birleştirilmiş dosya depoya complete'te akıtılır.
+CHUNKED_MAX_BYTES = int(os.getenv("CHUNKED_MAX_BYTES", 200 * 1024 * 1024))
+CHUNK_SIZE_DEFAULT = int(os.getenv("UPLOAD_CHUNK_SIZE", 5 * 1024 * 1024))
+CHUNK_SIZE_MIN = 256 * 1024
+CHUNK_SIZE_MAX = 32 * 1024 * 1024
+SESSIONS_DIR = INCOMING_DIR / "sessions"
+
+
+class UploadSessionRequest(BaseModel):
+    filename: str
+    size: int
+    content_type: str = "application/pdf"
+    chunk_size: Optional[int] = None
+    cid: Optional[str] = None  # raw | unixfs | none
+
+
+def _session_dir(upload_id: str) -> Path:
+    try:
+        uid = uuid.UUID(hex=upload_id).hex
+    except ValueError:
+        raise HTTPException(404, detail="Yükleme oturumu bulunamadı")
+    return SESSIONS_DIR / uid
+
+
+def _read_session(upload_id: str) -> Tuple[Path, dict]:
+    sdir = _session_dir(upload_id)
+    try:
+        meta = json.loads((sdir / "session.json").read_text())
+    except FileNotFoundError:
+        raise HTTPException(404, detail="Yükleme oturumu bulunamadı")
+    return sdir, meta
+
+
+def _chunk_length(meta: dict, index: int) -> int:
+    start = index * meta["chunk_size"]
+    return min(meta["chunk_size"], meta["size"] - start)
+
+
+def _received_chunks(sdir: Path) -> List[int]:
+    return sorted(int(p.stem) for p in sdir.glob("*.part"))
+
+
+def _index_ranges(indexes: List[int]) -> List[List[int]]:
+    """[0,1,2,5,6] -> [[0,2],[5,6]]"""
+    ranges: List[List[int]] = []
+    for i in indexes:
+        if ranges and ranges[-1][1] == i - 1:
+            ranges[-1][1] = i
+        else:
+            ranges.append([i, i])
+    return ranges
+
+
+def _session_state(sdir: Path, meta: dict) -> dict:
+    received = _received_chunks(sdir)
+    have = set(received)
+    return {
+        "upload_id": sdir.name,
+        "filename": meta["filename"],
+        "size": meta["size"],
+        "chunk_size": meta["chunk_size"],
+        "chunk_count": meta["chunk_count"],
+        "received": _index_ranges(received),
+        "received_bytes": sum(_chunk_length(meta, i) for i in received),
+        "missing": [i for i in range(meta["chunk_count"]) if i not in have],
+    }
+
+
+@app.post("/upload/sessions")
+async def create_upload_session(req: UploadSessionRequest):
+    ext = Path(req.filename).suffix.lower()
+    if ALLOWED_EXTS and ext not in ALLOWED_EXTS:
+        raise HTTPException(415, detail=f"İzin verilmeyen uzantı: {ext}")
+    if ALLOWED_CONTENT_TYPES and req.content_type not in ALLOWED_CONTENT_TYPES:
+        raise HTTPException(415, detail=f"İzin verilmeyen içerik türü: {req.content_type}")
+    if req.size <= 0:
+        raise HTTPException(400, detail="size pozitif olmalı")
+    if req.size > CHUNKED_MAX_BYTES:
+        raise HTTPException(413, detail=f"Dosya {CHUNKED_MAX_BYTES} bayt limitini aşıyor")
+
+    cid_mode = _cid_mode(req.cid)
+    chunk_size = req.chunk_size or CHUNK_SIZE_DEFAULT
+    if not CHUNK_SIZE_MIN <= chunk_size <= CHUNK_SIZE_MAX:
+        raise HTTPException(400, detail=f"chunk_size {CHUNK_SIZE_MIN}-{CHUNK_SIZE_MAX} aralığında olmalı")
+
+    upload_id = uuid.uuid4().hex
+    meta = {
+        "filename": req.filename,
+        "content_type": req.content_type,
+        "size": req.size,
+        "chunk_size": chunk_size,
+        "chunk_count": -(-req.size // chunk_size),
+        "cid_mode": cid_mode,
+        "created_at": time.time(),
+    }
+    sdir = SESSIONS_DIR / upload_id
+
+    def _create():
+        sdir.mkdir(parents=True)
+        (sdir / "session.json").write_text(json.dumps(meta))
+
+    await asyncio.to_thread(_create)
+    return {"upload_id": upload_id, "chunk_size": chunk_size, "chunk_count": meta["chunk_count"]}
+
+
+@app.get("/upload/sessions/{upload_id}")
+async def get_upload_session(upload_id: str):
+    sdir, meta = await asyncio.to_thread(_read_session, upload_id)
+    return await asyncio.to_thread(_session_state, sdir, meta)
+
+
+@app.put("/upload/sessions/{upload_id}/chunks/{index}")
+async def put_upload_chunk(upload_id: str, index: int, request: Request):
+    """
+    Ham gövde (application/octet-stream). Aynı parça tekrar gönderilirse üzerine yazılır.
+    Parça önce .tmp'ye yazılıp tamamlanınca adlandırılır; yarım parça "alındı" sayılmaz.
+    """
+    sdir, meta = await asyncio.to_thread(_read_session, upload_id)
+    if not 0 <= index < meta["chunk_count"]:
+        raise HTTPException(400, detail=f"index 0-{meta['chunk_count'] - 1} aralığında olmalı")
+    expected = _chunk_length(meta, index)
+
+    cl = request.headers.get("content-length")
+    if cl and cl.isdigit() and int(cl) != expected:
+        raise HTTPException(400, detail=f"Parça {index} {expected} bayt olmalı")
+
+    tmp_path = sdir / f"{index}.{uuid.uuid4().hex}.tmp"
+    # ilk parçada PDF başlığı hemen kontrol edilir; sonek complete'te tüm akışla birlikte
+    sniffer = PdfSniffer(check_trailer=False) if index == 0 else None
+    writer = await PipelinedWriter(tmp_path).open()
+    size = await _write_stream(request.stream(), writer, expected, sniffer=sniffer)
+    if size != expected:
+        tmp_path.unlink(missing_ok=True)
+        raise HTTPException(400, detail=f"Parça {index} {expected} bayt olmalı, {size} alındı")
+    await asyncio.to_thread(os.replace, tmp_path, sdir / f"{index}.part")
+    return {"upload_id": upload_id, "index": index, "size": size}
+
+
+async def _iter_chunks(sdir: Path, meta: dict) -> AsyncIterator[bytes]:
+    """Parça dosyalarını sırayla okur (okuma thread'de)."""
+    def _read(path: Path, offset: int) -> bytes:
+        with path.open("rb") as f:
+            f.seek(offset)
+            return f.read(UPLOAD_READ_CHUNK)
+
+    for i in range(meta["chunk_count"]):
+        path = sdir / f"{i}.part"
+        offset = 0
+        while True:
+            data = await asyncio.to_thread(_read, path, offset)
+            if not data:
+                break
+            offset += len(data)
+            yield data
+
+
+@app.post("/upload/sessions/{upload_id}/complete")
+async def complete_upload_session(upload_id: str):
+    sdir, meta = await asyncio.to_thread(_read_session, upload_id)
+    state = await asyncio.to_thread(_session_state, sdir, meta)
+    if state["missing"]:
+        raise HTTPException(409, detail={"message": "Eksik parçalar var", "missing": state["missing"]})
+
+    ext = Path(meta["filename"]).suffix.lower()
+    fixed = None if UPLOAD_STORE == "cas" else f"{uuid.uuid4().hex}{ext}"
+    cid_mode = meta.get("cid_mode")
+    hasher = hashlib.sha256()
+    cid_hasher = UnixFSCidHasher() if cid_mode == "unixfs" else None
+    sink = storage.sink([h for h in (hasher, cid_hasher) if h is not None], meta["content_type"])
+    size = await _write_stream(_iter_chunks(sdir, meta), sink, meta["size"], sniffer=_pdf_sniffer())
+    stored = StoredUpload(_storage_key(hasher.hexdigest(), ext, fixed), size, hasher.hexdigest())
+    stored.deduplicated = await _commit_sink(sink, stored.key)
+    await _finish_cid(stored, cid_mode, hasher, cid_hasher)
+    await asyncio.to_thread(shutil.rmtree, sdir, True)
+
+    return JSONResponse(_upload_result(meta["filename"], meta["content_type"], stored))
+
+
+@app.delete("/upload/sessions/{upload_id}")
+async def delete_upload_session(upload_id: str):
+    sdir, _ = await asyncio.to_thread(_read_session, upload_id)
+    await asyncio.to_thread(shutil.rmtree, sdir, True)
+    return {"ok": True}
+
+
+# --- DOSYA SUNUMU (/files) ---
+# StaticFiles yerine: içerik adresli dosyalarda SHA-256 güçlü ETag, If-None-Match -> 304,
+# Range (PDF.js parça parça yükler). Baytları gönderme:
+# - "direct": FileResponse (sunucu http.response.pathsend destekliyorsa zero-copy)
+# - "accel":  X-Accel-Redirect ile nginx'e bırakılır (sendfile + Range nginx'te)
+FILES_SERVE_MODE = os.getenv("FILES_SERVE_MODE", "direct").lower()
+FILES_ACCEL_PREFIX = os.getenv("FILES_ACCEL_PREFIX", "/_protected_files/")
+FILES_CACHE_MAX_AGE = int(os.getenv("FILES_CACHE_MAX_AGE", 86400))
+_CAS_NAME = re.compile(r"^([0-9a-f]{64})\.[a-z0-9]+$")
+
+
+def _resolve_upload(file_path: str) -> Path:
+    """İstek yolunu UPLOAD_DIR içinde tutar; gizli (.incoming vb.) yolları reddeder."""
+    parts = Path(file_path).parts
+    if not parts or any(p.startswith(".") for p in parts):
+        raise HTTPException(404, detail="Dosya bulunamadı")
+    root = UPLOAD_DIR.resolve()
+    path = (root / file_path).resolve()
+    if root not in path.parents or not path.is_file():
+        raise HTTPException(404, detail="Dosya bulunamadı")
+    return path
+
+
+def _content_sha256(path: Path) -> Optional[str]:
+    """ab/cd/<sha256>.pdf düzenindeki dosyanın hash'i (dosyayı okumadan)."""
+    m = _CAS_NAME.match(path.name)
+    if m and path.parent.name == m.group(1)[2:4] and path.parent.parent.name == m.group(1)[:2]:
+        return m.group(1)
+    return None
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    tags = [t.strip() for t in if_none_match.split(",")]
+    # If-None-Match zayıf karşılaştırma kullanır
+    return any(t.removeprefix("W/") == etag.removeprefix("W/") for t in tags)
+
+
+@app.api_route("/files/{file_path:path}", methods=["GET", "HEAD"])
+async def serve_file(file_path: str, request: Request):
+    if storage.kind == "s3":
+        # baytlar doğrudan nesne deposundan; ETag/Range/304 orada işlenir
+        parts = Path(file_path).parts
+        if not parts or any(p.startswith(".") for p in parts):
+            raise HTTPException(404, detail="Dosya bulunamadı")
+        url = storage.presigned_url(file_path, filename=parts[-1])
+        return RedirectResponse(url, status_code=307, headers={"Cache-Control": "private, no-store"})
+
+    path = await asyncio.to_thread(_resolve_upload, file_path)
+    st = await asyncio.to_thread(path.stat)
+
+    sha256 = _content_sha256(path)
+    if sha256:
+        etag = f'"{sha256}"'
+        cache_control = "public, max-age=31536000, immutable"  # içerik adı değişmeden değişemez
+    else:
+        etag = f'W/"{int(st.st_mtime)}-{st.st_size}"'
+        cache_control = f"public, max-age={FILES_CACHE_MAX_AGE}"
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    inm = request.headers.get("if-none-match")
+    if inm and _etag_matches(inm, etag):
+        return Response(status_code=304, headers=headers)
+
+    if FILES_SERVE_MODE == "accel":
+        rel = path.relative_to(UPLOAD_DIR.resolve()).as_posix()
+        headers["X-Accel-Redirect"] = FILES_ACCEL_PREFIX.rstrip("/") + "/" + rel
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        return Response(status_code=200, headers=headers, media_type=media_type)
+
+    # Range / If-Range / HEAD FileResponse tarafından işlenir
+    return FileResponse(
+        path,
+        headers=headers,
+        stat_result=st,
+        filename=path.name,
+        content_disposition_type="inline",
+    )
+
+
 @app.get("/")
 def read_root():
     return {"message": "FastAPI + MySQL çalışıyor!"}
 
 @app.get("/db-check")
-def db_check(db: Session = Depends(get_db)):
+async def db_check(db: AsyncSession = Depends(get_async_db)):
     try:
-        db.execute(text("SELECT 1"))
+        await db.execute(text("SELECT 1"))
         return {"status": "ok", "message": "Veritabanı bağlantısı başarılı"}
     except OperationalError as e:
         return {"status": "error", "message": f"Veritabanı bağlantı hatası: {str(e)}"}
 
 # --- EK IMPORTLAR (ÇATIŞMA YOK) ---
 from typing import List
-from algosdk.v2client import algod
 from algosdk import encoding, transaction
 # EKLE
 from base64 import b64decode
 import time
+import copy
+import asyncio
 from algosdk import encoding
-from algosdk.abi import Method, ABIType
 from algosdk.logic import get_application_address
+from algod_async import AsyncAlgodClient
+from abi_templates import split_encoded_hashes
+from chain import make_algod_client, make_templates
+from algosdk.v2client import models as algod_models
+from box_reader import BoxStateReader
+from confirmations import ConfirmationWaiter, ConfirmationTimeout, TransactionRejected
+from abi_templates import decode_uint64_return
+from submit_queue import SubmissionQueue, QueueFull, SubmitRetriesExhausted
+from indexer import BlockIndexer
+from database import async_engine, engine
+from models import Document, DocumentSigner
+from sqlalchemy import select
+from upload_gc import UploadSweeper
+from readiness import LoopLagMonitor, pool_stats, threadpool_stats, seconds_since
+
+# --- ALGOD CLIENT ---
+# Adres / token ve havuz ayarları chain.py'de (indexer ve upload_gc ile ortak)
+algod_client = make_algod_client()
+
+# --- SUGGESTED PARAMS CACHE ---
+# Her build isteğinde algod'a gitmek yerine süreç genelinde tek bir kopya tutulur.
+SP_TTL_SECONDS = float(os.getenv("SP_TTL_SECONDS", 10))
+
+
+class SuggestedParamsCache:
+    """
+    suggested_params() için süreç genelinde paylaşılan önbellek.
+    - Arka plan task'ı status_after_block ile her yeni round'da yeniler
+    - Task geride kalırsa (TTL aşıldıysa) get() tek bir istekle yeniler
+    - get() her çağrıda kopya döner; builder'lar fee/flat_fee'yi serbestçe değiştirebilir
+    """
 
-# --- ALGOD CLIENT (ENV YOK) ---
-ALGOD_URL = "https://testnet-api.algonode.cloud"
-ALGOD_TOKEN = ""  # PureStake kullanırsan anahtarını ekle ve aşağıdaki header'ı değiştir
-ALGOD_TOKEN_HEADER = "X-Algo-API-Token"  # PureStake için genelde "X-API-Key"
-
-_algod_headers = {ALGOD_TOKEN_HEADER: ALGOD_TOKEN} if ALGOD_TOKEN else {}
-algod_client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_URL, _algod_headers)
+    def __init__(self, client: AsyncAlgodClient, ttl: float = SP_TTL_SECONDS):
+        self._client = client
+        self._ttl = ttl
+        self._lock = asyncio.Lock()
+        self._sp: Optional[transaction.SuggestedParams] = None
+        self._fetched_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self.node_round = 0  # long-poll'dan görülen son node round'u (/ready için)
+
+    def _fresh(self) -> bool:
+        return self._sp is not None and time.monotonic() - self._fetched_at <= self._ttl
+
+    async def refresh(self) -> transaction.SuggestedParams:
+        sp = await self._client.suggested_params()
+        self._sp = sp
+        self._fetched_at = time.monotonic()
+        self.node_round = max(self.node_round, sp.first)
+        return sp
+
+    async def get(self) -> transaction.SuggestedParams:
+        if not self._fresh():
+            # aynı anda bayatlayan isteklerden yalnızca biri algod'a gider
+            async with self._lock:
+                if not self._fresh():
+                    await self.refresh()
+        return copy.copy(self._sp)
+
+    @property
+    def params_round(self) -> Optional[int]:
+        return self._sp.first if self._sp else None
+
+    @property
+    def fetched_at(self) -> float:
+        return self._fetched_at
+
+    async def last_round(self) -> int:
+        """Önbellekteki suggested params'ın round'u (algod'a ekstra istek atmaz)."""
+        if not self._fresh():
+            await self.get()
+        return self._sp.first
+
+    async def _run(self):
+        while True:
+            try:
+                sp = self._sp or await self.refresh()
+                # bir sonraki round'a kadar bekler (algod long-poll)
+                status = await self._client.status_after_block(sp.first)
+                self.node_round = status.get("last-round", self.node_round)
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # node erişilemiyorsa TTL kadar bekle; get() gerekirse kendisi dener
+                await asyncio.sleep(self._ttl)
+
+    def start(self):
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+sp_cache = SuggestedParamsCache(algod_client)
+
+
+@app.on_event("startup")
+async def _start_sp_cache():
+    sp_cache.start()
+
+
+@app.on_event("shutdown")
+async def _stop_sp_cache():
+    await sp_cache.stop()
+    # algod_client dosyanın sonundaki son shutdown hook'unda kapanır
+
+# --- ARC-56 ŞABLONLARI ---
+# Selector / encoder / box düzeni açılışta bir kez hesaplanır (abi_templates.py).
+# Docker'da spec yolu BLOCKSIGN_ARC56_PATH ile verilir; BLOCKSIGN_APP_ID zorunlu (chain.py).
+templates = make_templates()
+app_id = templates.app_id
 
 # ARC-4 method imzası (sözleşmene uygun)
-M_CREATE = Method.from_signature("create_contract(byte[],address[])uint64")
-M_SIGN = Method.from_signature("sign(byte[],address)uint64")
-M_ISSIGN = Method.from_signature("issign(byte[])uint64")
-M_ISCOMPLETE = Method.from_signature("iscomplete(byte[])uint64")
-M_REJECT = Method.from_signature("reject(byte[],address)uint64")
+M_CREATE = templates["create_contract"].method
+M_SIGN = templates["sign"].method
+M_ISSIGN = templates["issign"].method
+M_ISCOMPLETE = templates["iscomplete"].method
+M_REJECT = templates["reject"].method
+
+MAX_GROUP_SIZE = 16  # Algorand atomik grup limiti
 
 # --- yardımcılar ---
 def _hex_to_bytes(h: str) -> bytes:
     h = h[2:] if h.startswith("0x") else h
     return bytes.fromhex(h)
 
-def _prefixed_box(prefix: bytes, data: bytes) -> bytes:
-    return prefix + data
-
-def _box_ref(app_id: int, name: bytes) -> transaction.BoxReference:
-    return transaction.BoxReference(app_id, name)
-
-app_id = 746531052
-
 
 # --- İSTEK MODELLERİ ---
 class CreateBuildRequest(BaseModel):
@@ -208,22 +812,38 @@ class RejectBuildRequest(BaseModel):
     sender: str         # reddeden/çağıran imzacı (Txn.sender)
     file_hash_hex: str  # 32 bayt (64 hex)
 
+class CancelBuildRequest(BaseModel):
+    sender: str         # Global.creator_address olmalı
+    file_hash_hex: str  # 32 bayt (64 hex)
+
+class QueryRequest(BaseModel):
+    method: str                          # issign | iscomplete | get_asset_id | ...
+    file_hash_hex: Optional[str] = None  # my_contracts hariç zorunlu
+    sender: Optional[str] = None         # issign / my_contracts için zorunlu
+
+class BatchBuildItem(BaseModel):
+    method: str         # sign | issign | iscomplete | reject
+    file_hash_hex: str  # 32 bayt (64 hex)
+
+class BatchBuildRequest(BaseModel):
+    sender: str                 # tüm kalemler için Txn.sender
+    items: List[BatchBuildItem]
+
 # --- YENİ: create_contract için unsigned grup üret ---
 @app.post("/blocksign/create/build")
-def blocksign_build_create(req: CreateBuildRequest):
+async def blocksign_build_create(req: CreateBuildRequest):
     """
     Gtxn[0]: Payment (>= 5 ALGO -> app address)
     Gtxn[1]: AppCall (create_contract) + boxes (inner ASA mint için fee yükseltilmiş)
+    Gtxn[2..]: box_refs; imzacı başına bir mbr_ kutusu 8 referansa sığmazsa ek referanslar
     """
     try:
         # temel kontroller
         if len(req.file_hash_hex.replace("0x","")) != 64:
             raise ValueError("file_hash_hex 32 bayt (64 hex) olmalı")
 
-        sp = algod_client.suggested_params()
-        sp2 = algod_client.suggested_params()
-        sp2.flat_fee = True
-        sp2.fee = 2000  # inner itxn için gerekirse 3000 yap
+        sp = await sp_cache.get()
+        sp2 = await sp_cache.get()  # AppCall fee'si şablonda (inner itxn için 2000)
 
         app_addr = get_application_address(app_id)
 
@@ -235,100 +855,218 @@ def blocksign_build_create(req: CreateBuildRequest):
             amt=5_000_000  # 5 ALGO (microAlgo)
         )
 
-        # ---- BOXES OLUŞTUR ----
+        # AppCall: argümanlar ve box referansları ARC-56 şablonundan
         fh = _hex_to_bytes(req.file_hash_hex)              # 32B file hash
-        sender_pk = encoding.decode_address(req.sender)    # 32B address bytes
-
-        boxes = [
-            _box_ref(app_id, _prefixed_box(b"asa_", fh)),
-            _box_ref(app_id, _prefixed_box(b"adm_", fh)),
-            _box_ref(app_id, _prefixed_box(b"sgn_", fh)),
-            _box_ref(app_id, _prefixed_box(b"sgh_", fh)),
-            _box_ref(app_id, _prefixed_box(b"del_", fh)),
-            _box_ref(app_id, _prefixed_box(b"uhs_", sender_pk)),
-        ]
-
-        # ---- ABI ARG ENCODE (geriye-uyumlu) ----
-        arg0 = ABIType.from_string("byte[]").encode(fh)             # file_hash
-        arg1 = ABIType.from_string("address[]").encode(req.signers) # signers
-
-        app_call = transaction.ApplicationCallTxn(
-            sender=req.sender,
-            sp=sp2,
-            index=app_id,
-            on_complete=transaction.OnComplete.NoOpOC,
-            app_args=[ M_CREATE.get_selector(), arg0, arg1 ],
-            boxes=boxes,
+        app_calls = templates.build_spread(
+            "create_contract", req.sender, sp2, file_hash=fh, signers=req.signers
         )
+        group = [pay] + app_calls
+        if len(group) > MAX_GROUP_SIZE:
+            raise ValueError(f"çok fazla imzacı: box referansları {MAX_GROUP_SIZE}'lık gruba sığmıyor")
 
-        # Grup ID ata (sıra: 0=Payment, 1=AppCall)
-        gid = transaction.calculate_group_id([pay, app_call])
-        pay.group = gid
-        app_call.group = gid
+        # Grup ID ata (sıra: 0=Payment, 1=AppCall, 2..=box_refs)
+        gid = transaction.calculate_group_id(group)
+        for txn in group:
+            txn.group = gid
 
-        unsigned_group_b64 = [
-            encoding.msgpack_encode(pay),
-            encoding.msgpack_encode(app_call),
-        ]
+        unsigned_group_b64 = [encoding.msgpack_encode(txn) for txn in group]
         return {
             "unsigned_group_b64": unsigned_group_b64,
             "app_address": app_addr,
-            "note": "Sıra korunmalı: [payment, appcall]. Lute ile bu sırayla imzala."
+            "note": "Sıra korunmalı: [payment, appcall, box_refs...]. Lute ile bu sırayla imzala."
         }
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"build_create error: {e}")
 
 # --- YENİ: imzalı grup yayınla ---
-@app.post("/tx/submit")
-def blocksign_submit(req: SubmitRequest):
+# --- Gönderim kuyruğu (dedup + sınırlı eşzamanlılık + retry + backpressure) ---
+submit_queue = SubmissionQueue(algod_client)
+
+
+def _decode_submission(signed_b64: List[str]) -> Tuple[List[str], bytes, str]:
+    """
+    İmzalı b64 listesi -> (txid'ler, birleşik ham baytlar, dedup key).
+    Dedup key: grup varsa group id, yoksa tek işlemin txid'i.
+    """
+    if not signed_b64:
+        raise ValueError("signed_b64 boş")
+    stxns = [encoding.msgpack_decode(b64) for b64 in signed_b64]
+    txids = [stxn.get_txid() for stxn in stxns]
+    group = stxns[0].transaction.group
+    dedup_key = "grp:" + base64.b64encode(group).decode() if group else "txn:" + txids[0]
+    # grup: imzalı baytlar sırasıyla birleştirilip tek POST ile gönderilir
+    raw_group = b"".join(b64decode(b64) for b64 in signed_b64)
+    return txids, raw_group, dedup_key
+
+
+async def _enqueue_submission(txids: List[str], raw_group: bytes, dedup_key: str) -> str:
     try:
-        if not req.signed_b64:
-            raise ValueError("signed_b64 boş")
+        return await submit_queue.submit(raw_group, dedup_key, txids[0])
+    except QueueFull as e:
+        raise HTTPException(
+            status_code=429,
+            detail="submit error: gönderim kuyruğu dolu, tekrar deneyin",
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    except SubmitRetriesExhausted as e:
+        raise HTTPException(status_code=503, detail=f"submit error: {e}")
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"submit error: {e}")
 
-        raw_group = [encoding.base64.b64decode(b64) for b64 in req.signed_b64]
-        txid = algod_client.send_raw_transaction(raw_group)
-        return {"txid": txid}
 
+@app.post("/tx/submit")
+async def blocksign_submit(req: SubmitRequest):
+    try:
+        txids, raw_group, dedup_key = _decode_submission(req.signed_b64)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"submit error: {e}")
 
-@app.post("/blocksign/sign/build")
-def blocksign_build_sign(req: SignBuildRequest):
+    txid = await _enqueue_submission(txids, raw_group, dedup_key)
+    return {"txid": txid}
+
+# --- Blok indeksleyici (MySQL) ---
+# Tek bir süreçte çalışmalı: ya burada INDEXER_ENABLED=1 ile ya da ayrı `python indexer.py`.
+INDEXER_ENABLED = os.getenv("INDEXER_ENABLED", "0") == "1"
+block_indexer = BlockIndexer(algod_client, templates)
+
+
+@app.on_event("startup")
+async def _start_indexer():
+    if INDEXER_ENABLED:
+        block_indexer.start()
+
+
+@app.on_event("shutdown")
+async def _stop_indexer():
+    await block_indexer.stop()
+    await async_engine.dispose()
+
+
+# --- YENİ: yayınla + onay bekle + uint64 dönüşü çöz ---
+confirmations = ConfirmationWaiter(algod_client)
+
+
+@app.on_event("startup")
+async def _start_confirmations():
+    confirmations.start()
+
+
+@app.on_event("shutdown")
+async def _stop_confirmations():
+    await confirmations.stop()
+
+
+@app.post("/tx/submit_and_decode_uint64")
+async def blocksign_submit_and_decode(req: SubmitRequest):
     """
-    Tek AppCall: sign(file_hash, signer)
+    Grubu yayınlar, onayı paylaşılan blok takipçisiyle bekler ve
+    gruptaki son AppCall'ın son log'unu ARC-4 uint64 olarak çözer (ör. issign/iscomplete 0/1).
     """
     try:
-        if len(req.file_hash_hex.replace("0x","")) != 64:
-            raise ValueError("file_hash_hex 32 bayt (64 hex) olmalı")
+        txids, raw_group, dedup_key = _decode_submission(req.signed_b64)
+        start_round = await sp_cache.last_round()
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"submit error: {e}")
 
-        sp = algod_client.suggested_params()
-        sp.flat_fee = True
-        sp.fee = 1000
+    await _enqueue_submission(txids, raw_group, dedup_key)
 
-        fh = _hex_to_bytes(req.file_hash_hex)
+    try:
+        # grup aynı blokta onaylanır; son işlemi beklemek yeterli
+        last_info = await confirmations.wait(txids[-1], start_round)
+        infos = [last_info]
+        if len(txids) > 1 and not last_info.get("logs"):
+            # dönüş değeri: sondan başa ilk log'lu işlem
+            infos = list(await asyncio.gather(
+                *(algod_client.pending_transaction_info(t) for t in txids[:-1])
+            )) + infos
+    except ConfirmationTimeout as e:
+        raise HTTPException(status_code=504, detail=f"confirm error: {e}")
+    except TransactionRejected as e:
+        raise HTTPException(status_code=400, detail=f"confirm error: {e}")
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"confirm error: {e}")
 
-        # Kutular (sözleşmen bu metodda sgn_, sgh_, del_, asa_ okuyor)
-        boxes = [
-            _box_ref(app_id, _prefixed_box(b"asa_", fh)),
-            _box_ref(app_id, _prefixed_box(b"sgn_", fh)),
-            _box_ref(app_id, _prefixed_box(b"sgh_", fh)),
-            _box_ref(app_id, _prefixed_box(b"del_", fh)),
-        ]
+    return_value = None
+    for info in reversed(infos):
+        logs = info.get("logs") or []
+        if logs:
+            try:
+                return_value = decode_uint64_return(b64decode(logs[-1]))
+            except Exception:
+                return_value = None
+            break
 
-        # ABI argümanlarını encode et
-        arg0 = ABIType.from_string("byte[]").encode(fh)
-        arg1 = ABIType.from_string("address").encode(req.sender)
+    return {
+        "txid": txids[-1],
+        "txids": txids,
+        "confirmed_round": infos[-1].get("confirmed-round"),
+        "return_value": return_value,
+    }
 
-        app_call = transaction.ApplicationCallTxn(
-            sender=req.sender,
-            sp=sp,
-            index=app_id,
-            on_complete=transaction.OnComplete.NoOpOC,
-            app_args=[ M_SIGN.get_selector(), arg0, arg1 ],
-            boxes=boxes,
-        )
 
+# --- Tek AppCall builder'ları (endpoint'ler ve batch ortak kullanır) ---
+def _require_hash32(file_hash_hex: str) -> bytes:
+    hx = file_hash_hex[2:] if file_hash_hex.startswith("0x") else file_hash_hex
+    if len(hx) != 64:
+        raise ValueError("file_hash_hex 32 bayt (64 hex) olmalı")
+    return bytes.fromhex(hx)
+
+
+def _build_sign_txn(req: SignBuildRequest, sp: transaction.SuggestedParams) -> transaction.ApplicationCallTxn:
+    # Kutular: asa_, sgh_, del_, sbm_, cnt_, mbr_ (imzacı sayısından bağımsız)
+    fh = _require_hash32(req.file_hash_hex)
+    return templates.build("sign", req.sender, sp, file_hash=fh, signer=req.sender)
+
+
+def _build_issign_txn(req: IssignBuildRequest, sp: transaction.SuggestedParams) -> transaction.ApplicationCallTxn:
+    # boxes: del_, sbm_ ve sender'ın mbr_ kutusu
+    fh = _hex_to_bytes(req.file_hash_hex)
+    return templates.build("issign", req.sender, sp, file_hash=fh)
+
+
+def _build_iscomplete_txn(req: IsCompleteBuildRequest, sp: transaction.SuggestedParams) -> transaction.ApplicationCallTxn:
+    # Kutular: del_, cnt_ (sadece okuma, fee 1000)
+    fh = _require_hash32(req.file_hash_hex)
+    return templates.build("iscomplete", req.sender, sp, file_hash=fh)
+
+
+def _build_cancel_txns(
+    req: CancelBuildRequest, sp: transaction.SuggestedParams, signers: List[str]
+) -> List[transaction.ApplicationCallTxn]:
+    # Kutular: asa_, sgn_, sgh_, del_, sbm_, cnt_ + imzacı başına mbr_ (inner AssetConfig destroy için fee 2000)
+    fh = _require_hash32(req.file_hash_hex)
+    return templates.build_spread("cancel", req.sender, sp, file_hash=fh, signers=signers)
+
+
+def _build_reject_txns(
+    req: RejectBuildRequest, sp: transaction.SuggestedParams, signers: List[str]
+) -> List[transaction.ApplicationCallTxn]:
+    # Kutular: asa_, sgn_, sgh_, del_, sbm_, cnt_ + imzacı başına mbr_ (inner AssetConfig için fee 2000)
+    fh = _require_hash32(req.file_hash_hex)
+    return templates.build_spread(
+        "reject", req.sender, sp, file_hash=fh, signer=req.sender, signers=signers
+    )
+
+
+def _group_b64(txns: List[transaction.Transaction]) -> List[str]:
+    """[asıl çağrı, box_refs...] -> grup id atanmış unsigned b64 listesi (tek işlemde grup yok)."""
+    if len(txns) > MAX_GROUP_SIZE:
+        raise ValueError(f"çok fazla imzacı: box referansları {MAX_GROUP_SIZE}'lık gruba sığmıyor")
+    if len(txns) > 1:
+        gid = transaction.calculate_group_id(txns)
+        for txn in txns:
+            txn.group = gid
+    return [encoding.msgpack_encode(txn) for txn in txns]
+
+
+@app.post("/blocksign/sign/build")
+async def blocksign_build_sign(req: SignBuildRequest):
+    """
+    Tek AppCall: sign(file_hash, signer)
+    """
+    try:
+        app_call = _build_sign_txn(req, await sp_cache.get())
         unsigned_b64 = encoding.msgpack_encode(app_call)
         return {"unsigned_b64": unsigned_b64, "note": "Tek AppCall. Bunu Lute ile imzala, sonra /tx/submit’e gönder."}
 
@@ -336,32 +1074,13 @@ def blocksign_build_sign(req: SignBuildRequest):
         raise HTTPException(status_code=400, detail=f"build_sign error: {e}")
 
 @app.post("/blocksign/issign/build")
-def blocksign_build_issign(req: IssignBuildRequest):
+async def blocksign_build_issign(req: IssignBuildRequest):
     """
     Tek AppCall: issign(file_hash)
     Txn.sender = kontrol edilecek adres olmalı.
     """
     try:
-        fh = _hex_to_bytes(req.file_hash_hex)
-
-        sp = algod_client.suggested_params()
-        sp.flat_fee = True
-        sp.fee = 1000
-
-        # boxes: sadece sgh_ lazım
-        boxes = [_box_ref(app_id, _prefixed_box(b"sgh_", fh))]
-
-        arg0 = ABIType.from_string("byte[]").encode(fh)
-
-        app_call = transaction.ApplicationCallTxn(
-            sender=req.sender,
-            sp=sp,
-            index=app_id,
-            on_complete=transaction.OnComplete.NoOpOC,
-            app_args=[M_ISSIGN.get_selector(), arg0],
-            boxes=boxes,
-        )
-
+        app_call = _build_issign_txn(req, await sp_cache.get())
         unsigned_b64 = encoding.msgpack_encode(app_call)
         return {"unsigned_b64": unsigned_b64, "note": "Tek AppCall. Lute ile imzala, /tx/submit sonrası returnValue=1/0."}
 
@@ -369,40 +1088,13 @@ def blocksign_build_issign(req: IssignBuildRequest):
         raise HTTPException(status_code=400, detail=f"build_issign error: {e}")
 
 @app.post("/blocksign/iscomplete/build")
-def blocksign_build_iscomplete(req: IsCompleteBuildRequest):
+async def blocksign_build_iscomplete(req: IsCompleteBuildRequest):
     """
     Tek AppCall: iscomplete(file_hash)
-    Boxes: sgn_, sgh_, del_
+    Boxes: del_, cnt_
     """
     try:
-        hx = req.file_hash_hex[2:] if req.file_hash_hex.startswith("0x") else req.file_hash_hex
-        if len(hx) != 64:
-            raise ValueError("file_hash_hex 32 bayt (64 hex) olmalı")
-
-        fh = bytes.fromhex(hx)
-
-        sp = algod_client.suggested_params()
-        sp.flat_fee = True
-        sp.fee = 1000  # sadece okuma, 1000 yeterli
-
-        boxes = [
-            _box_ref(app_id, _prefixed_box(b"sgn_", fh)),
-            _box_ref(app_id, _prefixed_box(b"sgh_", fh)),
-            _box_ref(app_id, _prefixed_box(b"del_", fh)),
-        ]
-
-        # ABI arg: byte[] (file_hash)
-        arg0 = ABIType.from_string("byte[]").encode(fh)
-
-        app_call = transaction.ApplicationCallTxn(
-            sender=req.sender,
-            sp=sp,
-            index=app_id,
-            on_complete=transaction.OnComplete.NoOpOC,
-            app_args=[ M_ISCOMPLETE.get_selector(), arg0 ],
-            boxes=boxes,
-        )
-
+        app_call = _build_iscomplete_txn(req, await sp_cache.get())
         unsigned_b64 = encoding.msgpack_encode(app_call)
         return {
             "unsigned_b64": unsigned_b64,
@@ -413,48 +1105,414 @@ def blocksign_build_iscomplete(req: IsCompleteBuildRequest):
         raise HTTPException(status_code=400, detail=f"build_iscomplete error: {e}")
 
 @app.post("/blocksign/reject/build")
-def blocksign_build_reject(req: RejectBuildRequest):
+async def blocksign_build_reject(req: RejectBuildRequest):
     """
-    Tek AppCall: reject(file_hash, signer)
-    - Global.group_size == 1 şartını sağlar
-    - Boxes: asa_, sgn_, sgh_, del_
+    reject(file_hash, signer)
+    - Gtxn[0]: AppCall; Gtxn[1..]: box_refs (mbr_ referansları 8'e sığmazsa)
+    - Boxes: asa_, sgn_, sgh_, del_, sbm_, cnt_, imzacı başına mbr_ (sözleşme hepsini siler)
+    - İmzacı listesi zincirdeki sgn_ kutusundan okunur
     """
     try:
-        hx = req.file_hash_hex[2:] if req.file_hash_hex.startswith("0x") else req.file_hash_hex
-        if len(hx) != 64:
-            raise ValueError("file_hash_hex 32 bayt (64 hex) olmalı")
+        signers = await box_reader.signers(_require_hash32(req.file_hash_hex))
+        txns = _build_reject_txns(req, await sp_cache.get(), signers)
+        return {
+            "unsigned_group_b64": _group_b64(txns),
+            "note": "Sıra korunmalı: [appcall, box_refs...]. Lute ile imzala; ardından /tx/submit veya /tx/submit_and_decode_uint64 kullan."
+        }
+
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"build_reject error: {e}")
+
+@app.post("/blocksign/cancel/build")
+async def blocksign_build_cancel(req: CancelBuildRequest):
+    """
+    cancel(file_hash)
+    - Sadece uygulamayı oluşturan hesap çağırabilir
+    - Gtxn[0]: AppCall; Gtxn[1..]: box_refs (mbr_ referansları 8'e sığmazsa)
+    - Boxes: asa_, sgn_, sgh_, del_, sbm_, cnt_, imzacı başına mbr_ (sözleşme hepsini siler)
+    """
+    try:
+        signers = await box_reader.signers(_require_hash32(req.file_hash_hex))
+        txns = _build_cancel_txns(req, await sp_cache.get(), signers)
+        return {
+            "unsigned_group_b64": _group_b64(txns),
+            "note": "Sıra korunmalı: [appcall, box_refs...]. Lute ile imzala, /tx/submit ile yayınla."
+        }
 
-        fh = bytes.fromhex(hx)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"build_cancel error: {e}")
 
-        sp = algod_client.suggested_params()
-        sp.flat_fee = True
-        sp.fee = 2000  # inner AssetConfig için; yetmezse 3000 yap
 
-        boxes = [
-            _box_ref(app_id, _prefixed_box(b"asa_", fh)),
-            _box_ref(app_id, _prefixed_box(b"sgn_", fh)),
-            _box_ref(app_id, _prefixed_box(b"sgh_", fh)),
-            _box_ref(app_id, _prefixed_box(b"del_", fh)),
-        ]
+# --- Batch: tek sender, çok sayıda file hash ---
+# method -> (istek modeli, builder)
+BATCH_BUILDERS = {
+    "sign": (SignBuildRequest, _build_sign_txn),
+    "issign": (IssignBuildRequest, _build_issign_txn),
+    "iscomplete": (IsCompleteBuildRequest, _build_iscomplete_txn),
+}
+# Zincirdeki sgn_ listesini isteyen, [appcall, box_refs...] grubu üreten metodlar
+BATCH_GROUP_BUILDERS = {
+    "reject": (RejectBuildRequest, _build_reject_txns),
+}
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", 256))
 
-        # ABI argümanlarını encode et
-        arg0 = ABIType.from_string("byte[]").encode(fh)        # file_hash
-        arg1 = ABIType.from_string("address").encode(req.sender)  # signer
 
-        app_call = transaction.ApplicationCallTxn(
-            sender=req.sender,
-            sp=sp,
-            index=app_id,
-            on_complete=transaction.OnComplete.NoOpOC,
-            app_args=[ M_REJECT.get_selector(), arg0, arg1 ],
-            boxes=boxes,
-        )
+async def _batch_signers(idx: int, item: BatchBuildItem) -> List[str]:
+    try:
+        return await box_reader.signers(_require_hash32(item.file_hash_hex))
+    except Exception as e:
+        raise ValueError(f"items[{idx}]: {e}")
+
+
+@app.post("/blocksign/batch/build")
+async def blocksign_build_batch(req: BatchBuildRequest):
+    """
+    Tek sender için çok sayıda (method, file_hash_hex) kalemi.
+    - suggested_params tek sefer alınır, tüm kalemler aynı parametrelerle üretilir
+    - Kalemler birbirleriyle gruplanmaz: sign / issign / iscomplete Global.group_size == 1 istiyor;
+      her kalem ayrı imzalanıp ayrı gönderilir
+    - reject: imzacı listesi sgn_ kutusundan (eşzamanlı) okunur, kalem kendi
+      [appcall, box_refs...] grubu olarak döner (unsigned_group_b64)
+    - Dönüş sırası istek sırasıyla aynıdır
+    """
+    try:
+        if not req.items:
+            raise ValueError("items boş")
+        if len(req.items) > BATCH_MAX_ITEMS:
+            raise ValueError(f"en fazla {BATCH_MAX_ITEMS} kalem gönderilebilir")
+        for idx, item in enumerate(req.items):
+            if item.method not in BATCH_BUILDERS and item.method not in BATCH_GROUP_BUILDERS:
+                raise ValueError(f"items[{idx}]: bilinmeyen method '{item.method}'")
+
+        group_idx = [i for i, item in enumerate(req.items) if item.method in BATCH_GROUP_BUILDERS]
+        signer_lists = await asyncio.gather(*(_batch_signers(i, req.items[i]) for i in group_idx))
+        signers_by_idx = dict(zip(group_idx, signer_lists))
+
+        base_sp = await sp_cache.get()
+        out = []
+        for idx, item in enumerate(req.items):
+            entry = {"method": item.method, "file_hash_hex": item.file_hash_hex}
+            try:
+                if idx in signers_by_idx:
+                    model, builder = BATCH_GROUP_BUILDERS[item.method]
+                    sub_req = model(sender=req.sender, file_hash_hex=item.file_hash_hex)
+                    txns = builder(sub_req, copy.copy(base_sp), signers_by_idx[idx])
+                    entry["unsigned_group_b64"] = _group_b64(txns)
+                    entry["txid"] = txns[0].get_txid()  # grup id atandıktan sonra
+                else:
+                    model, builder = BATCH_BUILDERS[item.method]
+                    sub_req = model(sender=req.sender, file_hash_hex=item.file_hash_hex)
+                    txn = builder(sub_req, copy.copy(base_sp))
+                    entry["txid"] = txn.get_txid()
+                    entry["unsigned_b64"] = encoding.msgpack_encode(txn)
+            except Exception as e:
+                raise ValueError(f"items[{idx}]: {e}")
+            out.append(entry)
 
-        unsigned_b64 = encoding.msgpack_encode(app_call)
         return {
-            "unsigned_b64": unsigned_b64,
-            "note": "Tek AppCall. Lute ile imzala; ardından /tx/submit veya /tx/submit_and_decode_uint64 kullan."
+            "items": out,
+            "note": "Kalemler birbirleriyle gruplanmaz; her biri ayrı imzalanıp /tx/submit ile gönderilmeli. reject kalemleri kendi grubunu [appcall, box_refs...] sırasıyla içerir.",
         }
 
     except Exception as e:
-        raise HTTPException(status_code=400, detail=f"build_reject error: {e}")
+        raise HTTPException(status_code=400, detail=f"build_batch error: {e}")
+
+
+# --- Simulate ile salt-okuma sorguları (imza / fee / blok beklemesi yok) ---
+# Txn.sender'a bağlı metodlar sender ister; diğerleri için fonlu app adresi sender olur
+QUERY_METHODS = {
+    "issign", "iscomplete", "get_asset_id", "is_active",
+    "total_signers", "signed_count", "my_contracts",
+}
+SENDER_BOUND_METHODS = {"issign", "my_contracts"}
+
+
+async def _simulate_call(method: str, sender: str, **args) -> Tuple[object, int]:
+    """
+    Metodu imzasız tek AppCall olarak simulate eder, ARC-4 dönüşünü ve round'u verir.
+    """
+    tpl = templates[method]
+    app_call = tpl.build(app_id, sender, await sp_cache.get(), **args)
+    request = algod_models.SimulateRequest(
+        txn_groups=[algod_models.SimulateRequestTransactionGroup(
+            txns=[transaction.SignedTransaction(app_call, None)]
+        )],
+        allow_empty_signatures=True,
+    )
+    res = await algod_client.simulate_transactions(request)
+    group = res["txn-groups"][0]
+    if group.get("failure-message"):
+        raise ValueError(f"simulate başarısız: {group['failure-message']}")
+    logs = group["txn-results"][0]["txn-result"].get("logs") or []
+    if not logs:
+        raise ValueError("simulate dönüş log'u üretmedi")
+    return tpl.decode_return(b64decode(logs[-1])), res.get("last-round")
+
+
+@app.post("/blocksign/query")
+async def blocksign_query(req: QueryRequest):
+    """
+    Salt-okuma metodlarını algod simulate ile çalıştırır (allow_empty_signatures).
+    - issign / my_contracts: sender zorunlu (Txn.sender'a göre cevap verir)
+    - my_contracts: hash'ler hex listesi olarak döner
+    - Diğerleri: uint64 değer
+    """
+    try:
+        if req.method not in QUERY_METHODS:
+            raise ValueError(f"desteklenmeyen method '{req.method}'")
+        if req.method in SENDER_BOUND_METHODS and not req.sender:
+            raise ValueError(f"{req.method} için sender zorunlu")
+        if req.sender and not encoding.is_valid_address(req.sender):
+            raise ValueError("geçersiz sender adresi")
+        sender = req.sender or get_application_address(app_id)
+
+        args = {}
+        if req.method != "my_contracts":
+            if not req.file_hash_hex:
+                raise ValueError("file_hash_hex zorunlu")
+            args["file_hash"] = _require_hash32(req.file_hash_hex)
+
+        value, last_round = await _simulate_call(req.method, sender, **args)
+        if req.method == "my_contracts":
+            value = [h.hex() for h in split_encoded_hashes(value)]
+
+        return {"method": req.method, "value": value, "round": last_round}
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"query error: {e}")
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"query error: {e}")
+
+
+# --- Doğrudan box okuma (round bazlı önbellekli durum) ---
+box_reader = BoxStateReader(algod_client, templates)
+
+
+@app.get("/blocksign/status/{file_hash_hex}")
+async def blocksign_status(file_hash_hex: str):
+    """
+    asa_, adm_, sgn_, sgh_, del_, cnt_ box'larını doğrudan okur ve çözer.
+    Aynı round içindeki tekrar eden istekler bellekten döner.
+    """
+    try:
+        fh = _require_hash32(file_hash_hex)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"status error: {e}")
+    try:
+        last_round = await sp_cache.last_round()
+        record = await box_reader.document(fh, last_round)
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"status error: {e}")
+    if not record["exists"]:
+        raise HTTPException(status_code=404, detail="hash bulunamadı")
+    return {**record, "round": last_round}
+
+
+@app.get("/blocksign/status/user/{address}")
+async def blocksign_user_status(address: str):
+    """
+    uhs_<address> box'ı: adresin oluşturduğu file hash'leri (hex listesi).
+    """
+    if not encoding.is_valid_address(address):
+        raise HTTPException(status_code=400, detail="status error: geçersiz adres")
+    try:
+        last_round = await sp_cache.last_round()
+        hashes = await box_reader.user_hashes(address, last_round)
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"status error: {e}")
+    return {"address": address, "file_hashes": hashes, "round": last_round}
+
+
+# --- Off-chain indeks üzerinden sayfalı listeler (keyset) ---
+PAGE_MAX = int(os.getenv("PAGE_MAX", 100))
+
+
+def _encode_cursor(last_id: int) -> str:
+    return base64.urlsafe_b64encode(str(last_id).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return int(base64.urlsafe_b64decode(padded).decode())
+    except Exception:
+        raise HTTPException(status_code=400, detail="geçersiz cursor")
+
+
+def _document_row(doc: Document) -> dict:
+    return {
+        "file_hash_hex": doc.file_hash,
+        "creator": doc.creator,
+        "asset_id": doc.asset_id,
+        "status": doc.status,
+        "created_round": doc.created_round,
+        "updated_round": doc.updated_round,
+    }
+
+
+def _page(docs: List[Document], limit: int) -> dict:
+    has_more = len(docs) > limit
+    docs = docs[:limit]
+    return {
+        "items": [_document_row(d) for d in docs],
+        "next_cursor": _encode_cursor(docs[-1].id) if has_more else None,
+    }
+
+
+@app.get("/blocksign/documents/created/{address}")
+async def documents_created(
+    address: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Adresin oluşturduğu belgeler, en yeniden eskiye.
+    Keyset: creator = ? AND id < cursor ORDER BY id DESC (ix_documents_creator_id)
+    """
+    limit = min(limit, PAGE_MAX)
+    after = _decode_cursor(cursor)
+    stmt = select(Document).where(Document.creator == address)
+    if after is not None:
+        stmt = stmt.where(Document.id < after)
+    stmt = stmt.order_by(Document.id.desc()).limit(limit + 1)
+    docs = (await db.execute(stmt)).scalars().all()
+    return _page(list(docs), limit)
+
+
+@app.get("/blocksign/documents/awaiting/{address}")
+async def documents_awaiting(
+    address: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Adresin sgn_ listesinde olup henüz imzalamadığı (sbm_ biti set olmayan) aktif belgeler.
+    Keyset: signer = ? AND signed_round IS NULL AND document_id < cursor
+            ORDER BY document_id DESC (ix_document_signers_signer_pending)
+    """
+    limit = min(limit, PAGE_MAX)
+    after = _decode_cursor(cursor)
+    stmt = (
+        select(Document)
+        .join(DocumentSigner, DocumentSigner.document_id == Document.id)
+        .where(
+            DocumentSigner.signer == address,
+            DocumentSigner.signed_round.is_(None),
+            Document.status == "active",
+        )
+    )
+    if after is not None:
+        stmt = stmt.where(DocumentSigner.document_id < after)
+    # (document_id, signer) tekil: DISTINCT gerekmez, sıralama indeksin kendisinden gelir
+    stmt = stmt.order_by(DocumentSigner.document_id.desc()).limit(limit + 1)
+    docs = list((await db.execute(stmt)).scalars().all())
+    return _page(docs, limit)
+
+
+# --- Sahipsiz yükleme temizliği ---
+# Tek bir süreçte çalışmalı: ya burada UPLOAD_GC_ENABLED=1 ile ya da ayrı `python upload_gc.py`.
+# Yalnızca yerel depoda çalışır; S3'te bucket lifecycle kuralları kullanılmalı.
+UPLOAD_GC_ENABLED = os.getenv("UPLOAD_GC_ENABLED", "0") == "1" and storage.kind == "local"
+upload_sweeper = UploadSweeper(algod_client, box_reader, UPLOAD_DIR)
+
+
+@app.on_event("startup")
+async def _start_upload_gc():
+    if UPLOAD_GC_ENABLED:
+        upload_sweeper.start()
+
+
+@app.on_event("shutdown")
+async def _stop_upload_gc():
+    await upload_sweeper.stop()
+
+
+@app.get("/uploads/gc")
+async def upload_gc_stats():
+    """Bu süreçteki süpürücünün geri kazandığı dosya/bayt ve son çalışma raporu."""
+    return {"enabled": UPLOAD_GC_ENABLED, **upload_sweeper.stats()}
+
+
+# --- Hazırlık (load balancer) ---
+READY_MAX_LOOP_LAG_MS = float(os.getenv("READY_MAX_LOOP_LAG_MS", 200))
+READY_MAX_THREAD_WAITING = int(os.getenv("READY_MAX_THREAD_WAITING", 20))
+READY_MAX_ROUND_LAG = int(os.getenv("READY_MAX_ROUND_LAG", 5))
+loop_lag = LoopLagMonitor()
+
+
+@app.on_event("startup")
+async def _start_loop_lag():
+    loop_lag.start()
+
+
+@app.on_event("shutdown")
+async def _stop_loop_lag():
+    await loop_lag.stop()
+
+
+@app.get("/ready")
+async def ready():
+    """
+    Sadece bellek içi sayaçlardan rapor; DB/algod'a yeni istek atmaz.
+    Eşik aşılırsa 503 döner (load balancer trafiği kesebilsin).
+    """
+    lag = loop_lag.snapshot()
+    threads = threadpool_stats()
+    db_pool = pool_stats(async_engine)
+    db_pool_sync = pool_stats(engine)
+
+    node_round = sp_cache.node_round
+    sp_round = sp_cache.params_round
+    algod_info = {
+        "node_round": node_round or None,
+        "params_round": sp_round,
+        "params_round_lag": (node_round - sp_round) if (node_round and sp_round) else None,
+        "params_age_s": seconds_since(sp_cache.fetched_at),
+        "indexer_round": block_indexer.last_round,
+        "indexer_round_lag": (
+            node_round - block_indexer.last_round
+            if (INDEXER_ENABLED and node_round and block_indexer.last_round) else None
+        ),
+    }
+    queues = {
+        "submit_queued": submit_queue.queued,
+        "submit_in_flight": submit_queue.in_flight,
+        "confirm_waiters": confirmations.pending_count,
+    }
+
+    reasons = []
+    if lag["max_ms"] > READY_MAX_LOOP_LAG_MS:
+        reasons.append("event_loop_lag")
+    if threads["starlette_waiting"] > READY_MAX_THREAD_WAITING:
+        reasons.append("threadpool_queue")
+    if db_pool["saturated"] or db_pool_sync["saturated"]:
+        reasons.append("db_pool_saturated")
+    if sp_round is None or (algod_info["params_age_s"] or 0) > SP_TTL_SECONDS * 3:
+        reasons.append("algod_params_stale")
+    if (algod_info["params_round_lag"] or 0) > READY_MAX_ROUND_LAG:
+        reasons.append("algod_round_lag")
+    if submit_queue.full:
+        reasons.append("submit_queue_full")
+
+    body = {
+        "ready": not reasons,
+        "reasons": reasons,
+        "event_loop_lag": lag,
+        "threadpool": threads,
+        "db_pool": {"async": db_pool, "sync": db_pool_sync},
+        "algod": algod_info,
+        "queues": queues,
+    }
+    return JSONResponse(body, status_code=200 if not reasons else 503)
+
+
+# --- Kapanış ---
+# Son kaydedilen shutdown hook'u: indexer, onay takipçisi ve GC durduktan sonra
+# paylaşılan algod istemcisi kapatılır (hook'lar kayıt sırasıyla çalışır).
+@app.on_event("shutdown")
+async def _close_algod_client():
+    await algod_client.aclose()
@@ -1,7 +1,97 @@
 # models.py
 
-from sqlalchemy import Column, Integer, String, TIMESTAMP, DateTime, DECIMAL, Text, Boolean
+from sqlalchemy import Column, Integer, BigInteger, String, TIMESTAMP, DateTime, DECIMAL, Text, Boolean, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.orm import relationship
 from database import Base
 from datetime import datetime
 import json
 
+
+# --- Zincir indeksi (indexer.py doldurur) ---
+class Document(Base):
+    """create_contract ile zincire yazılmış belge (file_hash başına tek satır)."""
+    __tablename__ = "documents"
+    __table_args__ = (
+        # "benim belgelerim": creator = ? ORDER BY id (keyset)
+        Index("ix_documents_creator_id", "creator", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    file_hash = Column(String(128), nullable=False, unique=True)  # hex
+    creator = Column(String(58), nullable=False)                  # Txn.sender
+    asset_id = Column(BigInteger, nullable=True)
+    status = Column(String(16), nullable=False, default="active")  # active | canceled | rejected
+    created_round = Column(BigInteger, nullable=False)
+    created_txid = Column(String(52), nullable=True)
+    updated_round = Column(BigInteger, nullable=False)
+
+    signers = relationship("DocumentSigner", back_populates="document", order_by="DocumentSigner.position")
+    events = relationship("SignatureEvent", back_populates="document", order_by="SignatureEvent.id")
+
+
+class DocumentSigner(Base):
+    """sgn_ blob'undaki yetkili imzacı (adres başına ilk sırası); imzaladıysa signed_round dolu."""
+    __tablename__ = "document_signers"
+    __table_args__ = (
+        UniqueConstraint("document_id", "position", name="uq_document_signers_doc_pos"),
+        # "imzamı bekleyenler": signer = ? AND signed_round IS NULL, document_id ile sıralı
+        Index("ix_document_signers_signer_pending", "signer", "signed_round", "document_id"),
+        # adres başına tek satır (tekrar edenler indexer'da ayıklanır); imza işlenirken de aranır
+        UniqueConstraint("document_id", "signer", name="uq_document_signers_doc_signer"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    document_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
+    signer = Column(String(58), nullable=False)
+    position = Column(Integer, nullable=False)  # sgn_ içindeki sıra
+    signed_round = Column(BigInteger, nullable=True)
+
+    document = relationship("Document", back_populates="signers")
+
+
+class SignatureEvent(Base):
+    """sign / reject / cancel çağrıları (zincirdeki sırayla)."""
+    __tablename__ = "signature_events"
+    __table_args__ = (
+        # belgenin imza geçmişi zincir sırasıyla
+        Index("ix_signature_events_doc_round", "document_id", "round", "id"),
+        Index("ix_signature_events_txid", "txid"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    document_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
+    kind = Column(String(16), nullable=False)   # sign | reject | cancel
+    actor = Column(String(58), nullable=False)  # Txn.sender
+    round = Column(BigInteger, nullable=False)
+    txid = Column(String(52), nullable=True)
+
+    document = relationship("Document", back_populates="events")
+
+
+class SyncCheckpoint(Base):
+    """Arka plan servislerinin işlediği son round (ör. name='indexer')."""
+    __tablename__ = "sync_checkpoints"
+
+    name = Column(String(32), primary_key=True)
+    last_round = Column(BigInteger, nullable=False)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+# --- Yüklenen dosyalar (upload_gc.py doldurur) ---
+class StoredFile(Base):
+    """UPLOAD_DIR'deki dosya ve zincirde çıpalanma durumu."""
+    __tablename__ = "stored_files"
+    __table_args__ = (
+        # süpürücünün aday sorgusu: status = ? AND checked_at < ?
+        Index("ix_stored_files_status_checked", "status", "checked_at"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    rel_path = Column(String(255), nullable=False, unique=True)  # UPLOAD_DIR'e göre
+    sha256 = Column(String(64), nullable=False)         # hex; raw CID digest'i ile aynı
+    unixfs_digest = Column(String(64), nullable=True)   # hex; UnixFS CIDv1 kök digest'i
+    size = Column(BigInteger, nullable=False)
+    stored_at = Column(DateTime, nullable=False)        # dosyanın mtime'ı
+    status = Column(String(16), nullable=False, default="pending")  # pending | anchored | removed
+    checked_at = Column(DateTime, nullable=True)
+    removed_at = Column(DateTime, nullable=True)
@@ -0,0 +1,106 @@
+# readiness.py
+#
+# /ready için bellek içi doygunluk ölçümleri. Hiçbiri yeni bağlantı açmaz:
+# - event loop gecikmesi (periyodik uyuyan task'ın ne kadar geç uyandığı)
+# - SQLAlchemy havuz sayaçları (checked-out / overflow)
+# - threadpool kuyruk derinliği (Starlette/anyio limiter + asyncio default executor)
+
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+import anyio.to_thread
+
+LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL", 0.5))
+# max_ms bu pencerede (saniye) görülen en yüksek gecikme; okuma sayaçları sıfırlamaz
+LOOP_LAG_WINDOW = float(os.getenv("LOOP_LAG_WINDOW", 30))
+
+
+class LoopLagMonitor:
+    """Her interval'de uyur; beklenenden geç uyanma süresi event loop gecikmesidir."""
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL, window: float = LOOP_LAG_WINDOW):
+        self._interval = interval
+        self.last_lag = 0.0
+        # son ~window saniyenin örnekleri; birden çok prob (liveness + LB) aynı pencereyi görür
+        self._samples: "deque[float]" = deque(maxlen=max(1, int(window / interval)))
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self._interval)
+            lag = max(0.0, loop.time() - start - self._interval)
+            self.last_lag = lag
+            self._samples.append(lag)
+
+    @property
+    def max_lag(self) -> float:
+        return max(self._samples, default=0.0)
+
+    def snapshot(self) -> Dict[str, float]:
+        return {"last_ms": round(self.last_lag * 1000, 2), "max_ms": round(self.max_lag * 1000, 2)}
+
+    def start(self):
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+def pool_stats(engine: Any) -> Dict[str, Any]:
+    """
+    Engine (sync ya da AsyncEngine) havuzunun sayaçları; bağlantı açmaz.
+    QueuePool'un public sayaçları kullanılır; başka havuz türlerinde sayaçlar boş döner.
+    """
+    pool = getattr(engine, "sync_engine", engine).pool
+    try:
+        size = pool.size()
+        checked_out = pool.checkedout()
+        overflow = pool.overflow()
+    except (AttributeError, NotImplementedError):
+        return {"status": pool.status(), "saturated": False}
+    out = {
+        "size": size,
+        "checked_out": checked_out,
+        "overflow": max(overflow, 0),
+        "saturated": False,
+    }
+    # max_overflow'un public karşılığı yok; bulunamazsa doygunluk hesaplanmaz
+    max_overflow = getattr(pool, "_max_overflow", None)
+    if isinstance(max_overflow, int):
+        out["max_overflow"] = max_overflow
+        out["saturated"] = max_overflow >= 0 and checked_out >= size + max_overflow
+    return out
+
+
+def threadpool_stats() -> Dict[str, Any]:
+    """Event loop içinden çağrılmalı."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    stats = limiter.statistics()
+    out = {
+        "starlette_busy": stats.borrowed_tokens,
+        "starlette_limit": int(limiter.total_tokens),
+        "starlette_waiting": stats.tasks_waiting,
+    }
+    # asyncio.to_thread (indexer DB yazımı vb.) default executor'ı kullanır; public API'si yok,
+    # iç alanlar değişirse sayaç None döner
+    try:
+        out["executor_queue"] = asyncio.get_running_loop()._default_executor._work_queue.qsize()
+    except AttributeError:
+        out["executor_queue"] = None
+    return out
+
+
+def seconds_since(ts: float) -> Optional[float]:
+    return round(time.monotonic() - ts, 2) if ts else None
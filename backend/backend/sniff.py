@@ -0,0 +1,62 @@
+# sniff.py
+#
+# Yükleme akışında PDF içerik kontrolü; dosyayı bellekte tutmadan.
+# - Başlık: ilk PDF_HEADER_WINDOW bayt içinde "%PDF-<major>.<minor>" ve ardından satır sonu/boşluk
+#   (ilk parça gelir gelmez, diske yazılmadan önce reddedilir)
+# - Sonek (isteğe bağlı): son PDF_TAIL_WINDOW bayt içinde "startxref" ve "%%EOF"
+#   (yalnızca son PDF_TAIL_WINDOW bayt saklanır)
+
+import re
+
+PDF_HEADER_WINDOW = 1024
+PDF_TAIL_WINDOW = 2048
+_HEADER_RE = re.compile(rb"%PDF-([12])\.(\d)[\s%]")
+
+
+class SniffError(ValueError):
+    pass
+
+
+class PdfSniffer:
+    def __init__(self, check_trailer: bool = True):
+        self._check_trailer = check_trailer
+        self._head = bytearray()
+        self.header_ok = False
+        self.version = None
+        self._tail = b""
+
+    def _check_header(self, final: bool):
+        head = bytes(self._head)
+        idx = head.find(b"%PDF-")
+        if idx < 0:
+            if final or len(head) >= PDF_HEADER_WINDOW:
+                raise SniffError("%PDF- imzası bulunamadı")
+            return
+        m = _HEADER_RE.match(head, idx)
+        if m is None:
+            # sürüm + ayraç için en fazla 4 bayt daha gerekir
+            if not final and len(head) < idx + 9:
+                return
+            raise SniffError("PDF başlığı bozuk")
+        self.header_ok = True
+        self.version = f"{m.group(1).decode()}.{m.group(2).decode()}"
+        self._head = bytearray()
+
+    def feed(self, chunk: bytes):
+        """Başlık geçersizse bu parça yazılmadan SniffError fırlatır."""
+        if not self.header_ok:
+            need = PDF_HEADER_WINDOW - len(self._head)
+            if need > 0:
+                self._head += chunk[:need]
+            self._check_header(final=False)
+        if self._check_trailer:
+            self._tail = (self._tail + chunk[-PDF_TAIL_WINDOW:])[-PDF_TAIL_WINDOW:]
+
+    def finish(self):
+        if not self.header_ok:
+            self._check_header(final=True)
+        if self._check_trailer:
+            if b"%%EOF" not in self._tail:
+                raise SniffError("%%EOF işareti bulunamadı (dosya kesilmiş olabilir)")
+            if b"startxref" not in self._tail:
+                raise SniffError("startxref bulunamadı")
@@ -0,0 +1,349 @@
+# storage.py
+#
+# Yüklenen dosyaların saklandığı yer; anahtar (key) her zaman "ab/cd/<sha256>.pdf" ya da
+# "<uuid>.pdf" gibi göreli bir yoldur.
+# - LocalStorage: UPLOAD_DIR altında; yazım .incoming'e, commit'te hard link ile yerine
+# - S3Storage:    S3 uyumlu nesne deposu (AWS S3, MinIO). Parçalar geldikçe multipart upload'a
+#                 gönderilir; indirmeler presigned URL'e yönlendirilir. boto3 yalnızca bu
+#                 backend seçilirse import edilir.
+#
+# Her iki backend'in sink'i aynı akışı izler:
+#   sink.write(chunk)* -> sink.finish() -> sink.commit(key)   (hata olursa sink.abort())
+# commit, key zaten varsa yazılanı atar ve True döner (içerik adresli tekilleştirme).
+
+import asyncio
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from upload_writer import PipelinedWriter, copy_fd
+
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "local").lower()  # local | s3
+S3_BUCKET = os.getenv("S3_BUCKET", "blocksign-uploads")
+S3_PREFIX = os.getenv("S3_PREFIX", "")
+S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT_URL") or None  # MinIO: http://minio:9000
+# Tarayıcının eriştiği adres farklıysa (docker içi minio:9000 vs dışarıdan localhost:9000)
+S3_PUBLIC_ENDPOINT_URL = os.getenv("S3_PUBLIC_ENDPOINT_URL") or None
+S3_REGION = os.getenv("S3_REGION", "us-east-1")
+S3_ACCESS_KEY_ID = os.getenv("S3_ACCESS_KEY_ID") or None  # boş: boto3'ün varsayılan zinciri
+S3_SECRET_ACCESS_KEY = os.getenv("S3_SECRET_ACCESS_KEY") or None
+S3_PART_SIZE = max(int(os.getenv("S3_PART_SIZE", 8 * 1024 * 1024)), 5 * 1024 * 1024)  # S3 alt sınırı 5 MB
+S3_UPLOAD_CONCURRENCY = int(os.getenv("S3_UPLOAD_CONCURRENCY", 4))
+S3_PRESIGN_TTL = int(os.getenv("S3_PRESIGN_TTL", 300))
+
+
+# --- Yerel dosya sistemi ---
+class LocalSink(PipelinedWriter):
+    def __init__(self, storage: "LocalStorage", hashers: Sequence[Any] = ()):
+        super().__init__(storage.incoming / f"{uuid.uuid4().hex}.part", hashers)
+        self._storage = storage
+
+    async def write(self, chunk: bytes):
+        if self._out is None:
+            await self.open()
+        await super().write(chunk)
+
+    async def finish(self):
+        if self._out is None:
+            await self.open()  # boş dosya
+        await self.close()
+
+    async def commit(self, key: str) -> bool:
+        try:
+            return await asyncio.to_thread(self._storage.link_into_place, self.path, key)
+        except BaseException:
+            self.path.unlink(missing_ok=True)
+            raise
+
+
+class LocalStorage:
+    kind = "local"
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.incoming = root / ".incoming"  # hash'i henüz bilinmeyen yarım yüklemeler
+        self.incoming.mkdir(parents=True, exist_ok=True)
+
+    def path(self, key: str) -> Path:
+        return self.root / key
+
+    def sink(self, hashers: Sequence[Any] = (), content_type: Optional[str] = None) -> LocalSink:
+        return LocalSink(self, hashers)
+
+    def link_into_place(self, tmp_path: Path, key: str) -> bool:
+        """
+        Geçici dosyayı key'e taşır (thread'de çalışır).
+        Aynı key zaten varsa geçici dosya silinir ve True döner.
+        """
+        final_path = self.path(key)
+        final_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            # link üzerine yazmaz: eşzamanlı iki aynı yüklemeden biri kazanır
+            os.link(tmp_path, final_path)
+            existed = False
+        except FileExistsError:
+            existed = True
+            os.utime(final_path)  # upload GC saklama süresi yeniden başlasın
+        except OSError:
+            # hard link desteklemeyen dosya sistemi
+            existed = final_path.exists()
+            if not existed:
+                os.replace(tmp_path, final_path)
+                return False
+        tmp_path.unlink(missing_ok=True)
+        return existed
+
+    def _touch(self, key: str) -> bool:
+        try:
+            os.utime(self.path(key))
+            return True
+        except FileNotFoundError:
+            return False
+
+    async def exists(self, key: str) -> bool:
+        """Varsa mtime'ı da tazeler (upload GC için)."""
+        return await asyncio.to_thread(self._touch, key)
+
+    def _put_fd(self, fd: int, size: int, key: str) -> bool:
+        tmp_path = self.incoming / f"{uuid.uuid4().hex}.part"
+        copy_fd(fd, tmp_path, size)
+        try:
+            return self.link_into_place(tmp_path, key)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    async def put_fd(self, fd: int, size: int, key: str, content_type: Optional[str] = None) -> bool:
+        """Diskteki bir dosyanın ilk size baytını key'e çekirdek içinde kopyalar."""
+        return await asyncio.to_thread(self._put_fd, fd, size, key)
+
+    async def delete(self, key: str):
+        await asyncio.to_thread(self.path(key).unlink, True)
+
+
+# --- S3 uyumlu nesne deposu ---
+class S3Sink:
+    """
+    Parçaları S3_PART_SIZE'lık bloklara toplayıp multipart upload'a gönderir;
+    en fazla S3_UPLOAD_CONCURRENCY blok aynı anda yüklenir (geri basınç).
+    Hash'leme ve tamponlama thread'de yapılır. Tek bloğa sığan dosya commit'te tek PUT'tur.
+    """
+
+    def __init__(self, storage: "S3Storage", hashers: Sequence[Any] = (), content_type: Optional[str] = None):
+        self._storage = storage
+        self._hashers: List[Any] = list(hashers)
+        self._content_type = content_type or "application/octet-stream"
+        self._tmp_key = f".incoming/{uuid.uuid4().hex}"
+        self._buf = bytearray()
+        self._upload_id: Optional[str] = None
+        self._tasks: List[asyncio.Task] = []
+        self._etags: Dict[int, str] = {}
+        self._sem = asyncio.Semaphore(storage.concurrency)
+        self.size = 0
+
+    def _absorb(self, chunk: bytes):
+        for h in self._hashers:
+            h.update(chunk)
+        self._buf += chunk
+
+    async def _upload_part(self, number: int, data: bytes):
+        try:
+            res = await asyncio.to_thread(
+                self._storage.client.upload_part,
+                Bucket=self._storage.bucket,
+                Key=self._storage.full_key(self._tmp_key),
+                UploadId=self._upload_id,
+                PartNumber=number,
+                Body=data,
+            )
+            self._etags[number] = res["ETag"]
+        finally:
+            self._sem.release()
+
+    async def _queue_part(self, data: bytes):
+        if self._upload_id is None:
+            res = await asyncio.to_thread(
+                self._storage.client.create_multipart_upload,
+                Bucket=self._storage.bucket,
+                Key=self._storage.full_key(self._tmp_key),
+                ContentType=self._content_type,
+            )
+            self._upload_id = res["UploadId"]
+        await self._sem.acquire()
+        # önceki bir blok hata verdiyse erken dur
+        for t in self._tasks:
+            if t.done() and t.exception() is not None:
+                self._sem.release()
+                raise t.exception()
+        self._tasks.append(asyncio.create_task(self._upload_part(len(self._tasks) + 1, data)))
+
+    async def write(self, chunk: bytes):
+        self.size += len(chunk)
+        await asyncio.to_thread(self._absorb, chunk)
+        part_size = self._storage.part_size
+        while len(self._buf) >= part_size:
+            data = bytes(self._buf[:part_size])
+            del self._buf[:part_size]
+            await self._queue_part(data)
+
+    async def finish(self):
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def commit(self, key: str) -> bool:
+        st = self._storage
+        try:
+            if await st.exists(key):
+                await self.abort()
+                return True
+            if self._upload_id is None:
+                await asyncio.to_thread(
+                    st.client.put_object,
+                    Bucket=st.bucket, Key=st.full_key(key), Body=bytes(self._buf), ContentType=self._content_type,
+                )
+                return False
+
+            if self._buf:
+                await self._queue_part(bytes(self._buf))
+                self._buf.clear()
+            await asyncio.gather(*self._tasks)
+            tmp = st.full_key(self._tmp_key)
+            await asyncio.to_thread(
+                st.client.complete_multipart_upload,
+                Bucket=st.bucket,
+                Key=tmp,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": [
+                    {"PartNumber": n, "ETag": self._etags[n]} for n in sorted(self._etags)
+                ]},
+            )
+            self._upload_id = None
+            # key multipart başlarken bilinmiyordu (hash sonda çıkar): sunucu tarafı kopya
+            await asyncio.to_thread(
+                st.client.copy_object,
+                Bucket=st.bucket, Key=st.full_key(key), CopySource={"Bucket": st.bucket, "Key": tmp},
+            )
+            await asyncio.to_thread(st.client.delete_object, Bucket=st.bucket, Key=tmp)
+            return False
+        except BaseException:
+            await self.abort()
+            raise
+
+    async def abort(self):
+        for t in self._tasks:
+            t.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._buf.clear()
+        if self._upload_id is not None:
+            upload_id, self._upload_id = self._upload_id, None
+            try:
+                await asyncio.to_thread(
+                    self._storage.client.abort_multipart_upload,
+                    Bucket=self._storage.bucket,
+                    Key=self._storage.full_key(self._tmp_key),
+                    UploadId=upload_id,
+                )
+            except Exception:
+                pass  # bucket lifecycle kuralı (AbortIncompleteMultipartUpload) toplar
+
+
+class S3Storage:
+    kind = "s3"
+
+    def __init__(
+        self,
+        bucket: str = S3_BUCKET,
+        prefix: str = S3_PREFIX,
+        endpoint_url: Optional[str] = S3_ENDPOINT_URL,
+        public_endpoint_url: Optional[str] = S3_PUBLIC_ENDPOINT_URL,
+        region: str = S3_REGION,
+        part_size: int = S3_PART_SIZE,
+        concurrency: int = S3_UPLOAD_CONCURRENCY,
+        presign_ttl: int = S3_PRESIGN_TTL,
+    ):
+        try:
+            import boto3
+            from botocore.config import Config
+        except ImportError as e:
+            raise RuntimeError("STORAGE_BACKEND=s3 için boto3 kurulu olmalı (pip install boto3)") from e
+
+        config = Config(
+            signature_version="s3v4",
+            # MinIO ve çoğu S3 uyumlu sunucu path-style ister
+            s3={"addressing_style": "path"} if endpoint_url else {},
+            max_pool_connections=max(10, concurrency * 4),
+        )
+        creds = dict(
+            aws_access_key_id=S3_ACCESS_KEY_ID,
+            aws_secret_access_key=S3_SECRET_ACCESS_KEY,
+            region_name=region,
+            config=config,
+        )
+        self.client = boto3.client("s3", endpoint_url=endpoint_url, **creds)
+        # presign yerel hesaplamadır; URL tarayıcının eriştiği adresle imzalanmalı
+        self._presigner = (
+            boto3.client("s3", endpoint_url=public_endpoint_url, **creds)
+            if public_endpoint_url else self.client
+        )
+        self.bucket = bucket
+        self.prefix = prefix.strip("/") + "/" if prefix.strip("/") else ""
+        self.part_size = part_size
+        self.concurrency = concurrency
+        self.presign_ttl = presign_ttl
+
+    def full_key(self, key: str) -> str:
+        return self.prefix + key
+
+    def sink(self, hashers: Sequence[Any] = (), content_type: Optional[str] = None) -> S3Sink:
+        return S3Sink(self, hashers, content_type)
+
+    def _head(self, key: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self.full_key(key))
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+
+    async def exists(self, key: str) -> bool:
+        return await asyncio.to_thread(self._head, key)
+
+    def _put_fd(self, fd: int, size: int, key: str, content_type: Optional[str]):
+        from boto3.s3.transfer import TransferConfig
+
+        with os.fdopen(os.dup(fd), "rb") as f:
+            f.seek(0)
+            self.client.upload_fileobj(
+                f, self.bucket, self.full_key(key),
+                ExtraArgs={"ContentType": content_type or "application/octet-stream"},
+                Config=TransferConfig(
+                    multipart_threshold=self.part_size,
+                    multipart_chunksize=self.part_size,
+                    max_concurrency=self.concurrency,
+                ),
+            )
+
+    async def put_fd(self, fd: int, size: int, key: str, content_type: Optional[str] = None) -> bool:
+        """Hash önceden bilindiği için doğrudan hedef key'e (gerekirse multipart) yükler."""
+        await asyncio.to_thread(self._put_fd, fd, size, key, content_type)
+        return False
+
+    async def delete(self, key: str):
+        await asyncio.to_thread(self.client.delete_object, Bucket=self.bucket, Key=self.full_key(key))
+
+    def presigned_url(self, key: str, filename: Optional[str] = None) -> str:
+        params = {"Bucket": self.bucket, "Key": self.full_key(key)}
+        if filename:
+            params["ResponseContentDisposition"] = f'inline; filename="{filename}"'
+        return self._presigner.generate_presigned_url("get_object", Params=params, ExpiresIn=self.presign_ttl)
+
+
+def storage_from_env(upload_dir: Path):
+    if STORAGE_BACKEND == "s3":
+        return S3Storage()
+    return LocalStorage(upload_dir)
@@ -0,0 +1,136 @@
+# submit_queue.py
+#
+# /tx/submit ile algod arasında süreç içi gönderim hattı:
+# - txid / group id ile tekilleştirme (tekrar tıklamalar yeniden yayınlanmaz)
+# - node'a giden eşzamanlı gönderim sayısı sınırlı
+# - geçici hatalarda (bağlantı, 5xx, 429, havuz dolu) üstel geri çekilmeyle yeniden deneme
+# - kuyruk doluysa QueueFull (endpoint 429 + Retry-After döner)
+
+import asyncio
+import os
+import time
+from typing import Dict, Tuple
+
+from algosdk.error import AlgodHTTPError
+
+from algod_async import AsyncAlgodClient
+
+SUBMIT_CONCURRENCY = int(os.getenv("SUBMIT_CONCURRENCY", 16))
+SUBMIT_QUEUE_MAX = int(os.getenv("SUBMIT_QUEUE_MAX", 1000))
+SUBMIT_RETRIES = int(os.getenv("SUBMIT_RETRIES", 3))
+SUBMIT_BACKOFF_SECONDS = float(os.getenv("SUBMIT_BACKOFF_SECONDS", 0.5))
+SUBMIT_DEDUP_TTL = float(os.getenv("SUBMIT_DEDUP_TTL", 300))
+SUBMIT_RETRY_AFTER = int(os.getenv("SUBMIT_RETRY_AFTER", 2))
+
+# algod bu mesajlarla dönerse işlem zaten ağda/havuzda: başarı say
+_ALREADY_SUBMITTED = ("already in ledger", "already in pool", "transaction already")
+# havuz dolu vb. geçici durumlar
+_TRANSIENT_MESSAGES = ("pool is full", "transaction pool is full", "timeout")
+
+
+class QueueFull(Exception):
+    def __init__(self, retry_after: int = SUBMIT_RETRY_AFTER):
+        super().__init__("gönderim kuyruğu dolu")
+        self.retry_after = retry_after
+
+
+class SubmitRetriesExhausted(Exception):
+    pass
+
+
+def _is_transient(e: AlgodHTTPError) -> bool:
+    if e.code is None or e.code == 429 or e.code >= 500:
+        return True
+    msg = str(e).lower()
+    return any(m in msg for m in _TRANSIENT_MESSAGES)
+
+
+def _is_already_submitted(e: AlgodHTTPError) -> bool:
+    msg = str(e).lower()
+    return any(m in msg for m in _ALREADY_SUBMITTED)
+
+
+class SubmissionQueue:
+    def __init__(
+        self,
+        client: AsyncAlgodClient,
+        concurrency: int = SUBMIT_CONCURRENCY,
+        max_queue: int = SUBMIT_QUEUE_MAX,
+        retries: int = SUBMIT_RETRIES,
+        backoff: float = SUBMIT_BACKOFF_SECONDS,
+        dedup_ttl: float = SUBMIT_DEDUP_TTL,
+    ):
+        self._client = client
+        self._sem = asyncio.Semaphore(concurrency)
+        self._max_queue = max_queue
+        self._retries = retries
+        self._backoff = backoff
+        self._dedup_ttl = dedup_ttl
+        # dedup key -> (future, bitiş zamanı; in-flight için inf)
+        self._seen: Dict[str, Tuple[asyncio.Future, float]] = {}
+        self._queued = 0
+        self.in_flight = 0
+        self.deduplicated = 0
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    @property
+    def full(self) -> bool:
+        return self._queued >= self._max_queue
+
+    def _prune(self):
+        now = time.monotonic()
+        for k in [k for k, (_, exp) in self._seen.items() if exp < now]:
+            del self._seen[k]
+
+    async def submit(self, raw: bytes, dedup_key: str, txid: str) -> str:
+        """
+        raw: imzalı grup baytları, dedup_key: group id (b64) ya da tek işlemde txid.
+        Aynı key daha önce gönderildiyse/gönderiliyorsa aynı sonucu döner.
+        """
+        self._prune()
+        entry = self._seen.get(dedup_key)
+        if entry is not None:
+            self.deduplicated += 1
+            return await asyncio.shield(entry[0])
+
+        if self.full:
+            raise QueueFull()
+
+        fut = asyncio.get_running_loop().create_future()
+        self._seen[dedup_key] = (fut, float("inf"))
+        self._queued += 1
+        try:
+            result = await self._send(raw, txid)
+        except BaseException as e:
+            # başarısız gönderim tekrar denenebilsin
+            self._seen.pop(dedup_key, None)
+            fut.set_exception(e)
+            fut.exception()
+            raise
+        finally:
+            self._queued -= 1
+        self._seen[dedup_key] = (fut, time.monotonic() + self._dedup_ttl)
+        fut.set_result(result)
+        return result
+
+    async def _send(self, raw: bytes, txid: str) -> str:
+        attempt = 0
+        while True:
+            async with self._sem:
+                self.in_flight += 1
+                try:
+                    return await self._client.send_raw_transaction(raw)
+                except AlgodHTTPError as e:
+                    if _is_already_submitted(e):
+                        return txid
+                    if not _is_transient(e):
+                        raise
+                    if attempt >= self._retries:
+                        raise SubmitRetriesExhausted(f"{attempt + 1} denemede gönderilemedi: {e}") from e
+                finally:
+                    self.in_flight -= 1
+            await asyncio.sleep(self._backoff * (2 ** attempt))
+            attempt += 1
@@ -0,0 +1,347 @@
+# upload_gc.py
+#
+# UPLOAD_DIR'deki sahipsiz dosyaları temizleyen arka plan süpürücüsü.
+# - Dizin taranır, yeni dosyalar stored_files tablosuna (sha256 + UnixFS CID digest'i) eklenir
+# - Saklama süresini (UPLOAD_GC_RETENTION) aşan dosyaların zincir durumu box'lardan toplu okunur
+#   (asa_ var ve del_ != 1 ise çıpalanmış); çıpalanmışlar UPLOAD_GC_RECHECK'te bir yeniden denetlenir
+# - Hiç create_contract görmemiş ya da iptal/ret edilmiş dosyalar silinir veya arşivlenir
+# - Süresi geçmiş .incoming geçici dosyaları ve yükleme oturumları da temizlenir
+#
+# Tek bir süreçte çalışmalı: API içinde UPLOAD_GC_ENABLED=1 ya da ayrı `python upload_gc.py`.
+
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import or_
+
+from box_reader import BoxStateReader
+from algod_async import AsyncAlgodClient
+from cid import UnixFSCidHasher
+from database import Base, SessionLocal
+from models import StoredFile
+from upload_writer import hash_fd
+
+UPLOAD_GC_INTERVAL = float(os.getenv("UPLOAD_GC_INTERVAL", 3600))
+UPLOAD_GC_RETENTION = float(os.getenv("UPLOAD_GC_RETENTION", 7 * 86400))
+UPLOAD_GC_RECHECK = float(os.getenv("UPLOAD_GC_RECHECK", 86400))
+UPLOAD_GC_BATCH = int(os.getenv("UPLOAD_GC_BATCH", 50))
+UPLOAD_GC_ACTION = os.getenv("UPLOAD_GC_ACTION", "archive").lower()  # archive | delete
+UPLOAD_GC_ARCHIVE_DIR = Path(os.getenv("UPLOAD_GC_ARCHIVE_DIR", "uploads_archive"))
+UPLOAD_SESSION_TTL = float(os.getenv("UPLOAD_SESSION_TTL", 86400))
+
+logger = logging.getLogger(__name__)
+
+
+def _digests(path: Path) -> Tuple[str, str]:
+    """Dosyayı bir kez okuyup (sha256, UnixFS CID digest) hex döner."""
+    sha = hashlib.sha256()
+    unixfs = UnixFSCidHasher()
+    with path.open("rb") as f:
+        hash_fd(f.fileno(), [sha, unixfs])
+    return sha.hexdigest(), unixfs.cid()[1].hex()
+
+
+class UploadSweeper:
+    def __init__(
+        self,
+        client: AsyncAlgodClient,
+        reader: BoxStateReader,
+        upload_dir: Path,
+        session_factory=SessionLocal,
+        interval: float = UPLOAD_GC_INTERVAL,
+        retention: float = UPLOAD_GC_RETENTION,
+        recheck: float = UPLOAD_GC_RECHECK,
+        batch: int = UPLOAD_GC_BATCH,
+        action: str = UPLOAD_GC_ACTION,
+        archive_dir: Path = UPLOAD_GC_ARCHIVE_DIR,
+    ):
+        self._client = client
+        self._reader = reader
+        self._upload_dir = upload_dir
+        self._session_factory = session_factory
+        self._interval = interval
+        self._retention = retention
+        self._recheck = recheck
+        self._batch = batch
+        self._action = action
+        self._archive_dir = archive_dir
+        self._task: Optional[asyncio.Task] = None
+        # süreç ömrü boyunca toplamlar
+        self.reclaimed_bytes = 0
+        self.reclaimed_files = 0
+        self.last_run: Optional[Dict[str, Any]] = None
+
+    # --- dosya sistemi ---
+    def _scan(self) -> Dict[str, os.stat_result]:
+        """Gizli (.incoming vb.) dizinler hariç tüm dosyalar: rel_path -> stat."""
+        out: Dict[str, os.stat_result] = {}
+        if not self._upload_dir.is_dir():
+            return out
+        stack = [self._upload_dir]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    elif entry.is_file(follow_symlinks=False):
+                        rel = Path(entry.path).relative_to(self._upload_dir).as_posix()
+                        out[rel] = entry.stat(follow_symlinks=False)
+        return out
+
+    def _remove(self, rel_path: str):
+        path = self._upload_dir / rel_path
+        if self._action == "delete":
+            path.unlink(missing_ok=True)
+            return
+        dest = self._archive_dir / rel_path
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(path), str(dest))
+
+    def _clean_incoming(self, now: float) -> Tuple[int, int]:
+        """Süresi dolmuş yarım yüklemeler ve oturumlar: (dosya, bayt)."""
+        incoming = self._upload_dir / ".incoming"
+        files = size = 0
+        if not incoming.is_dir():
+            return 0, 0
+        for entry in incoming.iterdir():
+            try:
+                if entry.is_dir():
+                    if entry.name != "sessions":
+                        continue
+                    for sdir in entry.iterdir():
+                        meta = sdir / "session.json"
+                        mtime = meta.stat().st_mtime if meta.exists() else sdir.stat().st_mtime
+                        if now - mtime < UPLOAD_SESSION_TTL:
+                            continue
+                        parts = [p for p in sdir.iterdir() if p.is_file()]
+                        size += sum(p.stat().st_size for p in parts)
+                        files += len(parts)
+                        shutil.rmtree(sdir, ignore_errors=True)
+                elif now - entry.stat().st_mtime >= UPLOAD_SESSION_TTL:
+                    size += entry.stat().st_size
+                    files += 1
+                    entry.unlink(missing_ok=True)
+            except FileNotFoundError:
+                continue
+        return files, size
+
+    # --- DB ---
+    def _ensure_schema(self):
+        # enjekte edilen session factory'nin engine'i (testler / farklı DSN)
+        with self._session_factory() as db:
+            Base.metadata.create_all(bind=db.get_bind(), tables=[StoredFile.__table__])
+
+    def _sync_index(self) -> int:
+        """Diskteki yeni dosyaları ekler, kaybolanları removed işaretler; eklenen sayısını döner."""
+        on_disk = self._scan()
+        added = 0
+        with self._session_factory() as db:
+            with db.begin():
+                rows = db.query(StoredFile.id, StoredFile.rel_path, StoredFile.status).all()
+                known = {r.rel_path: r for r in rows}
+                for rel, st in on_disk.items():
+                    row = known.get(rel)
+                    if row is not None and row.status != "removed":
+                        continue
+                    try:
+                        sha256, unixfs = _digests(self._upload_dir / rel)
+                    except FileNotFoundError:
+                        continue
+                    if row is not None:
+                        # silinen dosya aynı adla geri geldi
+                        db.query(StoredFile).filter_by(id=row.id).update({
+                            "sha256": sha256, "unixfs_digest": unixfs, "size": st.st_size,
+                            "stored_at": datetime.utcfromtimestamp(st.st_mtime),
+                            "status": "pending", "checked_at": None, "removed_at": None,
+                        })
+                    else:
+                        db.add(StoredFile(
+                            rel_path=rel, sha256=sha256, unixfs_digest=unixfs, size=st.st_size,
+                            stored_at=datetime.utcfromtimestamp(st.st_mtime), status="pending",
+                        ))
+                    added += 1
+                gone = [r.id for rel, r in known.items() if r.status != "removed" and rel not in on_disk]
+                if gone:
+                    db.query(StoredFile).filter(StoredFile.id.in_(gone)).update(
+                        {"status": "removed", "removed_at": datetime.utcnow()}, synchronize_session=False,
+                    )
+        return added
+
+    def _candidates(self, now: datetime) -> List[StoredFile]:
+        old = now - timedelta(seconds=self._retention)
+        stale = now - timedelta(seconds=self._recheck)
+        with self._session_factory() as db:
+            # checked_at < now: bu süpürmede zaten bakılanlar tekrar gelmez
+            pending = (
+                db.query(StoredFile)
+                .filter(
+                    StoredFile.status == "pending",
+                    StoredFile.stored_at < old,
+                    or_(StoredFile.checked_at.is_(None), StoredFile.checked_at < now),
+                )
+                .order_by(StoredFile.id)
+                .limit(self._batch)
+                .all()
+            )
+            anchored = (
+                db.query(StoredFile)
+                .filter(StoredFile.status == "anchored", StoredFile.checked_at < stale)
+                .order_by(StoredFile.checked_at)
+                .limit(max(self._batch - len(pending), 0))
+                .all()
+            )
+            db.expunge_all()
+        return pending + anchored
+
+    def _apply(self, anchored: List[int], orphans: List[StoredFile], now: datetime) -> Tuple[int, int]:
+        files = size = 0
+        cutoff = time.time() - self._retention
+        with self._session_factory() as db:
+            with db.begin():
+                if anchored:
+                    db.query(StoredFile).filter(StoredFile.id.in_(anchored)).update(
+                        {"status": "anchored", "checked_at": now}, synchronize_session=False,
+                    )
+                for row in orphans:
+                    path = self._upload_dir / row.rel_path
+                    try:
+                        st = path.stat()
+                    except FileNotFoundError:
+                        db.query(StoredFile).filter_by(id=row.id).update({"status": "removed", "removed_at": now})
+                        continue
+                    if st.st_mtime > cutoff:
+                        # aynı içerik yakın zamanda tekrar yüklendi (dedup mtime'ı tazeler)
+                        db.query(StoredFile).filter_by(id=row.id).update({
+                            "status": "pending", "checked_at": now,
+                            "stored_at": datetime.utcfromtimestamp(st.st_mtime),
+                        })
+                        continue
+                    try:
+                        self._remove(row.rel_path)
+                    except OSError:
+                        logger.exception("upload gc: %s kaldırılamadı", row.rel_path)
+                        db.query(StoredFile).filter_by(id=row.id).update({"checked_at": now})
+                        continue
+                    db.query(StoredFile).filter_by(id=row.id).update(
+                        {"status": "removed", "checked_at": now, "removed_at": now}
+                    )
+                    files += 1
+                    size += st.st_size
+        return files, size
+
+    # --- zincir ---
+    async def _is_anchored(self, row: StoredFile, last_round: int) -> bool:
+        for digest in filter(None, (row.sha256, row.unixfs_digest)):
+            if await self._reader.anchored(bytes.fromhex(digest), last_round):
+                return True
+        return False
+
+    # --- süpürme ---
+    async def sweep_once(self) -> Dict[str, Any]:
+        started = time.monotonic()
+        now = datetime.utcnow().replace(microsecond=0)  # MySQL DATETIME saniye hassasiyetinde
+        await asyncio.to_thread(self._ensure_schema)
+        indexed = await asyncio.to_thread(self._sync_index)
+        tmp_files, tmp_bytes = await asyncio.to_thread(self._clean_incoming, time.time())
+
+        checked = kept = files = size = 0
+        last_round = (await self._client.status())["last-round"]
+        while True:
+            rows = await asyncio.to_thread(self._candidates, now)
+            if not rows:
+                break
+            flags = await asyncio.gather(*(self._is_anchored(r, last_round) for r in rows))
+            anchored = [r.id for r, ok in zip(rows, flags) if ok]
+            orphans = [r for r, ok in zip(rows, flags) if not ok]
+            f, b = await asyncio.to_thread(self._apply, anchored, orphans, now)
+            checked += len(rows)
+            kept += len(anchored)
+            files += f
+            size += b
+            if len(rows) < self._batch:
+                break
+
+        self.reclaimed_files += files + tmp_files
+        self.reclaimed_bytes += size + tmp_bytes
+        self.last_run = {
+            "at": now.isoformat() + "Z",
+            "duration_s": round(time.monotonic() - started, 2),
+            "indexed": indexed,
+            "checked": checked,
+            "anchored": kept,
+            "removed_files": files,
+            "removed_bytes": size,
+            "incoming_files": tmp_files,
+            "incoming_bytes": tmp_bytes,
+            "action": self._action,
+        }
+        if files or tmp_files:
+            logger.info(
+                "upload gc: %s dosya (%s bayt) %s, %s geçici dosya (%s bayt) silindi",
+                files, size, self._action, tmp_files, tmp_bytes,
+            )
+        return self.last_run
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "reclaimed_files": self.reclaimed_files,
+            "reclaimed_bytes": self.reclaimed_bytes,
+            "last_run": self.last_run,
+        }
+
+    async def _run(self):
+        while True:
+            try:
+                await self.sweep_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("upload gc hatası")
+            await asyncio.sleep(self._interval)
+
+    def start(self):
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def run_forever(self):
+        await self._run()
+
+
+async def _main():
+    from chain import make_algod_client, make_templates
+    from storage import STORAGE_BACKEND
+
+    if STORAGE_BACKEND != "local":
+        logger.warning("upload gc: STORAGE_BACKEND=%s, yalnızca yerel depo süpürülür; çıkılıyor", STORAGE_BACKEND)
+        return
+    # main.py ile aynı env; dizini API oluşturur, burada yalnızca okunur
+    upload_dir = Path(os.getenv("UPLOAD_DIR", "uploads"))
+    algod_client = make_algod_client()
+    box_reader = BoxStateReader(algod_client, make_templates())
+    try:
+        await UploadSweeper(algod_client, box_reader, upload_dir).run_forever()
+    finally:
+        await algod_client.aclose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-8s %(message)s")
+    asyncio.run(_main())
@@ -0,0 +1,170 @@
+# upload_writer.py
+#
+# Yükleme akışında diske yazma ve hash'lemeyi event loop dışına taşır.
+# Her parça için yazma + hasher.update tek bir thread işi olarak default executor'a
+# gönderilir; bir sonraki parça istekten okunurken önceki parça diske yazılır
+# (derinlik 1'lik pipeline, sıra korunur, bellekte en fazla iki parça bulunur).
+# hashlib büyük tamponlarda GIL'i bıraktığından eşzamanlı yüklemeler paralel ilerler.
+#
+# Hızlı yol (spooled_fileno / hash_fd / copy_fd): Starlette multipart gövdeyi zaten diske
+# (SpooledTemporaryFile) yazmışsa, dosya tek bir yeniden kullanılan tampona readinto ile
+# okunup hash'lenir; hedefe kopya çekirdek içinde yapılır (copy_file_range -> sendfile ->
+# pread/write). Hash önce bilindiğinden içerik adresli depoda aynı dosya hiç yazılmaz.
+
+import asyncio
+import io
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, List, Optional, Sequence
+
+HASH_BUFFER_SIZE = 1024 * 1024
+
+
+class PipelinedWriter:
+    def __init__(self, path: Path, hashers: Sequence[Any] = ()):
+        self.path = path
+        self._hashers: List[Any] = list(hashers)
+        self._out: Optional[BinaryIO] = None
+        self._pending: Optional[asyncio.Future] = None
+        self.size = 0
+
+    def _write(self, chunk: bytes):
+        self._out.write(chunk)
+        for h in self._hashers:
+            h.update(chunk)
+
+    async def open(self) -> "PipelinedWriter":
+        self._out = await asyncio.to_thread(self.path.open, "wb")
+        return self
+
+    async def _drain(self):
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            await pending
+
+    async def write(self, chunk: bytes):
+        """Önceki parçanın bitmesini bekler, bu parçayı başlatıp hemen döner."""
+        await self._drain()
+        self.size += len(chunk)
+        self._pending = asyncio.ensure_future(asyncio.to_thread(self._write, chunk))
+
+    async def close(self):
+        try:
+            await self._drain()
+        finally:
+            if self._out is not None:
+                out, self._out = self._out, None
+                await asyncio.to_thread(out.close)
+
+    async def finish(self):
+        """Depo sink arayüzü (storage.py) ile uyum için: yazımı tamamlar."""
+        await self.close()
+
+    async def abort(self):
+        """Yarım kalan dosyayı kapatıp siler; hatalar yutulur."""
+        try:
+            await self.close()
+        except Exception:
+            pass
+        try:
+            await asyncio.to_thread(self.path.unlink, True)
+        except Exception:
+            pass
+
+    async def __aenter__(self) -> "PipelinedWriter":
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            await self.close()
+        else:
+            await self.abort()
+
+
+def spooled_fileno(f: Any) -> Optional[int]:
+    """Diskteki dosyanın fd'si; bellekte duran spool (ya da BytesIO) için None."""
+    if getattr(f, "_rolled", True) is False:
+        return None  # fileno() çağrısı spool'u diske taşırdı
+    try:
+        return f.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def hash_fd(fd: int, hashers: Sequence[Any], sniffer: Any = None, buf_size: int = HASH_BUFFER_SIZE) -> int:
+    """
+    fd'yi baştan sona tek tamponla okur (thread'de çalışır); okunan bayt sayısını döner.
+    sniffer.feed ilk tamponda hata verirse dosyanın geri kalanı okunmaz.
+    """
+    buf = bytearray(buf_size)
+    view = memoryview(buf)
+    total = 0
+    with os.fdopen(os.dup(fd), "rb", buffering=0) as raw:
+        raw.seek(0)
+        while True:
+            n = raw.readinto(buf)
+            if not n:
+                break
+            chunk = view[:n]
+            if sniffer is not None:
+                sniffer.feed(chunk)
+            for h in hashers:
+                h.update(chunk)
+            total += n
+    if sniffer is not None:
+        sniffer.finish()
+    return total
+
+
+def _copy_range(src_fd: int, dst_fd: int, offset: int, size: int) -> int:
+    while offset < size:
+        n = os.copy_file_range(src_fd, dst_fd, size - offset, offset, offset)
+        if n == 0:
+            break
+        offset += n
+    return offset
+
+
+def _copy_sendfile(src_fd: int, dst_fd: int, offset: int, size: int) -> int:
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    while offset < size:
+        n = os.sendfile(dst_fd, src_fd, offset, size - offset)
+        if n == 0:
+            break
+        offset += n
+    return offset
+
+
+def _copy_pread(src_fd: int, dst_fd: int, offset: int, size: int) -> int:
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    while offset < size:
+        data = os.pread(src_fd, min(HASH_BUFFER_SIZE, size - offset), offset)
+        if not data:
+            break
+        os.write(dst_fd, data)
+        offset += len(data)
+    return offset
+
+
+def copy_fd(src_fd: int, dest_path: Path, size: int):
+    """
+    src_fd'nin ilk size baytını dest_path'e kullanıcı alanına taşımadan kopyalar (thread'de çalışır).
+    copy_file_range aynı dosya sisteminde reflink/sunucu tarafı kopya yapabilir;
+    desteklenmezse (EXDEV, ENOSYS, eski çekirdek) kaldığı yerden sendfile'a, o da olmazsa pread/write'a düşer.
+    """
+    try:
+        with dest_path.open("wb") as out:
+            dst = out.fileno()
+            offset = 0
+            for copier in (_copy_range, _copy_sendfile, _copy_pread):
+                try:
+                    offset = copier(src_fd, dst, offset, size)
+                    break
+                except (AttributeError, OSError):
+                    if copier is _copy_pread:
+                        raise
+            if offset != size:
+                raise OSError(f"kopya eksik: {offset}/{size} bayt")
+    except BaseException:
+        dest_path.unlink(missing_ok=True)
+        raise
@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}, {"type": "address[]", "name": "signers"}], "name": "create_contract", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}], "name": "cancel", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}, {"type": "address", "name": "signer"}], "name": "sign", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}], "name": "issign", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}], "name": "iscomplete", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}, {"type": "address", "name": "signer"}], "name": "reject", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "my_contracts", "returns": {"type": "byte[]"}, "desc": "Txn.sender\u2019\u0131n olu\u015fturdu\u011fu t\u00fcm s\u00f6zle\u015fme hash\u2019lerini d\u00f6ner.\nD\u00f6n\u00fc\u015f: 32 baytl\u0131k hash\u2019lerin ard\u0131\u015f\u0131k olarak birikti\u011fi Bytes blob\u2019u.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}], "name": "get_asset_id", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}], "name": "is_active", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}], "name": "total_signers", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}], "name": "signed_count", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}], "name": "Blocksign", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {"asset_by_hash": {"keyType": "byte[]", "valueType": "uint64", "prefix": "YXNhXw=="}, "admin_by_hash": {"keyType": "byte[]", "valueType": "address", "prefix": "YWRtXw=="}, "signers_blob_by_hash": {"keyType": "byte[]", "valueType": "AVMBytes", "prefix": "c2duXw=="}, "canceled_by_hash": {"keyType": "byte[]", "valueType": "uint64", "prefix": "ZGVsXw=="}, "signed_blob_by_hash": {"keyType": "byte[]", "valueType": "AVMBytes", "prefix": "c2doXw=="}, "user_hashes": {"keyType": "address", "valueType": "AVMBytes", "prefix": "dWhzXw=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiAEAAEgAyYHAAQVH3x1BHNnaF8EZGVsXwRzZ25fBGFzYV8EdWhzXzEbQQE/ggsEwFN8mwS/FdJ3BI8aPpIEGnvUqQR+dMIYBGMcHnsER0H1UwSm7Bb/BLdpaQ4EE5/iuAQpYNZyNhoAjgsA1ADAAKkAlQCBAGoAUgA+ACoAFgACIkMxGRREMRhENhoBiAaVFilMULAjQzEZFEQxGEQ2GgGIBlAWKUxQsCNDMRkURDEYRDYaAYgGIRYpTFCwI0MxGRREMRhENhoBiAX3FilMULAjQzEZFEQxGESIBdNJFRZXBgJMUClMULAjQzEZFEQxGEQ2GgE2GgKIBPkWKUxQsCNDMRkURDEYRDYaAYgEARYpTFCwI0MxGRREMRhENhoBiAONFilMULAjQzEZFEQxGEQ2GgE2GgKIAn4WKUxQsCNDMRkURDEYRDYaAYgCFBYpTFCwI0MxGRREMRhENhoBNhoCiAASFilMULAjQzEZQP8QMRgURCNDigIBIkcEKEcJK4v+UL5MF0xBAdOLDyMSQQHMIxREMgSBAhJEIjgQIxJEIjgHMgoSRCI4CIHAlrECD0QiOAAxABJEIjggMgMSRCI4CTIDEkQnBYv+UEmMAr5MF4wFQQB0JwYxAFBJjAO+TIwBQAADKIwBIowHIowLiwEVSYwNiwcNiwuMDEEANosHSYsNSU4DD0sBSwNPAk1MJAhJjAdJSwMPTE8DTwJNSUsCDEsCTE2LAU4CUov+EkH/vSOMDIsMQAAMiwGL/lCLA0m8SEy/iwWMAImL/hWBCEsBD4EITgJNi/4iTwJSgAVGSUxFLUxQsTIKMgNHArIssiuyKrIpsiaABEZJTEWyJSKyJCKyIyOyIiWyECKyAbO0PEmMCRaLAky/MgmABGFkbV+L/lBMvyiMACKMBov/IlmMCosGiwoMQQAbi/9XAgCLBklOAiQLJFiLAExQjAAjCIwGQv/dJwSL/lBJvEiLAL8qi/5QSbxIKL8nBjEAUEmMBL5MjAFAAAMojAEijAgijAuLARVJjA6LCA2LC4wMQQA2iwhJiw5JTgMPSwFLA08CTUwkCEmMCElLAw9MTwNPAk1JSwIMSwJMTYsBTgJSi/4SQf+9I4wMiwxAAAyLAYv+UIsESbxITL+LCYwAiSJC/jGKAQExADIJEkQnBYv/UL5MF0xEK4v/UEm+TBdMQQAziwIjEkEALCMURLGLAEmyISWyECKyAbMjFosBTL8nBIv/UEm8SCi/Kov/UEm8SCi/jACJIkL/0YoCASJHAihHBTIEIxJEK4v+UL5MF0xBANuLCSMSQQDUIxREJwWL/lC+RQFEi/8xABJEJwSL/lC+TIwCRCKMBSKMA4sCFUmMCIsFDYsDjARBADaLBUmLCElOAw9LAUsDTwJNTCQISYwFSUsDD0xPA08CTUlLAgxLAkxNiwJOAlKL/xJB/70jjASLBCMSRCqL/lBJjAC+TIwBQAADKIwBIowGiwEVSYwHiwYNQQA3iwZJiwdJTgMPSwFLA08CTUwkCEmMBklLAw9MTwNPAk1JSwIMSwJMTYsBTgJSi/8SQf/BI4wAiYsBi/9QiwBJvEhMvyOMAIkiQv8pigEBKEkyBCMSRCqL/1C+QAAEIowAiSKMAIsCFUmMAYsADUEAN4sASYsBSU4DD0sBSwNPAk1MJAhJjABJSwMPTE8DTwJNSUsCDEsCTE2LAk4CUjEAEkH/wSOMAIkijACJigEBIkcCKEcFMgQjEkQri/9QvkwXTEEAC4sJIxJBAAQijACJJwSL/1C+TIwBQQAJiwEVSYwHQAAEIowAiSqL/1C+TIwAQQAJiwAVSYwIQAAEIowAiSKMBYsFiwcMQQCAiwVJiwdJTgMPSwFLA08CTUwkCEmMBUlLAw9MTwNPAk1JSwIMSwJMTYsBTgJSjAIijAYijAOLBosIDIsDjARBADaLBkmLCElOAw9LAUsDTwJNTCQISYwGSUsDD0xPA08CTUlLAgxLAkxNiwBOAlKLAhJB/8EjjASLBED/fCKMAIkjjACJigIBIkkoRwQyBCMSRCuL/lBJvkwXTEEAn4sIIxJBAJgjFEQnBYv+UL5MF4wCRIv/MQASRCcEi/5QSYwAvkyMAUQijAUijAOLARVJjAaLBQ2LA4wEQQA2iwVJiwZJTgMPSwFLA08CTUwkCEmMBUlLAw9MTwNPAk1JSwIMSwJMTYsBTgJSi/8SQf+9I4wEiwQjEkSxiwJJsiElshAisgGzIxaLB0y/iwBJvEgovyqL/lBJvEgov4wAiSJC/2WKAAEnBjEAUL5AAAMoTImLAEyJigEBJwWL/1C+TBdMQAADIkyJiwBMiYoBASuL/1C+TBdMQQAKiwAjEkEAAyJMiSNMiYoBAShJJwSL/1C+QAAEIowAiSKMASKMAIsCFYsBDUEAD4sAIwiMAIsBJAiMAUL/6ImKAQEoSSqL/1C+QAAEIowAiSKMASKMAIsCFYsBDUEAD4sAIwiMAIsBJAiMAUL/6Ik=", "clear": "CoEBQw=="}, "desc": "\n    create_contract(file_hash, signers):\n      - Gtxn[0]: Payment -> app address, amount >= 5 ALGO, sender == caller\n      - Gtxn[1]: AppCall (bu method)\n      - 1 adetlik NFT (ASA) mint eder, manager = app address\n      - file_hash -> asset_id ve admin e\u015fle\u015fmesini box storage'da tutar\n      - signers (address[]) -> tek box'ta (sgn_) ard\u0131\u015f\u0131k 32B adres blob'u olarak saklan\u0131r\n      - asset_id d\u00f6nd\u00fcr\u00fcr\n\n    cancel(file_hash):\n      - Sadece uygulamay\u0131 olu\u015fturan hesap (Global.creator_address) \u00e7a\u011f\u0131rabilir\n      - (M\u00fcmk\u00fcnse) ASA\u2019y\u0131 siler, kayd\u0131 iptal eder\n\n    sign(file_hash, signer):\n      - Sadece yetkili imzac\u0131lar (sgn_ blob\u2019unda olan adresler) \u00e7a\u011f\u0131rabilir\n      - signer.bytes == Txn.sender.bytes olmal\u0131\n      - \u0130mza kayd\u0131n\u0131 sgh_ kutusuna ekler (idempotent)\n\n    issign(file_hash):\n      - Txn.sender bu hash\u2019i imzalam\u0131\u015f m\u0131? (1/0)\n\n    iscomplete(file_hash):\n      - Listedeki t\u00fcm imzac\u0131lar imzalam\u0131\u015f m\u0131? (1/0)\n\n    reject(file_hash, signer):\n      - signers listesindeki herhangi bir ki\u015fi reddederse ASA silinip kay\u0131t iptal edilir\n\n    my_contracts():\n      - Txn.sender\u2019\u0131n olu\u015fturdu\u011fu s\u00f6zle\u015fme hash\u2019lerini 32B ard\u0131\u015f\u0131k blob olarak d\u00f6ner\n\n    A\u015fa\u011f\u0131daki okuma metodlar\u0131 tek tek bilgi verir (tuple yerine):\n      - get_asset_id(file_hash)  -> UInt64\n      - is_active(file_hash)     -> UInt64 (iptal edilmemi\u015f:1 / iptal:0)\n      - total_signers(file_hash) -> UInt64\n      - signed_count(file_hash)  -> UInt64\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYmxvY2tzaWduLmNvbnRyYWN0LkJsb2Nrc2lnbi5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIgMwogICAgYnl0ZWNibG9jayAweCAweDE1MWY3Yzc1IDB4NzM2NzY4NWYgMHg2NDY1NmM1ZiAweDczNjc2ZTVmIDB4NjE3MzYxNWYgMHg3NTY4NzM1ZgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgQmxvY2tzaWduKEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAMTYKICAgIHB1c2hieXRlc3MgMHhjMDUzN2M5YiAweGJmMTVkMjc3IDB4OGYxYTNlOTIgMHgxYTdiZDRhOSAweDdlNzRjMjE4IDB4NjMxYzFlN2IgMHg0NzQxZjU1MyAweGE2ZWMxNmZmIDB4Yjc2OTY5MGUgMHgxMzlmZTJiOCAweDI5NjBkNjcyIC8vIG1ldGhvZCAiY3JlYXRlX2NvbnRyYWN0KGJ5dGVbXSxhZGRyZXNzW10pdWludDY0IiwgbWV0aG9kICJjYW5jZWwoYnl0ZVtdKXVpbnQ2NCIsIG1ldGhvZCAic2lnbihieXRlW10sYWRkcmVzcyl1aW50NjQiLCBtZXRob2QgImlzc2lnbihieXRlW10pdWludDY0IiwgbWV0aG9kICJpc2NvbXBsZXRlKGJ5dGVbXSl1aW50NjQiLCBtZXRob2QgInJlamVjdChieXRlW10sYWRkcmVzcyl1aW50NjQiLCBtZXRob2QgIm15X2NvbnRyYWN0cygpYnl0ZVtdIiwgbWV0aG9kICJnZXRfYXNzZXRfaWQoYnl0ZVtdKXVpbnQ2NCIsIG1ldGhvZCAiaXNfYWN0aXZlKGJ5dGVbXSl1aW50NjQiLCBtZXRob2QgInRvdGFsX3NpZ25lcnMoYnl0ZVtdKXVpbnQ2NCIsIG1ldGhvZCAic2lnbmVkX2NvdW50KGJ5dGVbXSl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2NyZWF0ZV9jb250cmFjdF9yb3V0ZUA1IG1haW5fY2FuY2VsX3JvdXRlQDYgbWFpbl9zaWduX3JvdXRlQDcgbWFpbl9pc3NpZ25fcm91dGVAOCBtYWluX2lzY29tcGxldGVfcm91dGVAOSBtYWluX3JlamVjdF9yb3V0ZUAxMCBtYWluX215X2NvbnRyYWN0c19yb3V0ZUAxMSBtYWluX2dldF9hc3NldF9pZF9yb3V0ZUAxMiBtYWluX2lzX2FjdGl2ZV9yb3V0ZUAxMyBtYWluX3RvdGFsX3NpZ25lcnNfcm91dGVAMTQgbWFpbl9zaWduZWRfY291bnRfcm91dGVAMTUKCm1haW5fYWZ0ZXJfaWZfZWxzZUAxODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjAKICAgIC8vIGNsYXNzIEJsb2Nrc2lnbihBUkM0Q29udHJhY3QpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHVybgoKbWFpbl9zaWduZWRfY291bnRfcm91dGVAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM0NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgQmxvY2tzaWduKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM0NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgc2lnbmVkX2NvdW50CiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3RvdGFsX3NpZ25lcnNfcm91dGVAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMzMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgQmxvY2tzaWduKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMzMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgdG90YWxfc2lnbmVycwogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9pc19hY3RpdmVfcm91dGVAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMyNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgQmxvY2tzaWduKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMyNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgaXNfYWN0aXZlCiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9hc3NldF9pZF9yb3V0ZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzE2LTMxNwogICAgLy8gIyAtLS0tIEF5csSxIG9rdW1hIG1ldG9kbGFyxLEgKHR1cGxlIHllcmluZSkgLS0tLQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgQmxvY2tzaWduKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMxNi0zMTcKICAgIC8vICMgLS0tLSBBeXLEsSBva3VtYSBtZXRvZGxhcsSxICh0dXBsZSB5ZXJpbmUpIC0tLS0KICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGdldF9hc3NldF9pZAogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9teV9jb250cmFjdHNfcm91dGVAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMwNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBteV9jb250cmFjdHMKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3JlamVjdF9yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjcxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBCbG9ja3NpZ24oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjcxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiByZWplY3QKICAgIGl0b2IKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5faXNjb21wbGV0ZV9yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMzkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjAKICAgIC8vIGNsYXNzIEJsb2Nrc2lnbihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMzkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGlzY29tcGxldGUKICAgIGl0b2IKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5faXNzaWduX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIyMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgQmxvY2tzaWduKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIyMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgaXNzaWduCiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3NpZ25fcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTg2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBCbG9ja3NpZ24oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTg2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBzaWduCiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NhbmNlbF9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxNjUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjAKICAgIC8vIGNsYXNzIEJsb2Nrc2lnbihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxNjUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNhbmNlbAogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfY29udHJhY3Rfcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6NzIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjAKICAgIC8vIGNsYXNzIEJsb2Nrc2lnbihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTo3MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY3JlYXRlX2NvbnRyYWN0CiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0AxNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjAKICAgIC8vIGNsYXNzIEJsb2Nrc2lnbihBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAxOAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYmxvY2tzaWduLmNvbnRyYWN0LkJsb2Nrc2lnbi5jcmVhdGVfY29udHJhY3QoZmlsZV9oYXNoOiBieXRlcywgc2lnbmVyczogYnl0ZXMpIC0+IHVpbnQ2NDoKY3JlYXRlX2NvbnRyYWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTo3Mi03NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjcmVhdGVfY29udHJhY3QoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBmaWxlX2hhc2g6IGFyYzQuRHluYW1pY0J5dGVzLAogICAgLy8gICAgIHNpZ25lcnM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuQWRkcmVzc10sCiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgaW50Y18wIC8vIDAKICAgIGR1cG4gNAogICAgYnl0ZWNfMCAvLyAiIgogICAgZHVwbiA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5Ojc4LTc5CiAgICAvLyAjIC0tLSAwKSDDlm5rb8WfdWxsYXIgLS0tCiAgICAvLyBjYW5jZWxlZF9mbGFnLCBjYW5jZWxlZF9leGlzdHMgPSBzZWxmLmNhbmNlbGVkX2J5X2hhc2gubWF5YmUoZmlsZV9oYXNoKQogICAgYnl0ZWNfMyAvLyAweDY0NjU2YzVmCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTo4MAogICAgLy8gYXNzZXJ0IG5vdCAoY2FuY2VsZWRfZXhpc3RzIGFuZCBjYW5jZWxlZF9mbGFnID09IDEpLCAiaGFzaCBjYW5jZWxlZCIKICAgIGJ6IGNyZWF0ZV9jb250cmFjdF9ib29sX2ZhbHNlQDMKICAgIGZyYW1lX2RpZyAxNQogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBieiBjcmVhdGVfY29udHJhY3RfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzEgLy8gMQoKY3JlYXRlX2NvbnRyYWN0X2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6ODAKICAgIC8vIGFzc2VydCBub3QgKGNhbmNlbGVkX2V4aXN0cyBhbmQgY2FuY2VsZWRfZmxhZyA9PSAxKSwgImhhc2ggY2FuY2VsZWQiCiAgICAhCiAgICBhc3NlcnQgLy8gaGFzaCBjYW5jZWxlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTo4Mi04MwogICAgLy8gIyAtLS0gMSkgw5ZkZW1lIGRvxJ9ydWxhbWEgLS0tCiAgICAvLyBhc3NlcnQgR2xvYmFsLmdyb3VwX3NpemUgPT0gMiwgImdyb3VwIG11c3QgYmUgc2l6ZSAyIChQYXltZW50ICsgQXBwQ2FsbCkiCiAgICBnbG9iYWwgR3JvdXBTaXplCiAgICBwdXNoaW50IDIgLy8gMgogICAgPT0KICAgIGFzc2VydCAvLyBncm91cCBtdXN0IGJlIHNpemUgMiAoUGF5bWVudCArIEFwcENhbGwpCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBwYXkgPSBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihQQVlNRU5UX0lOREVYKQogICAgaW50Y18wIC8vIDAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTo4NgogICAgLy8gYXNzZXJ0IHBheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAicGF5bWVudCBtdXN0IGdvIHRvIGFwcCBhZGRyZXNzIgogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIHBheW1lbnQgbXVzdCBnbyB0byBhcHAgYWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTo4NQogICAgLy8gcGF5ID0gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24oUEFZTUVOVF9JTkRFWCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5Ojg3CiAgICAvLyBhc3NlcnQgcGF5LmFtb3VudCA+PSBGSVZFX0FMR08sICJpbnN1ZmZpY2llbnQgcGF5bWVudDogbmVlZCA+PSA1IEFMR08iCiAgICBndHhucyBBbW91bnQKICAgIHB1c2hpbnQgNTAwMDAwMCAvLyA1MDAwMDAwCiAgICA+PQogICAgYXNzZXJ0IC8vIGluc3VmZmljaWVudCBwYXltZW50OiBuZWVkID49IDUgQUxHTwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTo4NQogICAgLy8gcGF5ID0gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24oUEFZTUVOVF9JTkRFWCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5Ojg4CiAgICAvLyBhc3NlcnQgcGF5LnNlbmRlciA9PSBUeG4uc2VuZGVyLCAicGF5ZXIgbXVzdCBiZSB0aGUgY2FsbGVyIgogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIHBheWVyIG11c3QgYmUgdGhlIGNhbGxlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTo4NQogICAgLy8gcGF5ID0gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24oUEFZTUVOVF9JTkRFWCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5Ojg5CiAgICAvLyBhc3NlcnQgcGF5LnJla2V5X3RvID09IEdsb2JhbC56ZXJvX2FkZHJlc3MsICJyZWtleSBub3QgYWxsb3dlZCIKICAgIGd0eG5zIFJla2V5VG8KICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyByZWtleSBub3QgYWxsb3dlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTo4NQogICAgLy8gcGF5ID0gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24oUEFZTUVOVF9JTkRFWCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjkwCiAgICAvLyBhc3NlcnQgcGF5LmNsb3NlX3JlbWFpbmRlcl90byA9PSBHbG9iYWwuemVyb19hZGRyZXNzLCAiY2xvc2Ugbm90IGFsbG93ZWQiCiAgICBndHhucyBDbG9zZVJlbWFpbmRlclRvCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gY2xvc2Ugbm90IGFsbG93ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6OTItOTMKICAgIC8vICMgLS0tIDIpIERhaGEgw7ZuY2UgbWludCBlZGlsbWnFnyBtaT8gLS0tCiAgICAvLyBleGlzdGluZ19pZCwgZXhpc3RzID0gc2VsZi5hc3NldF9ieV9oYXNoLm1heWJlKGZpbGVfaGFzaCkKICAgIGJ5dGVjIDUgLy8gMHg2MTczNjE1ZgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAyCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBmcmFtZV9idXJ5IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6OTQKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IGNyZWF0ZV9jb250cmFjdF9hZnRlcl9pZl9lbHNlQDE1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5Ojk3CiAgICAvLyBibG9iX3UsIGhhc191ID0gc2VsZi51c2VyX2hhc2hlcy5tYXliZSh1c2VyX2tleSkKICAgIGJ5dGVjIDYgLy8gMHg3NTY4NzM1ZgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTo5NS05NgogICAgLy8gIyBLdWxsYW7EsWPEsSBpbmRla3NpbmUgZWtsaSBkZcSfaWxzZSBla2xlIChpZGVtcG90ZW50KQogICAgLy8gdXNlcl9rZXkgPSBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlci5ieXRlcykKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6OTcKICAgIC8vIGJsb2JfdSwgaGFzX3UgPSBzZWxmLnVzZXJfaGFzaGVzLm1heWJlKHVzZXJfa2V5KQogICAgY29uY2F0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMwogICAgYm94X2dldAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBpZiBub3QgaGFzX3U6CiAgICBibnogY3JlYXRlX2NvbnRyYWN0X2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTo5OQogICAgLy8gYmxvYl91ID0gQnl0ZXMoYiIiKQogICAgYnl0ZWNfMCAvLyAweAogICAgZnJhbWVfYnVyeSAxCgpjcmVhdGVfY29udHJhY3RfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMDAKICAgIC8vIGkwID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjEwMQogICAgLy8gcHJlc2VudCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMTEKCmNyZWF0ZV9jb250cmFjdF93aGlsZV90b3BAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTAyCiAgICAvLyB3aGlsZSBpMCA8IGJsb2JfdS5sZW5ndGg6CiAgICBmcmFtZV9kaWcgMQogICAgbGVuCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMTMKICAgIGZyYW1lX2RpZyA3CiAgICA+CiAgICBmcmFtZV9kaWcgMTEKICAgIGZyYW1lX2J1cnkgMTIKICAgIGJ6IGNyZWF0ZV9jb250cmFjdF9hZnRlcl93aGlsZUAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMDMKICAgIC8vIGlmIGJsb2JfdVtpMCA6IGkwICsgVUludDY0KDMyKV0gPT0gZmlsZV9oYXNoLmJ5dGVzOgogICAgZnJhbWVfZGlnIDcKICAgIGR1cAogICAgZnJhbWVfZGlnIDEzCiAgICBkdXAKICAgIGNvdmVyIDMKICAgID49CiAgICBkaWcgMQogICAgZGlnIDMKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBzd2FwCiAgICBpbnRjXzIgLy8gMzIKICAgICsKICAgIGR1cAogICAgZnJhbWVfYnVyeSA3CiAgICBkdXAKICAgIGRpZyAzCiAgICA+PQogICAgc3dhcAogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZHVwCiAgICBkaWcgMgogICAgPAogICAgZGlnIDIKICAgIHN3YXAKICAgIHNlbGVjdAogICAgZnJhbWVfZGlnIDEKICAgIGNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIGZyYW1lX2RpZyAtMgogICAgPT0KICAgIGJ6IGNyZWF0ZV9jb250cmFjdF93aGlsZV90b3BAOAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMDQKICAgIC8vIHByZXNlbnQgPSBVSW50NjQoMSkKICAgIGludGNfMSAvLyAxCiAgICBmcmFtZV9idXJ5IDEyCgpjcmVhdGVfY29udHJhY3RfYWZ0ZXJfd2hpbGVAMTI6CiAgICBmcmFtZV9kaWcgMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTA3CiAgICAvLyBpZiBwcmVzZW50ID09IFVJbnQ2NCgwKToKICAgIGJueiBjcmVhdGVfY29udHJhY3RfYWZ0ZXJfaWZfZWxzZUAxNAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMDgKICAgIC8vIHNlbGYudXNlcl9oYXNoZXNbdXNlcl9rZXldID0gYmxvYl91ICsgZmlsZV9oYXNoLmJ5dGVzCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAoKY3JlYXRlX2NvbnRyYWN0X2FmdGVyX2lmX2Vsc2VAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjEwOQogICAgLy8gcmV0dXJuIGV4aXN0aW5nX2lkCiAgICBmcmFtZV9kaWcgNQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmNyZWF0ZV9jb250cmFjdF9hZnRlcl9pZl9lbHNlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMTEtMTEyCiAgICAvLyAjIC0tLSAzKSBORlQgbWludCAoaW5uZXIgdHhuKSAtLS0KICAgIC8vIHByZWZpeDogQnl0ZXMgPSBmaWxlX2hhc2guYnl0ZXNbOjhdICAjIGxhYmVsIGnDp2luIGlsayA4IGJheXQKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBwdXNoaW50IDggLy8gOAogICAgZGlnIDEKICAgID49CiAgICBwdXNoaW50IDggLy8gOAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTEzCiAgICAvLyBhc3NldF9uYW1lOiBCeXRlcyA9IEJ5dGVzKGIiRklMRS0iKSArIHByZWZpeAogICAgcHVzaGJ5dGVzIDB4NDY0OTRjNDUyZAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjExNi0xMjYKICAgIC8vIG1pbnRfcmVzID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICB0b3RhbD1VSW50NjQoMSksCiAgICAvLyAgICAgZGVjaW1hbHM9VUludDY0KDApLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIHVuaXRfbmFtZT11bml0X25hbWUsCiAgICAvLyAgICAgYXNzZXRfbmFtZT1hc3NldF9uYW1lLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgICMgQVNBIHnDtm5ldGltaSBzw7Z6bGXFn21lZGUKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLnplcm9fYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTIyCiAgICAvLyBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICAjIEFTQSB5w7ZuZXRpbWkgc8O2emxlxZ9tZWRlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMjMKICAgIC8vIHJlc2VydmU9R2xvYmFsLnplcm9fYWRkcmVzcywKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMjQtMTI1CiAgICAvLyBmcmVlemU9R2xvYmFsLnplcm9fYWRkcmVzcywKICAgIC8vIGNsYXdiYWNrPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICBkdXBuIDIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRDbGF3YmFjawogICAgaXR4bl9maWVsZCBDb25maWdBc3NldEZyZWV6ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFJlc2VydmUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRNYW5hZ2VyCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMTQKICAgIC8vIHVuaXRfbmFtZTogQnl0ZXMgPSBCeXRlcyhiIkZJTEUiKQogICAgcHVzaGJ5dGVzIDB4NDY0OTRjNDUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRVbml0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMTkKICAgIC8vIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWZhdWx0RnJvemVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjExOAogICAgLy8gZGVjaW1hbHM9VUludDY0KDApLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWNpbWFscwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMTcKICAgIC8vIHRvdGFsPVVJbnQ2NCgxKSwKICAgIGludGNfMSAvLyAxCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VG90YWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTE2CiAgICAvLyBtaW50X3JlcyA9IGl0eG4uQXNzZXRDb25maWcoCiAgICBpbnRjXzMgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjExNi0xMjYKICAgIC8vIG1pbnRfcmVzID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICB0b3RhbD1VSW50NjQoMSksCiAgICAvLyAgICAgZGVjaW1hbHM9VUludDY0KDApLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIHVuaXRfbmFtZT11bml0X25hbWUsCiAgICAvLyAgICAgYXNzZXRfbmFtZT1hc3NldF9uYW1lLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgICMgQVNBIHnDtm5ldGltaSBzw7Z6bGXFn21lZGUKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLnplcm9fYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIENyZWF0ZWRBc3NldElECiAgICBkdXAKICAgIGZyYW1lX2J1cnkgOQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMzAtMTMxCiAgICAvLyAjIC0tLSA0KSBFxZ9sZW1lbGVyaSBrYXlkZXQgLS0tCiAgICAvLyBzZWxmLmFzc2V0X2J5X2hhc2hbZmlsZV9oYXNoXSA9IGFzc2V0X2lkCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMgogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMzIKICAgIC8vIHNlbGYuYWRtaW5fYnlfaGFzaFtmaWxlX2hhc2hdID0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICBwdXNoYnl0ZXMgMHg2MTY0NmQ1ZgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTM0LTEzNQogICAgLy8gIyAtLS0gNSkgxLBtemFjxLFsYXLEsSAoc2duXykgc2FrbGEKICAgIC8vIGJsb2I6IEJ5dGVzID0gQnl0ZXMoYiIiKQogICAgYnl0ZWNfMCAvLyAweAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjEzNgogICAgLy8gaSA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgNgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMzcKICAgIC8vIG4gPSBzaWduZXJzLmxlbmd0aAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2J1cnkgMTAKCmNyZWF0ZV9jb250cmFjdF93aGlsZV90b3BAMTc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjEzOAogICAgLy8gd2hpbGUgaSA8IG46CiAgICBmcmFtZV9kaWcgNgogICAgZnJhbWVfZGlnIDEwCiAgICA8CiAgICBieiBjcmVhdGVfY29udHJhY3RfYWZ0ZXJfd2hpbGVAMTkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTM5CiAgICAvLyBhZGRyID0gc2lnbmVyc1tpXSAgICAgICAgICAjIGFyYzQuQWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDYKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBpbnRjXzIgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxNDAKICAgIC8vIGJsb2IgPSBibG9iICsgYWRkci5ieXRlcyAgICMgMzIgYmF5dCBla2xlCiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTQxCiAgICAvLyBpID0gaSArIFVJbnQ2NCgxKQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgNgogICAgYiBjcmVhdGVfY29udHJhY3Rfd2hpbGVfdG9wQDE3CgpjcmVhdGVfY29udHJhY3RfYWZ0ZXJfd2hpbGVAMTk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE0MgogICAgLy8gc2VsZi5zaWduZXJzX2Jsb2JfYnlfaGFzaFtmaWxlX2hhc2hdID0gYmxvYgogICAgYnl0ZWMgNCAvLyAweDczNjc2ZTVmCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE0NC0xNDUKICAgIC8vICMgc2doXyAoc2lnbmVkKSBiYcWfbGFuZ8Sxw6d0YSBib8WfCiAgICAvLyBzZWxmLnNpZ25lZF9ibG9iX2J5X2hhc2hbZmlsZV9oYXNoXSA9IEJ5dGVzKGIiIikKICAgIGJ5dGVjXzIgLy8gMHg3MzY3Njg1ZgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBieXRlY18wIC8vIDB4CiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gYmxvYl91LCBoYXNfdSA9IHNlbGYudXNlcl9oYXNoZXMubWF5YmUodXNlcl9rZXkpCiAgICBieXRlYyA2IC8vIDB4NzU2ODczNWYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTQ3LTE0OAogICAgLy8gIyAtLS0gNikgS3VsbGFuxLFjxLEgaW5kZWtzaW5lICh1aHNfKSBla2xlIChpZGVtcG90ZW50KSAtLS0KICAgIC8vIHVzZXJfa2V5ID0gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIuYnl0ZXMpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gYmxvYl91LCBoYXNfdSA9IHNlbGYudXNlcl9oYXNoZXMubWF5YmUodXNlcl9rZXkpCiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSA0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTUwCiAgICAvLyBpZiBub3QgaGFzX3U6CiAgICBibnogY3JlYXRlX2NvbnRyYWN0X2FmdGVyX2lmX2Vsc2VAMjEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTUxCiAgICAvLyBibG9iX3UgPSBCeXRlcyhiIiIpCiAgICBieXRlY18wIC8vIDB4CiAgICBmcmFtZV9idXJ5IDEKCmNyZWF0ZV9jb250cmFjdF9hZnRlcl9pZl9lbHNlQDIxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxNTIKICAgIC8vIGogPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTUzCiAgICAvLyBwcmVzZW50ID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAxMQoKY3JlYXRlX2NvbnRyYWN0X3doaWxlX3RvcEAyMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTU0CiAgICAvLyB3aGlsZSBqIDwgYmxvYl91Lmxlbmd0aDoKICAgIGZyYW1lX2RpZyAxCiAgICBsZW4KICAgIGR1cAogICAgZnJhbWVfYnVyeSAxNAogICAgZnJhbWVfZGlnIDgKICAgID4KICAgIGZyYW1lX2RpZyAxMQogICAgZnJhbWVfYnVyeSAxMgogICAgYnogY3JlYXRlX2NvbnRyYWN0X2FmdGVyX3doaWxlQDI2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE1NQogICAgLy8gaWYgYmxvYl91W2ogOiBqICsgVUludDY0KDMyKV0gPT0gZmlsZV9oYXNoLmJ5dGVzOgogICAgZnJhbWVfZGlnIDgKICAgIGR1cAogICAgZnJhbWVfZGlnIDE0CiAgICBkdXAKICAgIGNvdmVyIDMKICAgID49CiAgICBkaWcgMQogICAgZGlnIDMKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBzd2FwCiAgICBpbnRjXzIgLy8gMzIKICAgICsKICAgIGR1cAogICAgZnJhbWVfYnVyeSA4CiAgICBkdXAKICAgIGRpZyAzCiAgICA+PQogICAgc3dhcAogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZHVwCiAgICBkaWcgMgogICAgPAogICAgZGlnIDIKICAgIHN3YXAKICAgIHNlbGVjdAogICAgZnJhbWVfZGlnIDEKICAgIGNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIGZyYW1lX2RpZyAtMgogICAgPT0KICAgIGJ6IGNyZWF0ZV9jb250cmFjdF93aGlsZV90b3BAMjIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTU2CiAgICAvLyBwcmVzZW50ID0gVUludDY0KDEpCiAgICBpbnRjXzEgLy8gMQogICAgZnJhbWVfYnVyeSAxMgoKY3JlYXRlX2NvbnRyYWN0X2FmdGVyX3doaWxlQDI2OgogICAgZnJhbWVfZGlnIDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE1OQogICAgLy8gaWYgcHJlc2VudCA9PSBVSW50NjQoMCk6CiAgICBibnogY3JlYXRlX2NvbnRyYWN0X2FmdGVyX2lmX2Vsc2VAMjgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTYwCiAgICAvLyBzZWxmLnVzZXJfaGFzaGVzW3VzZXJfa2V5XSA9IGJsb2JfdSArIGZpbGVfaGFzaC5ieXRlcwogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKCmNyZWF0ZV9jb250cmFjdF9hZnRlcl9pZl9lbHNlQDI4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxNjItMTYzCiAgICAvLyAjIC0tLSA3KSBhc3NldF9pZCBkw7ZuZMO8ciAtLS0KICAgIC8vIHJldHVybiBhc3NldF9pZAogICAgZnJhbWVfZGlnIDkKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpjcmVhdGVfY29udHJhY3RfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIGIgY3JlYXRlX2NvbnRyYWN0X2Jvb2xfbWVyZ2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ibG9ja3NpZ24uY29udHJhY3QuQmxvY2tzaWduLmNhbmNlbChmaWxlX2hhc2g6IGJ5dGVzKSAtPiB1aW50NjQ6CmNhbmNlbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTY1LTE2NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjYW5jZWwoc2VsZiwgZmlsZV9oYXNoOiBhcmM0LkR5bmFtaWNCeXRlcykgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE2NwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIm9ubHkgYXBwIGNyZWF0b3IgY2FuIGNhbmNlbCIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBvbmx5IGFwcCBjcmVhdG9yIGNhbiBjYW5jZWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTY5CiAgICAvLyBhc3NldF9pZCwgZXhpc3RzID0gc2VsZi5hc3NldF9ieV9oYXNoLm1heWJlKGZpbGVfaGFzaCkKICAgIGJ5dGVjIDUgLy8gMHg2MTczNjE1ZgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTcwCiAgICAvLyBhc3NlcnQgZXhpc3RzLCAiaGFzaCBub3QgZm91bmQiCiAgICBhc3NlcnQgLy8gaGFzaCBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTcyCiAgICAvLyBjYW5jZWxlZF9mbGFnLCBjYW5jZWxlZF9leGlzdHMgPSBzZWxmLmNhbmNlbGVkX2J5X2hhc2gubWF5YmUoZmlsZV9oYXNoKQogICAgYnl0ZWNfMyAvLyAweDY0NjU2YzVmCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE3MwogICAgLy8gYXNzZXJ0IG5vdCAoY2FuY2VsZWRfZXhpc3RzIGFuZCBjYW5jZWxlZF9mbGFnID09IDEpLCAiYWxyZWFkeSBjYW5jZWxlZCIKICAgIGJ6IGNhbmNlbF9ib29sX2ZhbHNlQDMKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGJ6IGNhbmNlbF9ib29sX2ZhbHNlQDMKICAgIGludGNfMSAvLyAxCgpjYW5jZWxfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxNzMKICAgIC8vIGFzc2VydCBub3QgKGNhbmNlbGVkX2V4aXN0cyBhbmQgY2FuY2VsZWRfZmxhZyA9PSAxKSwgImFscmVhZHkgY2FuY2VsZWQiCiAgICAhCiAgICBhc3NlcnQgLy8gYWxyZWFkeSBjYW5jZWxlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxNzUtMTc4CiAgICAvLyAjIEFTQSBkZWxldGUgZGVuZSAobWFuYWdlciA9IGFwcCBhZGRyZXNzIHZlIGFyeiBhcHAndGUgb2xtYWzEsSkKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgY29uZmlnX2Fzc2V0PUFzc2V0KGFzc2V0X2lkKSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTc1LTE3NgogICAgLy8gIyBBU0EgZGVsZXRlIGRlbmUgKG1hbmFnZXIgPSBhcHAgYWRkcmVzcyB2ZSBhcnogYXBwJ3RlIG9sbWFsxLEpCiAgICAvLyBpdHhuLkFzc2V0Q29uZmlnKAogICAgaW50Y18zIC8vIGFjZmcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxNzUtMTc4CiAgICAvLyAjIEFTQSBkZWxldGUgZGVuZSAobWFuYWdlciA9IGFwcCBhZGRyZXNzIHZlIGFyeiBhcHAndGUgb2xtYWzEsSkKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgY29uZmlnX2Fzc2V0PUFzc2V0KGFzc2V0X2lkKSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE4MAogICAgLy8gc2VsZi5jYW5jZWxlZF9ieV9oYXNoW2ZpbGVfaGFzaF0gPSBVSW50NjQoMSkKICAgIGludGNfMSAvLyAxCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMQogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxODEKICAgIC8vIHNlbGYuc2lnbmVyc19ibG9iX2J5X2hhc2hbZmlsZV9oYXNoXSA9IEJ5dGVzKGIiIikKICAgIGJ5dGVjIDQgLy8gMHg3MzY3NmU1ZgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBieXRlY18wIC8vIDB4CiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE4MgogICAgLy8gc2VsZi5zaWduZWRfYmxvYl9ieV9oYXNoW2ZpbGVfaGFzaF0gPSBCeXRlcyhiIiIpCiAgICBieXRlY18yIC8vIDB4NzM2NzY4NWYKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgYnl0ZWNfMCAvLyAweAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxODQKICAgIC8vIHJldHVybiBhc3NldF9pZAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmNhbmNlbF9ib29sX2ZhbHNlQDM6CiAgICBpbnRjXzAgLy8gMAogICAgYiBjYW5jZWxfYm9vbF9tZXJnZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLmJsb2Nrc2lnbi5jb250cmFjdC5CbG9ja3NpZ24uc2lnbihmaWxlX2hhc2g6IGJ5dGVzLCBzaWduZXI6IGJ5dGVzKSAtPiB1aW50NjQ6CnNpZ246CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE4Ni0xODcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgc2lnbihzZWxmLCBmaWxlX2hhc2g6IGFyYzQuRHluYW1pY0J5dGVzLCBzaWduZXI6IGFyYzQuQWRkcmVzcykgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICBpbnRjXzAgLy8gMAogICAgZHVwbiAyCiAgICBieXRlY18wIC8vICIiCiAgICBkdXBuIDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTg4CiAgICAvLyBhc3NlcnQgR2xvYmFsLmdyb3VwX3NpemUgPT0gMSwgImludmFsaWQgZ3JvdXAgc2l6ZSIKICAgIGdsb2JhbCBHcm91cFNpemUKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgZ3JvdXAgc2l6ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxOTAKICAgIC8vIGNhbmNlbGVkX2ZsYWcsIGNhbmNlbGVkX2V4aXN0cyA9IHNlbGYuY2FuY2VsZWRfYnlfaGFzaC5tYXliZShmaWxlX2hhc2gpCiAgICBieXRlY18zIC8vIDB4NjQ2NTZjNWYKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE5MQogICAgLy8gYXNzZXJ0IG5vdCAoY2FuY2VsZWRfZXhpc3RzIGFuZCBjYW5jZWxlZF9mbGFnID09IDEpLCAiaGFzaCBjYW5jZWxlZCIKICAgIGJ6IHNpZ25fYm9vbF9mYWxzZUAzCiAgICBmcmFtZV9kaWcgOQogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBieiBzaWduX2Jvb2xfZmFsc2VAMwogICAgaW50Y18xIC8vIDEKCnNpZ25fYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxOTEKICAgIC8vIGFzc2VydCBub3QgKGNhbmNlbGVkX2V4aXN0cyBhbmQgY2FuY2VsZWRfZmxhZyA9PSAxKSwgImhhc2ggY2FuY2VsZWQiCiAgICAhCiAgICBhc3NlcnQgLy8gaGFzaCBjYW5jZWxlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxOTMKICAgIC8vIF9hc3NldF9pZCwgZXhpc3RzID0gc2VsZi5hc3NldF9ieV9oYXNoLm1heWJlKGZpbGVfaGFzaCkKICAgIGJ5dGVjIDUgLy8gMHg2MTczNjE1ZgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxOTQKICAgIC8vIGFzc2VydCBleGlzdHMsICJoYXNoIG5vdCBmb3VuZCIKICAgIGFzc2VydCAvLyBoYXNoIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxOTYKICAgIC8vIGFzc2VydCBzaWduZXIuYnl0ZXMgPT0gVHhuLnNlbmRlci5ieXRlcywgInNlbmRlciBtaXNtYXRjaCIKICAgIGZyYW1lX2RpZyAtMQogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBzZW5kZXIgbWlzbWF0Y2gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTk4CiAgICAvLyBzZ25fYmxvYiwgaGFzX3NnbiA9IHNlbGYuc2lnbmVyc19ibG9iX2J5X2hhc2gubWF5YmUoZmlsZV9oYXNoKQogICAgYnl0ZWMgNCAvLyAweDczNjc2ZTVmCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE5OQogICAgLy8gYXNzZXJ0IGhhc19zZ24sICJubyBzaWduZXJzIHNldCIKICAgIGFzc2VydCAvLyBubyBzaWduZXJzIHNldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMDEKICAgIC8vIGkgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjAyCiAgICAvLyBhdXRob3JpemVkID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAzCgpzaWduX3doaWxlX3RvcEA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMDMKICAgIC8vIHdoaWxlIGkgPCBzZ25fYmxvYi5sZW5ndGg6CiAgICBmcmFtZV9kaWcgMgogICAgbGVuCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgOAogICAgZnJhbWVfZGlnIDUKICAgID4KICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9idXJ5IDQKICAgIGJ6IHNpZ25fYWZ0ZXJfd2hpbGVAOQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMDQKICAgIC8vIGlmIHNnbl9ibG9iW2kgOiBpICsgVUludDY0KDMyKV0gPT0gc2lnbmVyLmJ5dGVzOgogICAgZnJhbWVfZGlnIDUKICAgIGR1cAogICAgZnJhbWVfZGlnIDgKICAgIGR1cAogICAgY292ZXIgMwogICAgPj0KICAgIGRpZyAxCiAgICBkaWcgMwogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIHN3YXAKICAgIGludGNfMiAvLyAzMgogICAgKwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDUKICAgIGR1cAogICAgZGlnIDMKICAgID49CiAgICBzd2FwCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkdXAKICAgIGRpZyAyCiAgICA8CiAgICBkaWcgMgogICAgc3dhcAogICAgc2VsZWN0CiAgICBmcmFtZV9kaWcgMgogICAgY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgYnogc2lnbl93aGlsZV90b3BANQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMDUKICAgIC8vIGF1dGhvcml6ZWQgPSBVSW50NjQoMSkKICAgIGludGNfMSAvLyAxCiAgICBmcmFtZV9idXJ5IDQKCnNpZ25fYWZ0ZXJfd2hpbGVAOToKICAgIGZyYW1lX2RpZyA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIwOAogICAgLy8gYXNzZXJ0IGF1dGhvcml6ZWQgPT0gVUludDY0KDEpLCAidW5hdXRob3JpemVkIHNpZ25lciIKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIHVuYXV0aG9yaXplZCBzaWduZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjEwCiAgICAvLyBzZ2hfYmxvYiwgaGFzX3NnaCA9IHNlbGYuc2lnbmVkX2Jsb2JfYnlfaGFzaC5tYXliZShmaWxlX2hhc2gpCiAgICBieXRlY18yIC8vIDB4NzM2NzY4NWYKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgYm94X2dldAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIxMQogICAgLy8gaWYgbm90IGhhc19zZ2g6CiAgICBibnogc2lnbl9hZnRlcl9pZl9lbHNlQDExCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIxMgogICAgLy8gc2doX2Jsb2IgPSBCeXRlcyhiIiIpCiAgICBieXRlY18wIC8vIDB4CiAgICBmcmFtZV9idXJ5IDEKCnNpZ25fYWZ0ZXJfaWZfZWxzZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjE0CiAgICAvLyBqID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSA2CgpzaWduX3doaWxlX3RvcEAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjE1CiAgICAvLyB3aGlsZSBqIDwgc2doX2Jsb2IubGVuZ3RoOgogICAgZnJhbWVfZGlnIDEKICAgIGxlbgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDcKICAgIGZyYW1lX2RpZyA2CiAgICA+CiAgICBieiBzaWduX2FmdGVyX3doaWxlQDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIxNgogICAgLy8gaWYgc2doX2Jsb2JbaiA6IGogKyBVSW50NjQoMzIpXSA9PSBzaWduZXIuYnl0ZXM6CiAgICBmcmFtZV9kaWcgNgogICAgZHVwCiAgICBmcmFtZV9kaWcgNwogICAgZHVwCiAgICBjb3ZlciAzCiAgICA+PQogICAgZGlnIDEKICAgIGRpZyAzCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgc3dhcAogICAgaW50Y18yIC8vIDMyCiAgICArCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNgogICAgZHVwCiAgICBkaWcgMwogICAgPj0KICAgIHN3YXAKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGR1cAogICAgZGlnIDIKICAgIDwKICAgIGRpZyAyCiAgICBzd2FwCiAgICBzZWxlY3QKICAgIGZyYW1lX2RpZyAxCiAgICBjb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICBieiBzaWduX3doaWxlX3RvcEAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMTcKICAgIC8vIHJldHVybiBVSW50NjQoMSkgICMgaWRlbXBvdGVudAogICAgaW50Y18xIC8vIDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpzaWduX2FmdGVyX3doaWxlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMjAKICAgIC8vIHNlbGYuc2lnbmVkX2Jsb2JfYnlfaGFzaFtmaWxlX2hhc2hdID0gc2doX2Jsb2IgKyBzaWduZXIuYnl0ZXMKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIyMQogICAgLy8gcmV0dXJuIFVJbnQ2NCgxKQogICAgaW50Y18xIC8vIDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpzaWduX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICBiIHNpZ25fYm9vbF9tZXJnZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLmJsb2Nrc2lnbi5jb250cmFjdC5CbG9ja3NpZ24uaXNzaWduKGZpbGVfaGFzaDogYnl0ZXMpIC0+IHVpbnQ2NDoKaXNzaWduOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMjMtMjI0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGlzc2lnbihzZWxmLCBmaWxlX2hhc2g6IGFyYzQuRHluYW1pY0J5dGVzKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIGJ5dGVjXzAgLy8gIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMjUKICAgIC8vIGFzc2VydCBHbG9iYWwuZ3JvdXBfc2l6ZSA9PSAxLCAiaW52YWxpZCBncm91cCBzaXplIgogICAgZ2xvYmFsIEdyb3VwU2l6ZQogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBncm91cCBzaXplCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIyNwogICAgLy8gc2doX2Jsb2IsIGhhc19zZ2ggPSBzZWxmLnNpZ25lZF9ibG9iX2J5X2hhc2gubWF5YmUoZmlsZV9oYXNoKQogICAgYnl0ZWNfMiAvLyAweDczNjc2ODVmCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMjgKICAgIC8vIGlmIG5vdCBoYXNfc2doOgogICAgYm56IGlzc2lnbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjI5CiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmlzc2lnbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIzMQogICAgLy8gaSA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMAoKaXNzaWduX3doaWxlX3RvcEAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMzIKICAgIC8vIHdoaWxlIGkgPCBzZ2hfYmxvYi5sZW5ndGg6CiAgICBmcmFtZV9kaWcgMgogICAgbGVuCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfZGlnIDAKICAgID4KICAgIGJ6IGlzc2lnbl9hZnRlcl93aGlsZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIzMwogICAgLy8gaWYgc2doX2Jsb2JbaSA6IGkgKyBVSW50NjQoMzIpXSA9PSBUeG4uc2VuZGVyLmJ5dGVzOgogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgY292ZXIgMwogICAgPj0KICAgIGRpZyAxCiAgICBkaWcgMwogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIHN3YXAKICAgIGludGNfMiAvLyAzMgogICAgKwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGR1cAogICAgZGlnIDMKICAgID49CiAgICBzd2FwCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkdXAKICAgIGRpZyAyCiAgICA8CiAgICBkaWcgMgogICAgc3dhcAogICAgc2VsZWN0CiAgICBmcmFtZV9kaWcgMgogICAgY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGJ6IGlzc2lnbl93aGlsZV90b3BAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMzQKICAgIC8vIHJldHVybiBVSW50NjQoMSkKICAgIGludGNfMSAvLyAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKaXNzaWduX2FmdGVyX3doaWxlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIzNwogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJsb2Nrc2lnbi5jb250cmFjdC5CbG9ja3NpZ24uaXNjb21wbGV0ZShmaWxlX2hhc2g6IGJ5dGVzKSAtPiB1aW50NjQ6CmlzY29tcGxldGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIzOS0yNDAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgaXNjb21wbGV0ZShzZWxmLCBmaWxlX2hhc2g6IGFyYzQuRHluYW1pY0J5dGVzKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIGludGNfMCAvLyAwCiAgICBkdXBuIDIKICAgIGJ5dGVjXzAgLy8gIiIKICAgIGR1cG4gNQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyNDEKICAgIC8vIGFzc2VydCBHbG9iYWwuZ3JvdXBfc2l6ZSA9PSAxLCAiaW52YWxpZCBncm91cCBzaXplIgogICAgZ2xvYmFsIEdyb3VwU2l6ZQogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBncm91cCBzaXplCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI0MwogICAgLy8gY2FuY2VsZWRfZmxhZywgY2FuY2VsZWRfZXhpc3RzID0gc2VsZi5jYW5jZWxlZF9ieV9oYXNoLm1heWJlKGZpbGVfaGFzaCkKICAgIGJ5dGVjXzMgLy8gMHg2NDY1NmM1ZgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjQ0CiAgICAvLyBpZiBjYW5jZWxlZF9leGlzdHMgYW5kIGNhbmNlbGVkX2ZsYWcgPT0gVUludDY0KDEpOgogICAgYnogaXNjb21wbGV0ZV9hZnRlcl9pZl9lbHNlQDMKICAgIGZyYW1lX2RpZyA5CiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGJ6IGlzY29tcGxldGVfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI0NQogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgppc2NvbXBsZXRlX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjQ3CiAgICAvLyBzZ25fYmxvYiwgaGFzX3NnbiA9IHNlbGYuc2lnbmVyc19ibG9iX2J5X2hhc2gubWF5YmUoZmlsZV9oYXNoKQogICAgYnl0ZWMgNCAvLyAweDczNjc2ZTVmCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI0OAogICAgLy8gaWYgbm90IGhhc19zZ24gb3Igc2duX2Jsb2IubGVuZ3RoID09IFVJbnQ2NCgwKToKICAgIGJ6IGlzY29tcGxldGVfaWZfYm9keUA1CiAgICBmcmFtZV9kaWcgMQogICAgbGVuCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNwogICAgYm56IGlzY29tcGxldGVfYWZ0ZXJfaWZfZWxzZUA2Cgppc2NvbXBsZXRlX2lmX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjQ5CiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmlzY29tcGxldGVfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyNTEKICAgIC8vIHNnaF9ibG9iLCBoYXNfc2doID0gc2VsZi5zaWduZWRfYmxvYl9ieV9oYXNoLm1heWJlKGZpbGVfaGFzaCkKICAgIGJ5dGVjXzIgLy8gMHg3MzY3Njg1ZgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyNTIKICAgIC8vIGlmIG5vdCBoYXNfc2doIG9yIHNnaF9ibG9iLmxlbmd0aCA9PSBVSW50NjQoMCk6CiAgICBieiBpc2NvbXBsZXRlX2lmX2JvZHlAOAogICAgZnJhbWVfZGlnIDAKICAgIGxlbgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDgKICAgIGJueiBpc2NvbXBsZXRlX2FmdGVyX2lmX2Vsc2VAOQoKaXNjb21wbGV0ZV9pZl9ib2R5QDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI1MwogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgppc2NvbXBsZXRlX2FmdGVyX2lmX2Vsc2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjU1CiAgICAvLyBpID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSA1Cgppc2NvbXBsZXRlX3doaWxlX3RvcEAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjU2CiAgICAvLyB3aGlsZSBpIDwgc2duX2Jsb2IubGVuZ3RoOgogICAgZnJhbWVfZGlnIDUKICAgIGZyYW1lX2RpZyA3CiAgICA8CiAgICBieiBpc2NvbXBsZXRlX2FmdGVyX3doaWxlQDE5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI1NwogICAgLy8gc2lnbmVyX2J5dGVzID0gc2duX2Jsb2JbaSA6IGkgKyBVSW50NjQoMzIpXQogICAgZnJhbWVfZGlnIDUKICAgIGR1cAogICAgZnJhbWVfZGlnIDcKICAgIGR1cAogICAgY292ZXIgMwogICAgPj0KICAgIGRpZyAxCiAgICBkaWcgMwogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIHN3YXAKICAgIGludGNfMiAvLyAzMgogICAgKwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDUKICAgIGR1cAogICAgZGlnIDMKICAgID49CiAgICBzd2FwCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkdXAKICAgIGRpZyAyCiAgICA8CiAgICBkaWcgMgogICAgc3dhcAogICAgc2VsZWN0CiAgICBmcmFtZV9kaWcgMQogICAgY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI1OAogICAgLy8gaiA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgNgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyNTkKICAgIC8vIGZvdW5kID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAzCgppc2NvbXBsZXRlX3doaWxlX3RvcEAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjYwCiAgICAvLyB3aGlsZSBqIDwgc2doX2Jsb2IubGVuZ3RoOgogICAgZnJhbWVfZGlnIDYKICAgIGZyYW1lX2RpZyA4CiAgICA8CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfYnVyeSA0CiAgICBieiBpc2NvbXBsZXRlX2FmdGVyX3doaWxlQDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI2MQogICAgLy8gaWYgc2doX2Jsb2JbaiA6IGogKyBVSW50NjQoMzIpXSA9PSBzaWduZXJfYnl0ZXM6CiAgICBmcmFtZV9kaWcgNgogICAgZHVwCiAgICBmcmFtZV9kaWcgOAogICAgZHVwCiAgICBjb3ZlciAzCiAgICA+PQogICAgZGlnIDEKICAgIGRpZyAzCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgc3dhcAogICAgaW50Y18yIC8vIDMyCiAgICArCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNgogICAgZHVwCiAgICBkaWcgMwogICAgPj0KICAgIHN3YXAKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGR1cAogICAgZGlnIDIKICAgIDwKICAgIGRpZyAyCiAgICBzd2FwCiAgICBzZWxlY3QKICAgIGZyYW1lX2RpZyAwCiAgICBjb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBmcmFtZV9kaWcgMgogICAgPT0KICAgIGJ6IGlzY29tcGxldGVfd2hpbGVfdG9wQDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI2MgogICAgLy8gZm91bmQgPSBVSW50NjQoMSkKICAgIGludGNfMSAvLyAxCiAgICBmcmFtZV9idXJ5IDQKCmlzY29tcGxldGVfYWZ0ZXJfd2hpbGVAMTY6CiAgICBmcmFtZV9kaWcgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyNjUKICAgIC8vIGlmIGZvdW5kID09IFVJbnQ2NCgwKToKICAgIGJueiBpc2NvbXBsZXRlX3doaWxlX3RvcEAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyNjYKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKaXNjb21wbGV0ZV9hZnRlcl93aGlsZUAxOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjY5CiAgICAvLyByZXR1cm4gVUludDY0KDEpCiAgICBpbnRjXzEgLy8gMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYmxvY2tzaWduLmNvbnRyYWN0LkJsb2Nrc2lnbi5yZWplY3QoZmlsZV9oYXNoOiBieXRlcywgc2lnbmVyOiBieXRlcykgLT4gdWludDY0OgpyZWplY3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI3MS0yNzIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgcmVqZWN0KHNlbGYsIGZpbGVfaGFzaDogYXJjNC5EeW5hbWljQnl0ZXMsIHNpZ25lcjogYXJjNC5BZGRyZXNzKSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIGJ5dGVjXzAgLy8gIiIKICAgIGR1cG4gNAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyNzMKICAgIC8vIGFzc2VydCBHbG9iYWwuZ3JvdXBfc2l6ZSA9PSAxLCAiaW52YWxpZCBncm91cCBzaXplIgogICAgZ2xvYmFsIEdyb3VwU2l6ZQogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBncm91cCBzaXplCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI3NQogICAgLy8gY2FuY2VsZWRfZmxhZywgY2FuY2VsZWRfZXhpc3RzID0gc2VsZi5jYW5jZWxlZF9ieV9oYXNoLm1heWJlKGZpbGVfaGFzaCkKICAgIGJ5dGVjXzMgLy8gMHg2NDY1NmM1ZgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyNzYKICAgIC8vIGFzc2VydCBub3QgKGNhbmNlbGVkX2V4aXN0cyBhbmQgY2FuY2VsZWRfZmxhZyA9PSAxKSwgImhhc2ggY2FuY2VsZWQiCiAgICBieiByZWplY3RfYm9vbF9mYWxzZUAzCiAgICBmcmFtZV9kaWcgOAogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBieiByZWplY3RfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzEgLy8gMQoKcmVqZWN0X2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6Mjc2CiAgICAvLyBhc3NlcnQgbm90IChjYW5jZWxlZF9leGlzdHMgYW5kIGNhbmNlbGVkX2ZsYWcgPT0gMSksICJoYXNoIGNhbmNlbGVkIgogICAgIQogICAgYXNzZXJ0IC8vIGhhc2ggY2FuY2VsZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6Mjc4CiAgICAvLyBhc3NldF9pZCwgZXhpc3RzID0gc2VsZi5hc3NldF9ieV9oYXNoLm1heWJlKGZpbGVfaGFzaCkKICAgIGJ5dGVjIDUgLy8gMHg2MTczNjE1ZgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyNzkKICAgIC8vIGFzc2VydCBleGlzdHMsICJoYXNoIG5vdCBmb3VuZCIKICAgIGFzc2VydCAvLyBoYXNoIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyODEKICAgIC8vIGFzc2VydCBzaWduZXIuYnl0ZXMgPT0gVHhuLnNlbmRlci5ieXRlcywgInNlbmRlciBtaXNtYXRjaCIKICAgIGZyYW1lX2RpZyAtMQogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBzZW5kZXIgbWlzbWF0Y2gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjgzCiAgICAvLyBzZ25fYmxvYiwgaGFzX3NnbiA9IHNlbGYuc2lnbmVyc19ibG9iX2J5X2hhc2gubWF5YmUoZmlsZV9oYXNoKQogICAgYnl0ZWMgNCAvLyAweDczNjc2ZTVmCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyODQKICAgIC8vIGFzc2VydCBoYXNfc2duLCAibm8gc2lnbmVycyBzZXQiCiAgICBhc3NlcnQgLy8gbm8gc2lnbmVycyBzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6Mjg1CiAgICAvLyBpID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI4NgogICAgLy8gYXV0aG9yaXplZCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMwoKcmVqZWN0X3doaWxlX3RvcEA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyODcKICAgIC8vIHdoaWxlIGkgPCBzZ25fYmxvYi5sZW5ndGg6CiAgICBmcmFtZV9kaWcgMQogICAgbGVuCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNgogICAgZnJhbWVfZGlnIDUKICAgID4KICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9idXJ5IDQKICAgIGJ6IHJlamVjdF9hZnRlcl93aGlsZUA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI4OAogICAgLy8gaWYgc2duX2Jsb2JbaSA6IGkgKyBVSW50NjQoMzIpXSA9PSBzaWduZXIuYnl0ZXM6CiAgICBmcmFtZV9kaWcgNQogICAgZHVwCiAgICBmcmFtZV9kaWcgNgogICAgZHVwCiAgICBjb3ZlciAzCiAgICA+PQogICAgZGlnIDEKICAgIGRpZyAzCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgc3dhcAogICAgaW50Y18yIC8vIDMyCiAgICArCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNQogICAgZHVwCiAgICBkaWcgMwogICAgPj0KICAgIHN3YXAKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGR1cAogICAgZGlnIDIKICAgIDwKICAgIGRpZyAyCiAgICBzd2FwCiAgICBzZWxlY3QKICAgIGZyYW1lX2RpZyAxCiAgICBjb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICBieiByZWplY3Rfd2hpbGVfdG9wQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6Mjg5CiAgICAvLyBhdXRob3JpemVkID0gVUludDY0KDEpCiAgICBpbnRjXzEgLy8gMQogICAgZnJhbWVfYnVyeSA0CgpyZWplY3RfYWZ0ZXJfd2hpbGVAOToKICAgIGZyYW1lX2RpZyA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI5MgogICAgLy8gYXNzZXJ0IGF1dGhvcml6ZWQgPT0gVUludDY0KDEpLCAidW5hdXRob3JpemVkIHNpZ25lciIKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIHVuYXV0aG9yaXplZCBzaWduZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6Mjk0LTI5NgogICAgLy8gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBjb25maWdfYXNzZXQ9QXNzZXQoYXNzZXRfaWQpLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyOTQKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICBpbnRjXzMgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI5NC0yOTYKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgY29uZmlnX2Fzc2V0PUFzc2V0KGFzc2V0X2lkKSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI5OAogICAgLy8gc2VsZi5jYW5jZWxlZF9ieV9oYXNoW2ZpbGVfaGFzaF0gPSBVSW50NjQoMSkKICAgIGludGNfMSAvLyAxCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgNwogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyOTkKICAgIC8vIHNlbGYuc2lnbmVyc19ibG9iX2J5X2hhc2hbZmlsZV9oYXNoXSA9IEJ5dGVzKGIiIikKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgYnl0ZWNfMCAvLyAweAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMDAKICAgIC8vIHNlbGYuc2lnbmVkX2Jsb2JfYnlfaGFzaFtmaWxlX2hhc2hdID0gQnl0ZXMoYiIiKQogICAgYnl0ZWNfMiAvLyAweDczNjc2ODVmCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJ5dGVjXzAgLy8gMHgKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzAyCiAgICAvLyByZXR1cm4gYXNzZXRfaWQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpyZWplY3RfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIGIgcmVqZWN0X2Jvb2xfbWVyZ2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ibG9ja3NpZ24uY29udHJhY3QuQmxvY2tzaWduLm15X2NvbnRyYWN0cygpIC0+IGJ5dGVzOgpteV9jb250cmFjdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMwNC0zMDUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgbXlfY29udHJhY3RzKHNlbGYpIC0+IEJ5dGVzOgogICAgcHJvdG8gMCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMxMQogICAgLy8gYmxvYiwgaGFzID0gc2VsZi51c2VyX2hhc2hlcy5tYXliZShrZXkpCiAgICBieXRlYyA2IC8vIDB4NzU2ODczNWYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzEwCiAgICAvLyBrZXkgPSBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlci5ieXRlcykKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzExCiAgICAvLyBibG9iLCBoYXMgPSBzZWxmLnVzZXJfaGFzaGVzLm1heWJlKGtleSkKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMTIKICAgIC8vIGlmIG5vdCBoYXM6CiAgICBibnogbXlfY29udHJhY3RzX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMTMKICAgIC8vIHJldHVybiBCeXRlcyhiIiIpCiAgICBieXRlY18wIC8vIDB4CiAgICBzd2FwCiAgICByZXRzdWIKCm15X2NvbnRyYWN0c19hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMxNAogICAgLy8gcmV0dXJuIGJsb2IKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYmxvY2tzaWduLmNvbnRyYWN0LkJsb2Nrc2lnbi5nZXRfYXNzZXRfaWQoZmlsZV9oYXNoOiBieXRlcykgLT4gdWludDY0OgpnZXRfYXNzZXRfaWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMxNi0zMTgKICAgIC8vICMgLS0tLSBBeXLEsSBva3VtYSBtZXRvZGxhcsSxICh0dXBsZSB5ZXJpbmUpIC0tLS0KICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgZ2V0X2Fzc2V0X2lkKHNlbGYsIGZpbGVfaGFzaDogYXJjNC5EeW5hbWljQnl0ZXMpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMTkKICAgIC8vIGFzc2V0X2lkLCBoYXNfYXNzZXQgPSBzZWxmLmFzc2V0X2J5X2hhc2gubWF5YmUoZmlsZV9oYXNoKQogICAgYnl0ZWMgNSAvLyAweDYxNzM2MTVmCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMjAKICAgIC8vIGlmIG5vdCBoYXNfYXNzZXQ6CiAgICBibnogZ2V0X2Fzc2V0X2lkX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMjEKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICByZXRzdWIKCmdldF9hc3NldF9pZF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMyMgogICAgLy8gcmV0dXJuIGFzc2V0X2lkCiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJsb2Nrc2lnbi5jb250cmFjdC5CbG9ja3NpZ24uaXNfYWN0aXZlKGZpbGVfaGFzaDogYnl0ZXMpIC0+IHVpbnQ2NDoKaXNfYWN0aXZlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMjQtMzI1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGlzX2FjdGl2ZShzZWxmLCBmaWxlX2hhc2g6IGFyYzQuRHluYW1pY0J5dGVzKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzI2CiAgICAvLyBjYW5jZWxlZF9mbGFnLCBjYW5jZWxlZF9leGlzdHMgPSBzZWxmLmNhbmNlbGVkX2J5X2hhc2gubWF5YmUoZmlsZV9oYXNoKQogICAgYnl0ZWNfMyAvLyAweDY0NjU2YzVmCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMjcKICAgIC8vIGlmIGNhbmNlbGVkX2V4aXN0cyBhbmQgY2FuY2VsZWRfZmxhZyA9PSBVSW50NjQoMSk6CiAgICBieiBpc19hY3RpdmVfYWZ0ZXJfaWZfZWxzZUAzCiAgICBmcmFtZV9kaWcgMAogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBieiBpc19hY3RpdmVfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMyOAogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHJldHN1YgoKaXNfYWN0aXZlX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzI5CiAgICAvLyByZXR1cm4gVUludDY0KDEpCiAgICBpbnRjXzEgLy8gMQogICAgc3dhcAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJsb2Nrc2lnbi5jb250cmFjdC5CbG9ja3NpZ24udG90YWxfc2lnbmVycyhmaWxlX2hhc2g6IGJ5dGVzKSAtPiB1aW50NjQ6CnRvdGFsX3NpZ25lcnM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMzMS0zMzIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgdG90YWxfc2lnbmVycyhzZWxmLCBmaWxlX2hhc2g6IGFyYzQuRHluYW1pY0J5dGVzKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIGJ5dGVjXzAgLy8gIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMzMKICAgIC8vIHNnbl9ibG9iLCBoYXNfc2duID0gc2VsZi5zaWduZXJzX2Jsb2JfYnlfaGFzaC5tYXliZShmaWxlX2hhc2gpCiAgICBieXRlYyA0IC8vIDB4NzM2NzZlNWYKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMzNAogICAgLy8gaWYgbm90IGhhc19zZ246CiAgICBibnogdG90YWxfc2lnbmVyc19hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzM1CiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCnRvdGFsX3NpZ25lcnNfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMzYtMzM3CiAgICAvLyAjIDMyIGJheXRsxLFrIHBhcsOnYSBzYXkKICAgIC8vIGkgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzM4CiAgICAvLyBjbnQgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDAKCnRvdGFsX3NpZ25lcnNfd2hpbGVfdG9wQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMzOQogICAgLy8gd2hpbGUgaSA8IHNnbl9ibG9iLmxlbmd0aDoKICAgIGZyYW1lX2RpZyAyCiAgICBsZW4KICAgIGZyYW1lX2RpZyAxCiAgICA+CiAgICBieiB0b3RhbF9zaWduZXJzX2FmdGVyX3doaWxlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzQwCiAgICAvLyBjbnQgPSBjbnQgKyBVSW50NjQoMSkKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM0MQogICAgLy8gaSA9IGkgKyBVSW50NjQoMzIpCiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18yIC8vIDMyCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgdG90YWxfc2lnbmVyc193aGlsZV90b3BAMwoKdG90YWxfc2lnbmVyc19hZnRlcl93aGlsZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozNDIKICAgIC8vIHJldHVybiBjbnQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ibG9ja3NpZ24uY29udHJhY3QuQmxvY2tzaWduLnNpZ25lZF9jb3VudChmaWxlX2hhc2g6IGJ5dGVzKSAtPiB1aW50NjQ6CnNpZ25lZF9jb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzQ0LTM0NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBzaWduZWRfY291bnQoc2VsZiwgZmlsZV9oYXNoOiBhcmM0LkR5bmFtaWNCeXRlcykgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICBieXRlY18wIC8vICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzQ2CiAgICAvLyBzZ2hfYmxvYiwgaGFzX3NnaCA9IHNlbGYuc2lnbmVkX2Jsb2JfYnlfaGFzaC5tYXliZShmaWxlX2hhc2gpCiAgICBieXRlY18yIC8vIDB4NzM2NzY4NWYKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM0NwogICAgLy8gaWYgbm90IGhhc19zZ2g6CiAgICBibnogc2lnbmVkX2NvdW50X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozNDgKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKc2lnbmVkX2NvdW50X2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzQ5LTM1MAogICAgLy8gIyAzMiBiYXl0bMSxayBwYXLDp2Egc2F5CiAgICAvLyBpID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM1MQogICAgLy8gY250ID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAwCgpzaWduZWRfY291bnRfd2hpbGVfdG9wQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM1MgogICAgLy8gd2hpbGUgaSA8IHNnaF9ibG9iLmxlbmd0aDoKICAgIGZyYW1lX2RpZyAyCiAgICBsZW4KICAgIGZyYW1lX2RpZyAxCiAgICA+CiAgICBieiBzaWduZWRfY291bnRfYWZ0ZXJfd2hpbGVANQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozNTMKICAgIC8vIGNudCA9IGNudCArIFVJbnQ2NCgxKQogICAgZnJhbWVfZGlnIDAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzU0CiAgICAvLyBpID0gaSArIFVJbnQ2NCgzMikKICAgIGZyYW1lX2RpZyAxCiAgICBpbnRjXzIgLy8gMzIKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiBzaWduZWRfY291bnRfd2hpbGVfdG9wQDMKCnNpZ25lZF9jb3VudF9hZnRlcl93aGlsZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozNTUKICAgIC8vIHJldHVybiBjbnQKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [712], "errorMessage": "Index access is out of bounds"}, {"pc": [134, 154, 174, 194, 214, 238, 261, 281, 301, 324, 344], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [906], "errorMessage": "already canceled"}, {"pc": [372], "errorMessage": "can only call when creating"}, {"pc": [137, 157, 177, 197, 217, 241, 264, 284, 304, 327, 347], "errorMessage": "can only call when not creating"}, {"pc": [454], "errorMessage": "close not allowed"}, {"pc": [410], "errorMessage": "group must be size 2 (Payment + AppCall)"}, {"pc": [404, 986, 1558], "errorMessage": "hash canceled"}, {"pc": [884, 995, 1569], "errorMessage": "hash not found"}, {"pc": [433], "errorMessage": "insufficient payment: need >= 5 ALGO"}, {"pc": [965, 1209, 1309, 1536], "errorMessage": "invalid group size"}, {"pc": [1011, 1588], "errorMessage": "no signers set"}, {"pc": [874], "errorMessage": "only app creator can cancel"}, {"pc": [440], "errorMessage": "payer must be the caller"}, {"pc": [423], "errorMessage": "payment must go to app address"}, {"pc": [447], "errorMessage": "rekey not allowed"}, {"pc": [1001, 1575], "errorMessage": "sender mismatch"}, {"pc": [416], "errorMessage": "transaction type is pay"}, {"pc": [1092, 1669], "errorMessage": "unauthorized signer"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}, {"type": "address[]", "name": "signers"}], "name": "create_contract", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}], "name": "cancel", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}, {"type": "address", "name": "signer"}], "name": "sign", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}], "name": "issign", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}], "name": "iscomplete", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}, {"type": "address", "name": "signer"}], "name": "reject", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "box_refs", "returns": {"type": "void"}, "desc": "create_contract / cancel / reject grubunda ek box referans\u0131 ta\u015f\u0131y\u0131c\u0131s\u0131; durum de\u011fi\u015ftirmez.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "my_contracts", "returns": {"type": "byte[]"}, "desc": "Txn.sender\u2019\u0131n olu\u015fturdu\u011fu t\u00fcm s\u00f6zle\u015fme hash\u2019lerini d\u00f6ner.\nD\u00f6n\u00fc\u015f: 32 baytl\u0131k hash\u2019lerin ard\u0131\u015f\u0131k olarak birikti\u011fi Bytes blob\u2019u.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}], "name": "get_asset_id", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}], "name": "is_active", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}], "name": "total_signers", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "file_hash"}], "name": "signed_count", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}], "name": "Blocksign", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {"asset_by_hash": {"keyType": "byte[]", "valueType": "uint64", "prefix": "YXNhXw=="}, "admin_by_hash": {"keyType": "byte[]", "valueType": "address", "prefix": "YWRtXw=="}, "signers_blob_by_hash": {"keyType": "byte[]", "valueType": "AVMBytes", "prefix": "c2duXw=="}, "canceled_by_hash": {"keyType": "byte[]", "valueType": "uint64", "prefix": "ZGVsXw=="}, "signed_blob_by_hash": {"keyType": "byte[]", "valueType": "AVMBytes", "prefix": "c2doXw=="}, "user_hashes": {"keyType": "address", "valueType": "AVMBytes", "prefix": "dWhzXw=="}, "member_by_key": {"keyType": "AVMBytes", "valueType": "uint64", "prefix": "bWJyXw=="}, "signed_bits_by_hash": {"keyType": "byte[]", "valueType": "AVMBytes", "prefix": "c2JtXw=="}, "count_by_hash": {"keyType": "byte[]", "valueType": "SignCount", "prefix": "Y250Xw=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"SignCount": [{"name": "total", "type": "uint64"}, {"name": "signed", "type": "uint64"}]}, "byteCode": {"approval": "CiAEAQAIICYMBBUffHUABGRlbF8EY250XwRhc2FfBG1icl8Ec2JtXwR1aHNfBHNnbl8Ec2doXwSOlpqvCAAAAAAAAAAAMRtBAU6CBgTAU3ybBL8V0ncEjxo+kgQae9SpBH50whgEYxweeycKggUER0H1UwSm7Bb/BLdpaQ4EE5/iuAQpYNZyNhoAjgwA3QDJALIAngCKAHMAagBSAD4AKgAWAAIjQzEZFEQxGEQ2GgGIBkYWKExQsCJDMRkURDEYRDYaAYgGHhYoTFCwIkMxGRREMRhENhoBiAXvFihMULAiQzEZFEQxGEQ2GgGIBcUWKExQsCJDMRkURDEYRIgFoUkVFlcGAkxQKExQsCJDMRkURDEYRCJDMRkURDEYRDYaATYaAogFHBYoTFCwIkMxGRREMRhENhoBiAS4FihMULAiQzEZFEQxGEQ2GgGIBFoWKExQsCJDMRkURDEYRDYaATYaAogDgBYoTFCwIkMxGRREMRhENhoBiAKTFihMULAiQzEZFEQxGEQ2GgE2GgKIABIWKExQsCJDMRlA/wcxGBREIkOKAgEjRwUpRwsqi/5QvkwXTEECI4sSIhJBAhwiFEQyBIECD0QxFiISRIgCDyM4ECISRCM4BzIKEkQjOAiBwJaxAg9EIzgAMQASRCM4IDIDEkQjOAkyAxJEJwSL/lBJjAK+TBeMBkEAdCcHMQBQSYwEvkyMAUAAAymMASOMCCOMDIsBFUmMDosIDYsMjA1BADaLCEmLDklOAw9LAUsDTwJNTCUISYwISUsDD0xPA08CTUlLAgxLAkxNiwFOAlKL/hJB/70ijA2LDUAADIsBi/5QiwRJvEhMv4sGjACJi/4VJEsBDyROAk2L/iNPAlKABUZJTEUtTFCxMgoyA0cCsiyyK7IqsimyJoAERklMRbIlI7IkI7IjIrIigQOyECOyAbO0PEmMChaLAky/MgmABGFkbV+L/lBMvymMACOMByOMEIv/I1mMC4sHiwsMQQBCi/9XAgCLByULJViLAEsBUIwAi/5MUAEnBUxQSYwFvUUBixCMEUAADYsHFosFTL+LECIIjBGLEYwQiwciCIwHQv+2JwiL/lBJvEiLAL+LC4EHCCQKrycGi/5QSbxITL+LEBYnC1Ari/5QTL8nCYv+UEm8SCm/JwcxAFBJjAO+TIwBQAADKYwBI4wJI4wMiwEVSYwPiwkNiwyMDUEANosJSYsPSU4DD0sBSwNPAk1MJQhJjAlJSwMPTE8DTwJNSUsCDEsCTE2LAU4CUov+EkH/vSKMDYsNQAAMiwGL/lCLA0m8SEy/iwqMAIkjQv3higAAMRYiCIsAMgQMQQAfiwBJOBCBBhJESTgYMggSREkjwhonChJEIgiMAEL/2YmKAQExADIJEkQxFhREiP/BJwSL/1C+TBdMRCqL/1BJvkwXTEEAKIsCIhJBACEiFESxiwBJsiGBA7IQI7IBsyIWiwFMv4v/iAAJjP+MAIkjQv/cigEBKScIi/9QvkQji/+LARVJjACLAg1BAEeLAkmLAElOAw9LAUsDTwJNTCUISYwCSUsDD0xPA08CTUlLAgxLAkxNiwFOAlJJFSUSRIv/TFABJwVMULxIi/9JjAOM/0L/rScIi/9QSbxIKb8nCYv/UEm8SCm/JwaL/1C8SCuL/1C8SIsDjACJigIBI0cCKUcCMgQiEkQqi/5QvkwXTEEAposGIhJBAJ8iFEQnBIv+UL5FAUSL/zEAEkSL/ov/UAEnBUxQvkwXTEQnBov+UElOAowASSQKSU4CjAQkGElOAowDTwJMIrpJjAFMUyISQQAEIowAiYsBiwMiVIsAiwRPArsri/5QSb5ESVcACEwkWyIIFlC/JwmL/lBJjAK9TIwFQQAFiwVAAAyLAkm8SIv/vyKMAImLBUklCIsCSU8C00yL/7tC/+ojQv9eigEBKTIEIhJEKov/UL5MF0xBAAuLASISQQAEI4wAiYv/MQBQAScFTFC+TBeMAEAABCOMAIknBov/UIsASU4CJAoiukwkGFOMAImKAQEjSTIEIhJEKov/UL5MF0xBAAuLAiISQQAEI4wAiSuL/1C+TIwAQQAOiwBXAAhJjAEnC6hBAAQjjACJiwBXCAiLAahBAAQijACJI4wAiYoCATEWFESI/ZEqi/5QSb5MF0xBAESLASISQQA9IhREJwSL/lC+TBdMRIv/MQASRIv+i/9QAScFTFC9RQFEsUmyIYEDshAjsgGzIhaLAEy/i/6I/ceM/owAiSNC/8CKAAEnBzEAUL5AAAMpTImLAEyJigEBJwSL/1C+TBdMQAADI0yJiwBMiYoBASqL/1C+TBdMQQAKiwAiEkEAAyNMiSJMiYoBASuL/1C+QAADI0yJiwAjW0yJigEBK4v/UL5AAAMjTImLACRbTIk=", "clear": "CoEBQw=="}, "desc": "\n    create_contract(file_hash, signers):\n      - Gtxn[0]: Payment -> app address, amount >= 5 ALGO, sender == caller\n      - Gtxn[1]: AppCall (bu method)\n      - Gtxn[2..]: (iste\u011fe ba\u011fl\u0131) box_refs \u00e7a\u011fr\u0131lar\u0131; yaln\u0131zca ek box referans\u0131 ta\u015f\u0131r\n      - 1 adetlik NFT (ASA) mint eder, manager = app address\n      - file_hash -> asset_id ve admin e\u015fle\u015fmesini box storage'da tutar\n      - signers (address[]) -> tek box'ta (sgn_) ard\u0131\u015f\u0131k 32B adres blob'u olarak saklan\u0131r\n      - her imzac\u0131 i\u00e7in mbr_ kutusu: sha256(file_hash || signer) -> sgn_ listesindeki s\u0131ra\n      - sbm_: s\u0131raya g\u00f6re imza bitmap'i (s\u0131f\u0131rl\u0131), cnt_: (tekil imzac\u0131, imzalayan) saya\u00e7lar\u0131\n      - asset_id d\u00f6nd\u00fcr\u00fcr\n\n    cancel(file_hash):\n      - Sadece uygulamay\u0131 olu\u015fturan hesap (Global.creator_address) \u00e7a\u011f\u0131rabilir\n      - (M\u00fcmk\u00fcnse) ASA\u2019y\u0131 siler, kayd\u0131 iptal eder\n      - Gtxn[0] olmal\u0131; sonras\u0131 yaln\u0131zca box_refs \u00e7a\u011fr\u0131lar\u0131 (imzac\u0131 ba\u015f\u0131na mbr_ referanslar\u0131)\n      - sgn_/sgh_ bo\u015falt\u0131l\u0131r; sbm_, cnt_ ve t\u00fcm mbr_ kutular\u0131 silinir (MBR iade)\n\n    sign(file_hash, signer):\n      - Sadece yetkili imzac\u0131lar (mbr_ kutusu olan adresler) \u00e7a\u011f\u0131rabilir\n      - signer.bytes == Txn.sender.bytes olmal\u0131\n      - sbm_'de imzac\u0131n\u0131n bitini set eder, cnt_.signed'\u0131 art\u0131r\u0131r ve sgh_ kutusuna ekler (idempotent)\n      - \u0130mzac\u0131 say\u0131s\u0131ndan ba\u011f\u0131ms\u0131z: mbr_ + bitmap'in tek bayt\u0131, sgh_ taranmaz\n\n    issign(file_hash):\n      - Txn.sender bu hash\u2019i imzalam\u0131\u015f m\u0131? (1/0; iptal edilmi\u015fse 0)\n\n    iscomplete(file_hash):\n      - Listedeki t\u00fcm imzac\u0131lar imzalam\u0131\u015f m\u0131? (1/0; cnt_.signed == cnt_.total)\n\n    reject(file_hash, signer):\n      - signers listesindeki herhangi bir ki\u015fi reddederse ASA silinip kay\u0131t iptal edilir\n      - yetki kontrol\u00fc sign ile ayn\u0131 (tek mbr_ okumas\u0131)\n      - temizlik ve grup d\u00fczeni cancel ile ayn\u0131\n\n    box_refs():\n      - Etkisiz; create_contract / cancel / reject grubunda 8'den fazla box referans\u0131\n        gerekti\u011finde ek referanslar\u0131 ta\u015f\u0131r (grup i\u00e7i kaynak payla\u015f\u0131m\u0131)\n\n    my_contracts():\n      - Txn.sender\u2019\u0131n olu\u015fturdu\u011fu s\u00f6zle\u015fme hash\u2019lerini 32B ard\u0131\u015f\u0131k blob olarak d\u00f6ner\n\n    A\u015fa\u011f\u0131daki okuma metodlar\u0131 tek tek bilgi verir (tuple yerine):\n      - get_asset_id(file_hash)  -> UInt64\n      - is_active(file_hash)     -> UInt64 (iptal edilmemi\u015f:1 / iptal:0)\n      - total_signers(file_hash) -> UInt64 (tekil imzac\u0131 say\u0131s\u0131, cnt_)\n      - signed_count(file_hash)  -> UInt64 (cnt_)\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYmxvY2tzaWduLmNvbnRyYWN0LkJsb2Nrc2lnbi5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDAgOCAzMgogICAgYnl0ZWNibG9jayAweDE1MWY3Yzc1IDB4IDB4NjQ2NTZjNWYgMHg2MzZlNzQ1ZiAweDYxNzM2MTVmIDB4NmQ2MjcyNWYgMHg3MzYyNmQ1ZiAweDc1Njg3MzVmIDB4NzM2NzZlNWYgMHg3MzY3Njg1ZiAweDhlOTY5YWFmIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMAogICAgLy8gY2xhc3MgQmxvY2tzaWduKEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAMTcKICAgIHB1c2hieXRlc3MgMHhjMDUzN2M5YiAweGJmMTVkMjc3IDB4OGYxYTNlOTIgMHgxYTdiZDRhOSAweDdlNzRjMjE4IDB4NjMxYzFlN2IgLy8gbWV0aG9kICJjcmVhdGVfY29udHJhY3QoYnl0ZVtdLGFkZHJlc3NbXSl1aW50NjQiLCBtZXRob2QgImNhbmNlbChieXRlW10pdWludDY0IiwgbWV0aG9kICJzaWduKGJ5dGVbXSxhZGRyZXNzKXVpbnQ2NCIsIG1ldGhvZCAiaXNzaWduKGJ5dGVbXSl1aW50NjQiLCBtZXRob2QgImlzY29tcGxldGUoYnl0ZVtdKXVpbnQ2NCIsIG1ldGhvZCAicmVqZWN0KGJ5dGVbXSxhZGRyZXNzKXVpbnQ2NCIKICAgIGJ5dGVjIDEwIC8vIG1ldGhvZCAiYm94X3JlZnMoKXZvaWQiCiAgICBwdXNoYnl0ZXNzIDB4NDc0MWY1NTMgMHhhNmVjMTZmZiAweGI3Njk2OTBlIDB4MTM5ZmUyYjggMHgyOTYwZDY3MiAvLyBtZXRob2QgIm15X2NvbnRyYWN0cygpYnl0ZVtdIiwgbWV0aG9kICJnZXRfYXNzZXRfaWQoYnl0ZVtdKXVpbnQ2NCIsIG1ldGhvZCAiaXNfYWN0aXZlKGJ5dGVbXSl1aW50NjQiLCBtZXRob2QgInRvdGFsX3NpZ25lcnMoYnl0ZVtdKXVpbnQ2NCIsIG1ldGhvZCAic2lnbmVkX2NvdW50KGJ5dGVbXSl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2NyZWF0ZV9jb250cmFjdF9yb3V0ZUA1IG1haW5fY2FuY2VsX3JvdXRlQDYgbWFpbl9zaWduX3JvdXRlQDcgbWFpbl9pc3NpZ25fcm91dGVAOCBtYWluX2lzY29tcGxldGVfcm91dGVAOSBtYWluX3JlamVjdF9yb3V0ZUAxMCBtYWluX2JveF9yZWZzX3JvdXRlQDExIG1haW5fbXlfY29udHJhY3RzX3JvdXRlQDEyIG1haW5fZ2V0X2Fzc2V0X2lkX3JvdXRlQDEzIG1haW5faXNfYWN0aXZlX3JvdXRlQDE0IG1haW5fdG90YWxfc2lnbmVyc19yb3V0ZUAxNSBtYWluX3NpZ25lZF9jb3VudF9yb3V0ZUAxNgoKbWFpbl9hZnRlcl9pZl9lbHNlQDE5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMAogICAgLy8gY2xhc3MgQmxvY2tzaWduKEFSQzRDb250cmFjdCk6CiAgICBpbnRjXzEgLy8gMAogICAgcmV0dXJuCgptYWluX3NpZ25lZF9jb3VudF9yb3V0ZUAxNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6Mzg4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMwCiAgICAvLyBjbGFzcyBCbG9ja3NpZ24oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6Mzg4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBzaWduZWRfY291bnQKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fdG90YWxfc2lnbmVyc19yb3V0ZUAxNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzgxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMwCiAgICAvLyBjbGFzcyBCbG9ja3NpZ24oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzgxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiB0b3RhbF9zaWduZXJzCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2lzX2FjdGl2ZV9yb3V0ZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6Mzc0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMwCiAgICAvLyBjbGFzcyBCbG9ja3NpZ24oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6Mzc0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBpc19hY3RpdmUKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2Fzc2V0X2lkX3JvdXRlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozNjYtMzY3CiAgICAvLyAjIC0tLS0gQXlyxLEgb2t1bWEgbWV0b2RsYXLEsSAodHVwbGUgeWVyaW5lKSAtLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMwCiAgICAvLyBjbGFzcyBCbG9ja3NpZ24oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzY2LTM2NwogICAgLy8gIyAtLS0tIEF5csSxIG9rdW1hIG1ldG9kbGFyxLEgKHR1cGxlIHllcmluZSkgLS0tLQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgZ2V0X2Fzc2V0X2lkCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX215X2NvbnRyYWN0c19yb3V0ZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzU0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIG15X2NvbnRyYWN0cwogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fYm94X3JlZnNfcm91dGVAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM1MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZWplY3Rfcm91dGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMyNgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMAogICAgLy8gY2xhc3MgQmxvY2tzaWduKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMyNgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgcmVqZWN0CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2lzY29tcGxldGVfcm91dGVAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzExCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMwCiAgICAvLyBjbGFzcyBCbG9ja3NpZ24oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzExCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBpc2NvbXBsZXRlCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2lzc2lnbl9yb3V0ZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyOTMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzAKICAgIC8vIGNsYXNzIEJsb2Nrc2lnbihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyOTMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGlzc2lnbgogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9zaWduX3JvdXRlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI1NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMAogICAgLy8gY2xhc3MgQmxvY2tzaWduKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI1NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgc2lnbgogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9jYW5jZWxfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjE4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMwCiAgICAvLyBjbGFzcyBCbG9ja3NpZ24oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjE4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBjYW5jZWwKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX2NvbnRyYWN0X3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjEwNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMAogICAgLy8gY2xhc3MgQmxvY2tzaWduKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjEwNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY3JlYXRlX2NvbnRyYWN0CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0AxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzAKICAgIC8vIGNsYXNzIEJsb2Nrc2lnbihBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAxOQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYmxvY2tzaWduLmNvbnRyYWN0LkJsb2Nrc2lnbi5jcmVhdGVfY29udHJhY3QoZmlsZV9oYXNoOiBieXRlcywgc2lnbmVyczogYnl0ZXMpIC0+IHVpbnQ2NDoKY3JlYXRlX2NvbnRyYWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMDUtMTEwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGNyZWF0ZV9jb250cmFjdCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGZpbGVfaGFzaDogYXJjNC5EeW5hbWljQnl0ZXMsCiAgICAvLyAgICAgc2lnbmVyczogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5BZGRyZXNzXSwKICAgIC8vICkgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICBpbnRjXzEgLy8gMAogICAgZHVwbiA1CiAgICBieXRlY18xIC8vICIiCiAgICBkdXBuIDExCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjExMS0xMTIKICAgIC8vICMgLS0tIDApIMOWbmtvxZ91bGxhciAtLS0KICAgIC8vIGNhbmNlbGVkX2ZsYWcsIGNhbmNlbGVkX2V4aXN0cyA9IHNlbGYuY2FuY2VsZWRfYnlfaGFzaC5tYXliZShmaWxlX2hhc2gpCiAgICBieXRlY18yIC8vIDB4NjQ2NTZjNWYKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjExMwogICAgLy8gYXNzZXJ0IG5vdCAoY2FuY2VsZWRfZXhpc3RzIGFuZCBjYW5jZWxlZF9mbGFnID09IDEpLCAiaGFzaCBjYW5jZWxlZCIKICAgIGJ6IGNyZWF0ZV9jb250cmFjdF9ib29sX2ZhbHNlQDMKICAgIGZyYW1lX2RpZyAxOAogICAgaW50Y18wIC8vIDEKICAgID09CiAgICBieiBjcmVhdGVfY29udHJhY3RfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzAgLy8gMQoKY3JlYXRlX2NvbnRyYWN0X2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTEzCiAgICAvLyBhc3NlcnQgbm90IChjYW5jZWxlZF9leGlzdHMgYW5kIGNhbmNlbGVkX2ZsYWcgPT0gMSksICJoYXNoIGNhbmNlbGVkIgogICAgIQogICAgYXNzZXJ0IC8vIGhhc2ggY2FuY2VsZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTE1LTExNgogICAgLy8gIyAtLS0gMSkgw5ZkZW1lIGRvxJ9ydWxhbWEgLS0tCiAgICAvLyBhc3NlcnQgR2xvYmFsLmdyb3VwX3NpemUgPj0gMiwgImdyb3VwIG11c3Qgc3RhcnQgd2l0aCBQYXltZW50ICsgQXBwQ2FsbCIKICAgIGdsb2JhbCBHcm91cFNpemUKICAgIHB1c2hpbnQgMiAvLyAyCiAgICA+PQogICAgYXNzZXJ0IC8vIGdyb3VwIG11c3Qgc3RhcnQgd2l0aCBQYXltZW50ICsgQXBwQ2FsbAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMTcKICAgIC8vIGFzc2VydCBUeG4uZ3JvdXBfaW5kZXggPT0gQ1JFQVRFX0lOREVYLCAiY3JlYXRlX2NvbnRyYWN0IG11c3QgYmUgR3R4blsxXSIKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzAgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBjcmVhdGVfY29udHJhY3QgbXVzdCBiZSBHdHhuWzFdCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjExOAogICAgLy8gc2VsZi5fb25seV9ib3hfcmVmc19hZnRlcigpCiAgICBjYWxsc3ViIF9vbmx5X2JveF9yZWZzX2FmdGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjEyMAogICAgLy8gcGF5ID0gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24oUEFZTUVOVF9JTkRFWCkKICAgIGludGNfMSAvLyAwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18wIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTIxCiAgICAvLyBhc3NlcnQgcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJwYXltZW50IG11c3QgZ28gdG8gYXBwIGFkZHJlc3MiCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gcGF5bWVudCBtdXN0IGdvIHRvIGFwcCBhZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjEyMAogICAgLy8gcGF5ID0gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24oUEFZTUVOVF9JTkRFWCkKICAgIGludGNfMSAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjEyMgogICAgLy8gYXNzZXJ0IHBheS5hbW91bnQgPj0gRklWRV9BTEdPLCAiaW5zdWZmaWNpZW50IHBheW1lbnQ6IG5lZWQgPj0gNSBBTEdPIgogICAgZ3R4bnMgQW1vdW50CiAgICBwdXNoaW50IDUwMDAwMDAgLy8gNTAwMDAwMAogICAgPj0KICAgIGFzc2VydCAvLyBpbnN1ZmZpY2llbnQgcGF5bWVudDogbmVlZCA+PSA1IEFMR08KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTIwCiAgICAvLyBwYXkgPSBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihQQVlNRU5UX0lOREVYKQogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTIzCiAgICAvLyBhc3NlcnQgcGF5LnNlbmRlciA9PSBUeG4uc2VuZGVyLCAicGF5ZXIgbXVzdCBiZSB0aGUgY2FsbGVyIgogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIHBheWVyIG11c3QgYmUgdGhlIGNhbGxlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMjAKICAgIC8vIHBheSA9IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKFBBWU1FTlRfSU5ERVgpCiAgICBpbnRjXzEgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMjQKICAgIC8vIGFzc2VydCBwYXkucmVrZXlfdG8gPT0gR2xvYmFsLnplcm9fYWRkcmVzcywgInJla2V5IG5vdCBhbGxvd2VkIgogICAgZ3R4bnMgUmVrZXlUbwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIHJla2V5IG5vdCBhbGxvd2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjEyMAogICAgLy8gcGF5ID0gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24oUEFZTUVOVF9JTkRFWCkKICAgIGludGNfMSAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjEyNQogICAgLy8gYXNzZXJ0IHBheS5jbG9zZV9yZW1haW5kZXJfdG8gPT0gR2xvYmFsLnplcm9fYWRkcmVzcywgImNsb3NlIG5vdCBhbGxvd2VkIgogICAgZ3R4bnMgQ2xvc2VSZW1haW5kZXJUbwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIGNsb3NlIG5vdCBhbGxvd2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjEyNy0xMjgKICAgIC8vICMgLS0tIDIpIERhaGEgw7ZuY2UgbWludCBlZGlsbWnFnyBtaT8gLS0tCiAgICAvLyBleGlzdGluZ19pZCwgZXhpc3RzID0gc2VsZi5hc3NldF9ieV9oYXNoLm1heWJlKGZpbGVfaGFzaCkKICAgIGJ5dGVjIDQgLy8gMHg2MTczNjE1ZgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAyCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBmcmFtZV9idXJ5IDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTI5CiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBjcmVhdGVfY29udHJhY3RfYWZ0ZXJfaWZfZWxzZUAxNQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMzIKICAgIC8vIGJsb2JfdSwgaGFzX3UgPSBzZWxmLnVzZXJfaGFzaGVzLm1heWJlKHVzZXJfa2V5KQogICAgYnl0ZWMgNyAvLyAweDc1Njg3MzVmCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjEzMC0xMzEKICAgIC8vICMgS3VsbGFuxLFjxLEgaW5kZWtzaW5lIGVrbGkgZGXEn2lsc2UgZWtsZSAoaWRlbXBvdGVudCkKICAgIC8vIHVzZXJfa2V5ID0gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIuYnl0ZXMpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjEzMgogICAgLy8gYmxvYl91LCBoYXNfdSA9IHNlbGYudXNlcl9oYXNoZXMubWF5YmUodXNlcl9rZXkpCiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSA0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTMzCiAgICAvLyBpZiBub3QgaGFzX3U6CiAgICBibnogY3JlYXRlX2NvbnRyYWN0X2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMzQKICAgIC8vIGJsb2JfdSA9IEJ5dGVzKGIiIikKICAgIGJ5dGVjXzEgLy8gMHgKICAgIGZyYW1lX2J1cnkgMQoKY3JlYXRlX2NvbnRyYWN0X2FmdGVyX2lmX2Vsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTM1CiAgICAvLyBpMCA9IFVJbnQ2NCgwKQogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMzYKICAgIC8vIHByZXNlbnQgPSBVSW50NjQoMCkKICAgIGludGNfMSAvLyAwCiAgICBmcmFtZV9idXJ5IDEyCgpjcmVhdGVfY29udHJhY3Rfd2hpbGVfdG9wQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjEzNwogICAgLy8gd2hpbGUgaTAgPCBibG9iX3UubGVuZ3RoOgogICAgZnJhbWVfZGlnIDEKICAgIGxlbgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDE0CiAgICBmcmFtZV9kaWcgOAogICAgPgogICAgZnJhbWVfZGlnIDEyCiAgICBmcmFtZV9idXJ5IDEzCiAgICBieiBjcmVhdGVfY29udHJhY3RfYWZ0ZXJfd2hpbGVAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTM4CiAgICAvLyBpZiBibG9iX3VbaTAgOiBpMCArIFVJbnQ2NCgzMildID09IGZpbGVfaGFzaC5ieXRlczoKICAgIGZyYW1lX2RpZyA4CiAgICBkdXAKICAgIGZyYW1lX2RpZyAxNAogICAgZHVwCiAgICBjb3ZlciAzCiAgICA+PQogICAgZGlnIDEKICAgIGRpZyAzCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgc3dhcAogICAgaW50Y18zIC8vIDMyCiAgICArCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgOAogICAgZHVwCiAgICBkaWcgMwogICAgPj0KICAgIHN3YXAKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGR1cAogICAgZGlnIDIKICAgIDwKICAgIGRpZyAyCiAgICBzd2FwCiAgICBzZWxlY3QKICAgIGZyYW1lX2RpZyAxCiAgICBjb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBmcmFtZV9kaWcgLTIKICAgID09CiAgICBieiBjcmVhdGVfY29udHJhY3Rfd2hpbGVfdG9wQDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTM5CiAgICAvLyBwcmVzZW50ID0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMQogICAgZnJhbWVfYnVyeSAxMwoKY3JlYXRlX2NvbnRyYWN0X2FmdGVyX3doaWxlQDEyOgogICAgZnJhbWVfZGlnIDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE0MgogICAgLy8gaWYgcHJlc2VudCA9PSBVSW50NjQoMCk6CiAgICBibnogY3JlYXRlX2NvbnRyYWN0X2FmdGVyX2lmX2Vsc2VAMTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTQzCiAgICAvLyBzZWxmLnVzZXJfaGFzaGVzW3VzZXJfa2V5XSA9IGJsb2JfdSArIGZpbGVfaGFzaC5ieXRlcwogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKCmNyZWF0ZV9jb250cmFjdF9hZnRlcl9pZl9lbHNlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxNDQKICAgIC8vIHJldHVybiBleGlzdGluZ19pZAogICAgZnJhbWVfZGlnIDYKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpjcmVhdGVfY29udHJhY3RfYWZ0ZXJfaWZfZWxzZUAxNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTQ2LTE0NwogICAgLy8gIyAtLS0gMykgTkZUIG1pbnQgKGlubmVyIHR4bikgLS0tCiAgICAvLyBwcmVmaXg6IEJ5dGVzID0gZmlsZV9oYXNoLmJ5dGVzWzo4XSAgIyBsYWJlbCBpw6dpbiBpbGsgOCBiYXl0CiAgICBmcmFtZV9kaWcgLTIKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgIGRpZyAxCiAgICA+PQogICAgaW50Y18yIC8vIDgKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzEgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE0OAogICAgLy8gYXNzZXRfbmFtZTogQnl0ZXMgPSBCeXRlcyhiIkZJTEUtIikgKyBwcmVmaXgKICAgIHB1c2hieXRlcyAweDQ2NDk0YzQ1MmQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxNTEtMTYxCiAgICAvLyBtaW50X3JlcyA9IGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgdG90YWw9VUludDY0KDEpLAogICAgLy8gICAgIGRlY2ltYWxzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIC8vICAgICB1bml0X25hbWU9dW5pdF9uYW1lLAogICAgLy8gICAgIGFzc2V0X25hbWU9YXNzZXRfbmFtZSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICAjIEFTQSB5w7ZuZXRpbWkgc8O2emxlxZ9tZWRlCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuemVyb19hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuemVyb19hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE1NwogICAgLy8gbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAgIyBBU0EgecO2bmV0aW1pIHPDtnpsZcWfbWVkZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTU4CiAgICAvLyByZXNlcnZlPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTU5LTE2MAogICAgLy8gZnJlZXplPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICAvLyBjbGF3YmFjaz1HbG9iYWwuemVyb19hZGRyZXNzLAogICAgZHVwbiAyCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0Q2xhd2JhY2sKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRGcmVlemUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRSZXNlcnZlCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TWFuYWdlcgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTQ5CiAgICAvLyB1bml0X25hbWU6IEJ5dGVzID0gQnl0ZXMoYiJGSUxFIikKICAgIHB1c2hieXRlcyAweDQ2NDk0YzQ1CiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VW5pdE5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTU0CiAgICAvLyBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIGludGNfMSAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVmYXVsdEZyb3plbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxNTMKICAgIC8vIGRlY2ltYWxzPVVJbnQ2NCgwKSwKICAgIGludGNfMSAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVjaW1hbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTUyCiAgICAvLyB0b3RhbD1VSW50NjQoMSksCiAgICBpbnRjXzAgLy8gMQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFRvdGFsCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gbWludF9yZXMgPSBpdHhuLkFzc2V0Q29uZmlnKAogICAgcHVzaGludCAzIC8vIGFjZmcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMSAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxNTEtMTYxCiAgICAvLyBtaW50X3JlcyA9IGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgdG90YWw9VUludDY0KDEpLAogICAgLy8gICAgIGRlY2ltYWxzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIC8vICAgICB1bml0X25hbWU9dW5pdF9uYW1lLAogICAgLy8gICAgIGFzc2V0X25hbWU9YXNzZXRfbmFtZSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICAjIEFTQSB5w7ZuZXRpbWkgc8O2emxlxZ9tZWRlCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuemVyb19hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuemVyb19hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBDcmVhdGVkQXNzZXRJRAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE2NS0xNjYKICAgIC8vICMgLS0tIDQpIEXFn2xlbWVsZXJpIGtheWRldCAtLS0KICAgIC8vIHNlbGYuYXNzZXRfYnlfaGFzaFtmaWxlX2hhc2hdID0gYXNzZXRfaWQKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAyCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE2NwogICAgLy8gc2VsZi5hZG1pbl9ieV9oYXNoW2ZpbGVfaGFzaF0gPSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIHB1c2hieXRlcyAweDYxNjQ2ZDVmCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxNjktMTcwCiAgICAvLyAjIC0tLSA1KSDEsG16YWPEsWxhcsSxIChzZ25fKSB2ZSDDvHllbGlrIGt1dHVsYXLEsW7EsSAobWJyXykgc2FrbGEKICAgIC8vIGJsb2I6IEJ5dGVzID0gQnl0ZXMoYiIiKQogICAgYnl0ZWNfMSAvLyAweAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE3MQogICAgLy8gaSA9IFVJbnQ2NCgwKQogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgNwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxNzIKICAgIC8vIHVuaXF1ZSA9IFVJbnQ2NCgwKQogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTczCiAgICAvLyBuID0gc2lnbmVycy5sZW5ndGgKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9idXJ5IDExCgpjcmVhdGVfY29udHJhY3Rfd2hpbGVfdG9wQDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxNzQKICAgIC8vIHdoaWxlIGkgPCBuOgogICAgZnJhbWVfZGlnIDcKICAgIGZyYW1lX2RpZyAxMQogICAgPAogICAgYnogY3JlYXRlX2NvbnRyYWN0X2FmdGVyX3doaWxlQDIxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE3NQogICAgLy8gYWRkciA9IHNpZ25lcnNbaV0gICAgICAgICAgIyBhcmM0LkFkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyA3CiAgICBpbnRjXzMgLy8gMzIKICAgICoKICAgIGludGNfMyAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE3NgogICAgLy8gYmxvYiA9IGJsb2IgKyBhZGRyLmJ5dGVzICAgIyAzMiBiYXl0IGVrbGUKICAgIGZyYW1lX2RpZyAwCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTAzCiAgICAvLyByZXR1cm4gb3Auc2hhMjU2KGZpbGVfaGFzaC5ieXRlcyArIHNpZ25lci5ieXRlcykKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgY29uY2F0CiAgICBzaGEyNTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTc4LTE3OQogICAgLy8gIyBsaXN0ZWRlIHRla3JhciBlZGVuIGFkcmVzOiBpbGsgc8SxcmFzxLEgZ2XDp2VybGksIGJpciBrZXogc2F5xLFsxLFyCiAgICAvLyBpZiBtZW1iZXJfa2V5IG5vdCBpbiBzZWxmLm1lbWJlcl9ieV9rZXk6CiAgICBieXRlYyA1IC8vIDB4NmQ2MjcyNWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDUKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgZnJhbWVfZGlnIDE2CiAgICBmcmFtZV9idXJ5IDE3CiAgICBibnogY3JlYXRlX2NvbnRyYWN0X2FmdGVyX2lmX2Vsc2VAMjAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTgwCiAgICAvLyBzZWxmLm1lbWJlcl9ieV9rZXlbbWVtYmVyX2tleV0gPSBpCiAgICBmcmFtZV9kaWcgNwogICAgaXRvYgogICAgZnJhbWVfZGlnIDUKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTgxCiAgICAvLyB1bmlxdWUgPSB1bmlxdWUgKyBVSW50NjQoMSkKICAgIGZyYW1lX2RpZyAxNgogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMTcKCmNyZWF0ZV9jb250cmFjdF9hZnRlcl9pZl9lbHNlQDIwOgogICAgZnJhbWVfZGlnIDE3CiAgICBmcmFtZV9idXJ5IDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE4MgogICAgLy8gaSA9IGkgKyBVSW50NjQoMSkKICAgIGZyYW1lX2RpZyA3CiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA3CiAgICBiIGNyZWF0ZV9jb250cmFjdF93aGlsZV90b3BAMTcKCmNyZWF0ZV9jb250cmFjdF9hZnRlcl93aGlsZUAyMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTgzCiAgICAvLyBzZWxmLnNpZ25lcnNfYmxvYl9ieV9oYXNoW2ZpbGVfaGFzaF0gPSBibG9iCiAgICBieXRlYyA4IC8vIDB4NzM2NzZlNWYKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgZnJhbWVfZGlnIDAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTg0CiAgICAvLyBzZWxmLnNpZ25lZF9iaXRzX2J5X2hhc2hbZmlsZV9oYXNoXSA9IG9wLmJ6ZXJvKChuICsgVUludDY0KDcpKSAvLyBVSW50NjQoOCkpCiAgICBmcmFtZV9kaWcgMTEKICAgIHB1c2hpbnQgNyAvLyA3CiAgICArCiAgICBpbnRjXzIgLy8gOAogICAgLwogICAgYnplcm8KICAgIGJ5dGVjIDYgLy8gMHg3MzYyNmQ1ZgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE4NQogICAgLy8gc2VsZi5jb3VudF9ieV9oYXNoW2ZpbGVfaGFzaF0gPSBTaWduQ291bnQoYXJjNC5VSW50NjQodW5pcXVlKSwgYXJjNC5VSW50NjQoMCkpCiAgICBmcmFtZV9kaWcgMTYKICAgIGl0b2IKICAgIGJ5dGVjIDExIC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgY29uY2F0CiAgICBieXRlY18zIC8vIDB4NjM2ZTc0NWYKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE4Ny0xODgKICAgIC8vICMgc2doXyAoc2lnbmVkKSBiYcWfbGFuZ8Sxw6d0YSBib8WfCiAgICAvLyBzZWxmLnNpZ25lZF9ibG9iX2J5X2hhc2hbZmlsZV9oYXNoXSA9IEJ5dGVzKGIiIikKICAgIGJ5dGVjIDkgLy8gMHg3MzY3Njg1ZgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBieXRlY18xIC8vIDB4CiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE5MgogICAgLy8gYmxvYl91LCBoYXNfdSA9IHNlbGYudXNlcl9oYXNoZXMubWF5YmUodXNlcl9rZXkpCiAgICBieXRlYyA3IC8vIDB4NzU2ODczNWYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTkwLTE5MQogICAgLy8gIyAtLS0gNikgS3VsbGFuxLFjxLEgaW5kZWtzaW5lICh1aHNfKSBla2xlIChpZGVtcG90ZW50KSAtLS0KICAgIC8vIHVzZXJfa2V5ID0gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIuYnl0ZXMpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE5MgogICAgLy8gYmxvYl91LCBoYXNfdSA9IHNlbGYudXNlcl9oYXNoZXMubWF5YmUodXNlcl9rZXkpCiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAzCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTkzCiAgICAvLyBpZiBub3QgaGFzX3U6CiAgICBibnogY3JlYXRlX2NvbnRyYWN0X2FmdGVyX2lmX2Vsc2VAMjMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTk0CiAgICAvLyBibG9iX3UgPSBCeXRlcyhiIiIpCiAgICBieXRlY18xIC8vIDB4CiAgICBmcmFtZV9idXJ5IDEKCmNyZWF0ZV9jb250cmFjdF9hZnRlcl9pZl9lbHNlQDIzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxOTUKICAgIC8vIGogPSBVSW50NjQoMCkKICAgIGludGNfMSAvLyAwCiAgICBmcmFtZV9idXJ5IDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTk2CiAgICAvLyBwcmVzZW50ID0gVUludDY0KDApCiAgICBpbnRjXzEgLy8gMAogICAgZnJhbWVfYnVyeSAxMgoKY3JlYXRlX2NvbnRyYWN0X3doaWxlX3RvcEAyNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTk3CiAgICAvLyB3aGlsZSBqIDwgYmxvYl91Lmxlbmd0aDoKICAgIGZyYW1lX2RpZyAxCiAgICBsZW4KICAgIGR1cAogICAgZnJhbWVfYnVyeSAxNQogICAgZnJhbWVfZGlnIDkKICAgID4KICAgIGZyYW1lX2RpZyAxMgogICAgZnJhbWVfYnVyeSAxMwogICAgYnogY3JlYXRlX2NvbnRyYWN0X2FmdGVyX3doaWxlQDI4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjE5OAogICAgLy8gaWYgYmxvYl91W2ogOiBqICsgVUludDY0KDMyKV0gPT0gZmlsZV9oYXNoLmJ5dGVzOgogICAgZnJhbWVfZGlnIDkKICAgIGR1cAogICAgZnJhbWVfZGlnIDE1CiAgICBkdXAKICAgIGNvdmVyIDMKICAgID49CiAgICBkaWcgMQogICAgZGlnIDMKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBzd2FwCiAgICBpbnRjXzMgLy8gMzIKICAgICsKICAgIGR1cAogICAgZnJhbWVfYnVyeSA5CiAgICBkdXAKICAgIGRpZyAzCiAgICA+PQogICAgc3dhcAogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZHVwCiAgICBkaWcgMgogICAgPAogICAgZGlnIDIKICAgIHN3YXAKICAgIHNlbGVjdAogICAgZnJhbWVfZGlnIDEKICAgIGNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIGZyYW1lX2RpZyAtMgogICAgPT0KICAgIGJ6IGNyZWF0ZV9jb250cmFjdF93aGlsZV90b3BAMjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTk5CiAgICAvLyBwcmVzZW50ID0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMQogICAgZnJhbWVfYnVyeSAxMwoKY3JlYXRlX2NvbnRyYWN0X2FmdGVyX3doaWxlQDI4OgogICAgZnJhbWVfZGlnIDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIwMgogICAgLy8gaWYgcHJlc2VudCA9PSBVSW50NjQoMCk6CiAgICBibnogY3JlYXRlX2NvbnRyYWN0X2FmdGVyX2lmX2Vsc2VAMzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjAzCiAgICAvLyBzZWxmLnVzZXJfaGFzaGVzW3VzZXJfa2V5XSA9IGJsb2JfdSArIGZpbGVfaGFzaC5ieXRlcwogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKCmNyZWF0ZV9jb250cmFjdF9hZnRlcl9pZl9lbHNlQDMwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMDUtMjA2CiAgICAvLyAjIC0tLSA3KSBhc3NldF9pZCBkw7ZuZMO8ciAtLS0KICAgIC8vIHJldHVybiBhc3NldF9pZAogICAgZnJhbWVfZGlnIDEwCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKY3JlYXRlX2NvbnRyYWN0X2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMSAvLyAwCiAgICBiIGNyZWF0ZV9jb250cmFjdF9ib29sX21lcmdlQDQKCgovLyBzbWFydF9jb250cmFjdHMuYmxvY2tzaWduLmNvbnRyYWN0LkJsb2Nrc2lnbi5fb25seV9ib3hfcmVmc19hZnRlcigpIC0+IHZvaWQ6Cl9vbmx5X2JveF9yZWZzX2FmdGVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMDgtMjA5CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9vbmx5X2JveF9yZWZzX2FmdGVyKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjEwLTIxMQogICAgLy8gIyBncnVwdGEgYnUgw6dhxJ9yxLFkYW4gc29ucmEgeWFsbsSxemNhIGF5bsSxIHV5Z3VsYW1heWEgYm94X3JlZnMgw6dhxJ9yxLFsYXLEsSBvbGFiaWxpcgogICAgLy8gaSA9IFR4bi5ncm91cF9pbmRleCArIFVJbnQ2NCgxKQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMCAvLyAxCiAgICArCgpfb25seV9ib3hfcmVmc19hZnRlcl93aGlsZV90b3BAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjEyCiAgICAvLyB3aGlsZSBpIDwgR2xvYmFsLmdyb3VwX3NpemU6CiAgICBmcmFtZV9kaWcgMAogICAgZ2xvYmFsIEdyb3VwU2l6ZQogICAgPAogICAgYnogX29ubHlfYm94X3JlZnNfYWZ0ZXJfYWZ0ZXJfd2hpbGVAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMTMKICAgIC8vIGNhbGwgPSBndHhuLkFwcGxpY2F0aW9uQ2FsbFRyYW5zYWN0aW9uKGkpCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgcHVzaGludCA2IC8vIGFwcGwKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBhcHBsCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIxNAogICAgLy8gYXNzZXJ0IGNhbGwuYXBwX2lkID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLCAiYm94X3JlZnMgbXVzdCB0YXJnZXQgdGhpcyBhcHAiCiAgICBkdXAKICAgIGd0eG5zIEFwcGxpY2F0aW9uSUQKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25JRAogICAgPT0KICAgIGFzc2VydCAvLyBib3hfcmVmcyBtdXN0IHRhcmdldCB0aGlzIGFwcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMTUKICAgIC8vIGFzc2VydCBjYWxsLmFwcF9hcmdzKDApID09IGFyYzQuYXJjNF9zaWduYXR1cmUoImJveF9yZWZzKCl2b2lkIiksICJvbmx5IGJveF9yZWZzIG1heSBmb2xsb3ciCiAgICBkdXAKICAgIGludGNfMSAvLyAwCiAgICBndHhuc2FzIEFwcGxpY2F0aW9uQXJncwogICAgYnl0ZWMgMTAgLy8gbWV0aG9kICJib3hfcmVmcygpdm9pZCIKICAgID09CiAgICBhc3NlcnQgLy8gb25seSBib3hfcmVmcyBtYXkgZm9sbG93CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIxNgogICAgLy8gaSA9IGkgKyBVSW50NjQoMSkKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDAKICAgIGIgX29ubHlfYm94X3JlZnNfYWZ0ZXJfd2hpbGVfdG9wQDEKCl9vbmx5X2JveF9yZWZzX2FmdGVyX2FmdGVyX3doaWxlQDM6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYmxvY2tzaWduLmNvbnRyYWN0LkJsb2Nrc2lnbi5jYW5jZWwoZmlsZV9oYXNoOiBieXRlcykgLT4gdWludDY0OgpjYW5jZWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIxOC0yMTkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY2FuY2VsKHNlbGYsIGZpbGVfaGFzaDogYXJjNC5EeW5hbWljQnl0ZXMpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMjAKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJvbmx5IGFwcCBjcmVhdG9yIGNhbiBjYW5jZWwiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gb25seSBhcHAgY3JlYXRvciBjYW4gY2FuY2VsCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIyMQogICAgLy8gYXNzZXJ0IFR4bi5ncm91cF9pbmRleCA9PSBVSW50NjQoMCksICJjYW5jZWwgbXVzdCBiZSBHdHhuWzBdIgogICAgdHhuIEdyb3VwSW5kZXgKICAgICEKICAgIGFzc2VydCAvLyBjYW5jZWwgbXVzdCBiZSBHdHhuWzBdCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIyMgogICAgLy8gc2VsZi5fb25seV9ib3hfcmVmc19hZnRlcigpCiAgICBjYWxsc3ViIF9vbmx5X2JveF9yZWZzX2FmdGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIyNAogICAgLy8gYXNzZXRfaWQsIGV4aXN0cyA9IHNlbGYuYXNzZXRfYnlfaGFzaC5tYXliZShmaWxlX2hhc2gpCiAgICBieXRlYyA0IC8vIDB4NjE3MzYxNWYKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIyNQogICAgLy8gYXNzZXJ0IGV4aXN0cywgImhhc2ggbm90IGZvdW5kIgogICAgYXNzZXJ0IC8vIGhhc2ggbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIyNwogICAgLy8gY2FuY2VsZWRfZmxhZywgY2FuY2VsZWRfZXhpc3RzID0gc2VsZi5jYW5jZWxlZF9ieV9oYXNoLm1heWJlKGZpbGVfaGFzaCkKICAgIGJ5dGVjXzIgLy8gMHg2NDY1NmM1ZgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMjgKICAgIC8vIGFzc2VydCBub3QgKGNhbmNlbGVkX2V4aXN0cyBhbmQgY2FuY2VsZWRfZmxhZyA9PSAxKSwgImFscmVhZHkgY2FuY2VsZWQiCiAgICBieiBjYW5jZWxfYm9vbF9mYWxzZUAzCiAgICBmcmFtZV9kaWcgMgogICAgaW50Y18wIC8vIDEKICAgID09CiAgICBieiBjYW5jZWxfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzAgLy8gMQoKY2FuY2VsX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjI4CiAgICAvLyBhc3NlcnQgbm90IChjYW5jZWxlZF9leGlzdHMgYW5kIGNhbmNlbGVkX2ZsYWcgPT0gMSksICJhbHJlYWR5IGNhbmNlbGVkIgogICAgIQogICAgYXNzZXJ0IC8vIGFscmVhZHkgY2FuY2VsZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjMwLTIzMwogICAgLy8gIyBBU0EgZGVsZXRlIGRlbmUgKG1hbmFnZXIgPSBhcHAgYWRkcmVzcyB2ZSBhcnogYXBwJ3RlIG9sbWFsxLEpCiAgICAvLyBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGNvbmZpZ19hc3NldD1Bc3NldChhc3NldF9pZCksCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjIzMC0yMzEKICAgIC8vICMgQVNBIGRlbGV0ZSBkZW5lIChtYW5hZ2VyID0gYXBwIGFkZHJlc3MgdmUgYXJ6IGFwcCd0ZSBvbG1hbMSxKQogICAgLy8gaXR4bi5Bc3NldENvbmZpZygKICAgIHB1c2hpbnQgMyAvLyBhY2ZnCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjMwLTIzMwogICAgLy8gIyBBU0EgZGVsZXRlIGRlbmUgKG1hbmFnZXIgPSBhcHAgYWRkcmVzcyB2ZSBhcnogYXBwJ3RlIG9sbWFsxLEpCiAgICAvLyBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGNvbmZpZ19hc3NldD1Bc3NldChhc3NldF9pZCksCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMzUKICAgIC8vIHNlbGYuY2FuY2VsZWRfYnlfaGFzaFtmaWxlX2hhc2hdID0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMQogICAgaXRvYgogICAgZnJhbWVfZGlnIDEKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjM2CiAgICAvLyBzZWxmLl9jbGVhcl9zaWduYXR1cmVzKGZpbGVfaGFzaCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfY2xlYXJfc2lnbmF0dXJlcwogICAgZnJhbWVfYnVyeSAtMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyMzgKICAgIC8vIHJldHVybiBhc3NldF9pZAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmNhbmNlbF9ib29sX2ZhbHNlQDM6CiAgICBpbnRjXzEgLy8gMAogICAgYiBjYW5jZWxfYm9vbF9tZXJnZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLmJsb2Nrc2lnbi5jb250cmFjdC5CbG9ja3NpZ24uX2NsZWFyX3NpZ25hdHVyZXMoZmlsZV9oYXNoOiBieXRlcykgLT4gYnl0ZXM6Cl9jbGVhcl9zaWduYXR1cmVzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyNDAtMjQxCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9jbGVhcl9zaWduYXR1cmVzKHNlbGYsIGZpbGVfaGFzaDogYXJjNC5EeW5hbWljQnl0ZXMpIC0+IE5vbmU6CiAgICBwcm90byAxIDEKICAgIGJ5dGVjXzEgLy8gIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjQyLTI0MwogICAgLy8gIyBpbXphY8SxIGJhxZ/EsW5hIG1icl8ga3V0dWxhcsSxIHNpbGluaXIgKHRla3JhciBlZGVuIGFkcmVzdGUgYm94X2RlbCBpa2luY2kga2V6IGV0a2lzaXopCiAgICAvLyBibG9iID0gc2VsZi5zaWduZXJzX2Jsb2JfYnlfaGFzaFtmaWxlX2hhc2hdCiAgICBieXRlYyA4IC8vIDB4NzM2NzZlNWYKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zaWduZXJzX2Jsb2JfYnlfaGFzaCBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjQ0CiAgICAvLyBpID0gVUludDY0KDApCiAgICBpbnRjXzEgLy8gMAogICAgZnJhbWVfZGlnIC0xCgpfY2xlYXJfc2lnbmF0dXJlc193aGlsZV90b3BAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjQ1CiAgICAvLyB3aGlsZSBpIDwgYmxvYi5sZW5ndGg6CiAgICBmcmFtZV9kaWcgMQogICAgbGVuCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgZnJhbWVfZGlnIDIKICAgID4KICAgIGJ6IF9jbGVhcl9zaWduYXR1cmVzX2FmdGVyX3doaWxlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjQ2CiAgICAvLyBkZWwgc2VsZi5tZW1iZXJfYnlfa2V5W3NlbGYuX21lbWJlcl9rZXkoZmlsZV9oYXNoLCBhcmM0LkFkZHJlc3MoYmxvYltpIDogaSArIFVJbnQ2NCgzMildKSldCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBjb3ZlciAzCiAgICA+PQogICAgZGlnIDEKICAgIGRpZyAzCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgc3dhcAogICAgaW50Y18zIC8vIDMyCiAgICArCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMgogICAgZHVwCiAgICBkaWcgMwogICAgPj0KICAgIHN3YXAKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGR1cAogICAgZGlnIDIKICAgIDwKICAgIGRpZyAyCiAgICBzd2FwCiAgICBzZWxlY3QKICAgIGZyYW1lX2RpZyAxCiAgICBjb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjEwMwogICAgLy8gcmV0dXJuIG9wLnNoYTI1NihmaWxlX2hhc2guYnl0ZXMgKyBzaWduZXIuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI0NgogICAgLy8gZGVsIHNlbGYubWVtYmVyX2J5X2tleVtzZWxmLl9tZW1iZXJfa2V5KGZpbGVfaGFzaCwgYXJjNC5BZGRyZXNzKGJsb2JbaSA6IGkgKyBVSW50NjQoMzIpXSkpXQogICAgYnl0ZWMgNSAvLyAweDZkNjI3MjVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9kZWwKICAgIHBvcAogICAgZnJhbWVfZGlnIC0xCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMwogICAgZnJhbWVfYnVyeSAtMQogICAgYiBfY2xlYXJfc2lnbmF0dXJlc193aGlsZV90b3BAMQoKX2NsZWFyX3NpZ25hdHVyZXNfYWZ0ZXJfd2hpbGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjQ4CiAgICAvLyBzZWxmLnNpZ25lcnNfYmxvYl9ieV9oYXNoW2ZpbGVfaGFzaF0gPSBCeXRlcyhiIiIpCiAgICBieXRlYyA4IC8vIDB4NzM2NzZlNWYKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgYnl0ZWNfMSAvLyAweAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyNDkKICAgIC8vIHNlbGYuc2lnbmVkX2Jsb2JfYnlfaGFzaFtmaWxlX2hhc2hdID0gQnl0ZXMoYiIiKQogICAgYnl0ZWMgOSAvLyAweDczNjc2ODVmCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJ5dGVjXzEgLy8gMHgKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjUwLTI1MQogICAgLy8gIyBiaXRtYXAgdmUgc2F5YcOnbGFyxLFuIE1CUifEsSBkYSBnZXJpIGFsxLFuxLFyCiAgICAvLyBkZWwgc2VsZi5zaWduZWRfYml0c19ieV9oYXNoW2ZpbGVfaGFzaF0KICAgIGJ5dGVjIDYgLy8gMHg3MzYyNmQ1ZgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyNTIKICAgIC8vIGRlbCBzZWxmLmNvdW50X2J5X2hhc2hbZmlsZV9oYXNoXQogICAgYnl0ZWNfMyAvLyAweDYzNmU3NDVmCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgYm94X2RlbAogICAgcG9wCiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYmxvY2tzaWduLmNvbnRyYWN0LkJsb2Nrc2lnbi5zaWduKGZpbGVfaGFzaDogYnl0ZXMsIHNpZ25lcjogYnl0ZXMpIC0+IHVpbnQ2NDoKc2lnbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjU0LTI1NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBzaWduKHNlbGYsIGZpbGVfaGFzaDogYXJjNC5EeW5hbWljQnl0ZXMsIHNpZ25lcjogYXJjNC5BZGRyZXNzKSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIGludGNfMSAvLyAwCiAgICBkdXBuIDIKICAgIGJ5dGVjXzEgLy8gIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyNTYKICAgIC8vIGFzc2VydCBHbG9iYWwuZ3JvdXBfc2l6ZSA9PSAxLCAiaW52YWxpZCBncm91cCBzaXplIgogICAgZ2xvYmFsIEdyb3VwU2l6ZQogICAgaW50Y18wIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBncm91cCBzaXplCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI1OAogICAgLy8gY2FuY2VsZWRfZmxhZywgY2FuY2VsZWRfZXhpc3RzID0gc2VsZi5jYW5jZWxlZF9ieV9oYXNoLm1heWJlKGZpbGVfaGFzaCkKICAgIGJ5dGVjXzIgLy8gMHg2NDY1NmM1ZgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjU5CiAgICAvLyBhc3NlcnQgbm90IChjYW5jZWxlZF9leGlzdHMgYW5kIGNhbmNlbGVkX2ZsYWcgPT0gMSksICJoYXNoIGNhbmNlbGVkIgogICAgYnogc2lnbl9ib29sX2ZhbHNlQDMKICAgIGZyYW1lX2RpZyA2CiAgICBpbnRjXzAgLy8gMQogICAgPT0KICAgIGJ6IHNpZ25fYm9vbF9mYWxzZUAzCiAgICBpbnRjXzAgLy8gMQoKc2lnbl9ib29sX21lcmdlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI1OQogICAgLy8gYXNzZXJ0IG5vdCAoY2FuY2VsZWRfZXhpc3RzIGFuZCBjYW5jZWxlZF9mbGFnID09IDEpLCAiaGFzaCBjYW5jZWxlZCIKICAgICEKICAgIGFzc2VydCAvLyBoYXNoIGNhbmNlbGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI2MQogICAgLy8gX2Fzc2V0X2lkLCBleGlzdHMgPSBzZWxmLmFzc2V0X2J5X2hhc2gubWF5YmUoZmlsZV9oYXNoKQogICAgYnl0ZWMgNCAvLyAweDYxNzM2MTVmCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI2MgogICAgLy8gYXNzZXJ0IGV4aXN0cywgImhhc2ggbm90IGZvdW5kIgogICAgYXNzZXJ0IC8vIGhhc2ggbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI2NAogICAgLy8gYXNzZXJ0IHNpZ25lci5ieXRlcyA9PSBUeG4uc2VuZGVyLmJ5dGVzLCAic2VuZGVyIG1pc21hdGNoIgogICAgZnJhbWVfZGlnIC0xCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIHNlbmRlciBtaXNtYXRjaAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMDMKICAgIC8vIHJldHVybiBvcC5zaGEyNTYoZmlsZV9oYXNoLmJ5dGVzICsgc2lnbmVyLmJ5dGVzKQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI2NgogICAgLy8gcG9zaXRpb24sIGF1dGhvcml6ZWQgPSBzZWxmLm1lbWJlcl9ieV9rZXkubWF5YmUoc2VsZi5fbWVtYmVyX2tleShmaWxlX2hhc2gsIHNpZ25lcikpCiAgICBieXRlYyA1IC8vIDB4NmQ2MjcyNWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyNjcKICAgIC8vIGFzc2VydCBhdXRob3JpemVkLCAidW5hdXRob3JpemVkIHNpZ25lciIKICAgIHN3YXAKICAgIGFzc2VydCAvLyB1bmF1dGhvcml6ZWQgc2lnbmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI2OS0yNzAKICAgIC8vICMgYml0bWFwJ3RlIHlhbG7EsXpjYSBpbXphY8SxbsSxbiBiYXl0xLEgb2t1bnVwIHlhesSxbMSxcgogICAgLy8gYml0c19rZXkgPSBzZWxmLnNpZ25lZF9iaXRzX2J5X2hhc2gua2V5X3ByZWZpeCArIGZpbGVfaGFzaC5ieXRlcwogICAgYnl0ZWMgNiAvLyAweDczNjI2ZDVmCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjcxCiAgICAvLyBieXRlX2luZGV4ID0gcG9zaXRpb24gLy8gVUludDY0KDgpCiAgICBkdXAKICAgIGludGNfMiAvLyA4CiAgICAvCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyNzIKICAgIC8vIGJpdF9pbmRleCA9IHBvc2l0aW9uICUgVUludDY0KDgpCiAgICBpbnRjXzIgLy8gOAogICAgJQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjczCiAgICAvLyBjdXIgPSBvcC5Cb3guZXh0cmFjdChiaXRzX2tleSwgYnl0ZV9pbmRleCwgVUludDY0KDEpKQogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMQogICAgYm94X2V4dHJhY3QKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI3NAogICAgLy8gaWYgb3AuZ2V0Yml0KGN1ciwgYml0X2luZGV4KSA9PSBVSW50NjQoMSk6CiAgICBzd2FwCiAgICBnZXRiaXQKICAgIGludGNfMCAvLyAxCiAgICA9PQogICAgYnogc2lnbl9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6Mjc1CiAgICAvLyByZXR1cm4gVUludDY0KDEpICAjIGlkZW1wb3RlbnQKICAgIGludGNfMCAvLyAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKc2lnbl9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI3NgogICAgLy8gb3AuQm94LnJlcGxhY2UoYml0c19rZXksIGJ5dGVfaW5kZXgsIG9wLnNldGJpdF9ieXRlcyhjdXIsIGJpdF9pbmRleCwgVUludDY0KDEpKSkKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMwogICAgaW50Y18wIC8vIDEKICAgIHNldGJpdAogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyA0CiAgICB1bmNvdmVyIDIKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI3OAogICAgLy8gY291bnQgPSBzZWxmLmNvdW50X2J5X2hhc2hbZmlsZV9oYXNoXQogICAgYnl0ZWNfMyAvLyAweDYzNmU3NDVmCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb3VudF9ieV9oYXNoIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyODAKICAgIC8vIGNvdW50LnRvdGFsLCBhcmM0LlVJbnQ2NChjb3VudC5zaWduZWQubmF0aXZlICsgVUludDY0KDEpKQogICAgZHVwCiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHN3YXAKICAgIGludGNfMiAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6Mjc5LTI4MQogICAgLy8gc2VsZi5jb3VudF9ieV9oYXNoW2ZpbGVfaGFzaF0gPSBTaWduQ291bnQoCiAgICAvLyAgICAgY291bnQudG90YWwsIGFyYzQuVUludDY0KGNvdW50LnNpZ25lZC5uYXRpdmUgKyBVSW50NjQoMSkpCiAgICAvLyApCiAgICBjb25jYXQKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjgzLTI4NAogICAgLy8gIyBzZ2hfIHNvbnVuYSB5ZXJpbmRlIGVrbGUgKGJsb2Igb2t1bm1heikKICAgIC8vIHNnaF9rZXkgPSBzZWxmLnNpZ25lZF9ibG9iX2J5X2hhc2gua2V5X3ByZWZpeCArIGZpbGVfaGFzaC5ieXRlcwogICAgYnl0ZWMgOSAvLyAweDczNjc2ODVmCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6Mjg1CiAgICAvLyBlbmQsIGhhc19zZ2ggPSBvcC5Cb3gubGVuZ3RoKHNnaF9rZXkpCiAgICBib3hfbGVuCiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6Mjg2CiAgICAvLyBpZiBub3QgaGFzX3NnaCBvciBlbmQgPT0gVUludDY0KDApOgogICAgYnogc2lnbl9pZl9ib2R5QDgKICAgIGZyYW1lX2RpZyA1CiAgICBibnogc2lnbl9lbHNlX2JvZHlAOQoKc2lnbl9pZl9ib2R5QDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI4NwogICAgLy8gc2VsZi5zaWduZWRfYmxvYl9ieV9oYXNoW2ZpbGVfaGFzaF0gPSBzaWduZXIuYnl0ZXMKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfcHV0CgpzaWduX2FmdGVyX2lmX2Vsc2VAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI5MQogICAgLy8gcmV0dXJuIFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpzaWduX2Vsc2VfYm9keUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyODkKICAgIC8vIG9wLkJveC5yZXNpemUoc2doX2tleSwgZW5kICsgVUludDY0KDMyKSkKICAgIGZyYW1lX2RpZyA1CiAgICBkdXAKICAgIGludGNfMyAvLyAzMgogICAgKwogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBib3hfcmVzaXplCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI5MAogICAgLy8gb3AuQm94LnJlcGxhY2Uoc2doX2tleSwgZW5kLCBzaWduZXIuYnl0ZXMpCiAgICBzd2FwCiAgICBmcmFtZV9kaWcgLTEKICAgIGJveF9yZXBsYWNlCiAgICBiIHNpZ25fYWZ0ZXJfaWZfZWxzZUAxMAoKc2lnbl9ib29sX2ZhbHNlQDM6CiAgICBpbnRjXzEgLy8gMAogICAgYiBzaWduX2Jvb2xfbWVyZ2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ibG9ja3NpZ24uY29udHJhY3QuQmxvY2tzaWduLmlzc2lnbihmaWxlX2hhc2g6IGJ5dGVzKSAtPiB1aW50NjQ6Cmlzc2lnbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MjkzLTI5NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBpc3NpZ24oc2VsZiwgZmlsZV9oYXNoOiBhcmM0LkR5bmFtaWNCeXRlcykgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICBieXRlY18xIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI5NQogICAgLy8gYXNzZXJ0IEdsb2JhbC5ncm91cF9zaXplID09IDEsICJpbnZhbGlkIGdyb3VwIHNpemUiCiAgICBnbG9iYWwgR3JvdXBTaXplCiAgICBpbnRjXzAgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIGdyb3VwIHNpemUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6Mjk3CiAgICAvLyBjYW5jZWxlZF9mbGFnLCBjYW5jZWxlZF9leGlzdHMgPSBzZWxmLmNhbmNlbGVkX2J5X2hhc2gubWF5YmUoZmlsZV9oYXNoKQogICAgYnl0ZWNfMiAvLyAweDY0NjU2YzVmCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToyOTgKICAgIC8vIGlmIGNhbmNlbGVkX2V4aXN0cyBhbmQgY2FuY2VsZWRfZmxhZyA9PSBVSW50NjQoMSk6CiAgICBieiBpc3NpZ25fYWZ0ZXJfaWZfZWxzZUAzCiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18wIC8vIDEKICAgID09CiAgICBieiBpc3NpZ25fYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjI5OQogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgppc3NpZ25fYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weToxMDMKICAgIC8vIHJldHVybiBvcC5zaGEyNTYoZmlsZV9oYXNoLmJ5dGVzICsgc2lnbmVyLmJ5dGVzKQogICAgZnJhbWVfZGlnIC0xCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMwMgogICAgLy8gc2VsZi5fbWVtYmVyX2tleShmaWxlX2hhc2gsIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSkKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MTAzCiAgICAvLyByZXR1cm4gb3Auc2hhMjU2KGZpbGVfaGFzaC5ieXRlcyArIHNpZ25lci5ieXRlcykKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMwMQogICAgLy8gcG9zaXRpb24sIGhhc19tZW1iZXIgPSBzZWxmLm1lbWJlcl9ieV9rZXkubWF5YmUoCiAgICBieXRlYyA1IC8vIDB4NmQ2MjcyNWYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzAxLTMwMwogICAgLy8gcG9zaXRpb24sIGhhc19tZW1iZXIgPSBzZWxmLm1lbWJlcl9ieV9rZXkubWF5YmUoCiAgICAvLyAgICAgc2VsZi5fbWVtYmVyX2tleShmaWxlX2hhc2gsIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSkKICAgIC8vICkKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMwNAogICAgLy8gaWYgbm90IGhhc19tZW1iZXI6CiAgICBibnogaXNzaWduX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMDUKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludGNfMSAvLyAwCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKaXNzaWduX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzA3CiAgICAvLyBzZWxmLnNpZ25lZF9iaXRzX2J5X2hhc2gua2V5X3ByZWZpeCArIGZpbGVfaGFzaC5ieXRlcywgcG9zaXRpb24gLy8gVUludDY0KDgpLCBVSW50NjQoMSkKICAgIGJ5dGVjIDYgLy8gMHg3MzYyNmQ1ZgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyA4CiAgICAvCiAgICBpbnRjXzAgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMDYtMzA4CiAgICAvLyBjdXIgPSBvcC5Cb3guZXh0cmFjdCgKICAgIC8vICAgICBzZWxmLnNpZ25lZF9iaXRzX2J5X2hhc2gua2V5X3ByZWZpeCArIGZpbGVfaGFzaC5ieXRlcywgcG9zaXRpb24gLy8gVUludDY0KDgpLCBVSW50NjQoMSkKICAgIC8vICkKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMwOQogICAgLy8gcmV0dXJuIG9wLmdldGJpdChjdXIsIHBvc2l0aW9uICUgVUludDY0KDgpKQogICAgc3dhcAogICAgaW50Y18yIC8vIDgKICAgICUKICAgIGdldGJpdAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYmxvY2tzaWduLmNvbnRyYWN0LkJsb2Nrc2lnbi5pc2NvbXBsZXRlKGZpbGVfaGFzaDogYnl0ZXMpIC0+IHVpbnQ2NDoKaXNjb21wbGV0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzExLTMxMgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBpc2NvbXBsZXRlKHNlbGYsIGZpbGVfaGFzaDogYXJjNC5EeW5hbWljQnl0ZXMpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgaW50Y18xIC8vIDAKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMTMKICAgIC8vIGFzc2VydCBHbG9iYWwuZ3JvdXBfc2l6ZSA9PSAxLCAiaW52YWxpZCBncm91cCBzaXplIgogICAgZ2xvYmFsIEdyb3VwU2l6ZQogICAgaW50Y18wIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBncm91cCBzaXplCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMxNQogICAgLy8gY2FuY2VsZWRfZmxhZywgY2FuY2VsZWRfZXhpc3RzID0gc2VsZi5jYW5jZWxlZF9ieV9oYXNoLm1heWJlKGZpbGVfaGFzaCkKICAgIGJ5dGVjXzIgLy8gMHg2NDY1NmM1ZgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzE2CiAgICAvLyBpZiBjYW5jZWxlZF9leGlzdHMgYW5kIGNhbmNlbGVkX2ZsYWcgPT0gVUludDY0KDEpOgogICAgYnogaXNjb21wbGV0ZV9hZnRlcl9pZl9lbHNlQDMKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjXzAgLy8gMQogICAgPT0KICAgIGJ6IGlzY29tcGxldGVfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMxNwogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgppc2NvbXBsZXRlX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzE5CiAgICAvLyBjb3VudCwgaGFzX2NvdW50ID0gc2VsZi5jb3VudF9ieV9oYXNoLm1heWJlKGZpbGVfaGFzaCkKICAgIGJ5dGVjXzMgLy8gMHg2MzZlNzQ1ZgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMjAKICAgIC8vIGlmIG5vdCBoYXNfY291bnQgb3IgY291bnQudG90YWwgPT0gYXJjNC5VSW50NjQoMCk6CiAgICBieiBpc2NvbXBsZXRlX2lmX2JvZHlANQogICAgZnJhbWVfZGlnIDAKICAgIGV4dHJhY3QgMCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIGJ5dGVjIDExIC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgYj09CiAgICBieiBpc2NvbXBsZXRlX2FmdGVyX2lmX2Vsc2VANgoKaXNjb21wbGV0ZV9pZl9ib2R5QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMyMQogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgppc2NvbXBsZXRlX2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzIyCiAgICAvLyBpZiBjb3VudC5zaWduZWQgPT0gY291bnQudG90YWw6CiAgICBmcmFtZV9kaWcgMAogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgMQogICAgYj09CiAgICBieiBpc2NvbXBsZXRlX2FmdGVyX2lmX2Vsc2VAOAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMjMKICAgIC8vIHJldHVybiBVSW50NjQoMSkKICAgIGludGNfMCAvLyAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKaXNjb21wbGV0ZV9hZnRlcl9pZl9lbHNlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMyNAogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJsb2Nrc2lnbi5jb250cmFjdC5CbG9ja3NpZ24ucmVqZWN0KGZpbGVfaGFzaDogYnl0ZXMsIHNpZ25lcjogYnl0ZXMpIC0+IHVpbnQ2NDoKcmVqZWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMjYtMzI3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIHJlamVjdChzZWxmLCBmaWxlX2hhc2g6IGFyYzQuRHluYW1pY0J5dGVzLCBzaWduZXI6IGFyYzQuQWRkcmVzcykgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMyOAogICAgLy8gYXNzZXJ0IFR4bi5ncm91cF9pbmRleCA9PSBVSW50NjQoMCksICJyZWplY3QgbXVzdCBiZSBHdHhuWzBdIgogICAgdHhuIEdyb3VwSW5kZXgKICAgICEKICAgIGFzc2VydCAvLyByZWplY3QgbXVzdCBiZSBHdHhuWzBdCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMyOQogICAgLy8gc2VsZi5fb25seV9ib3hfcmVmc19hZnRlcigpCiAgICBjYWxsc3ViIF9vbmx5X2JveF9yZWZzX2FmdGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjMzMQogICAgLy8gY2FuY2VsZWRfZmxhZywgY2FuY2VsZWRfZXhpc3RzID0gc2VsZi5jYW5jZWxlZF9ieV9oYXNoLm1heWJlKGZpbGVfaGFzaCkKICAgIGJ5dGVjXzIgLy8gMHg2NDY1NmM1ZgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozMzIKICAgIC8vIGFzc2VydCBub3QgKGNhbmNlbGVkX2V4aXN0cyBhbmQgY2FuY2VsZWRfZmxhZyA9PSAxKSwgImhhc2ggY2FuY2VsZWQiCiAgICBieiByZWplY3RfYm9vbF9mYWxzZUAzCiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18wIC8vIDEKICAgID09CiAgICBieiByZWplY3RfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzAgLy8gMQoKcmVqZWN0X2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzMyCiAgICAvLyBhc3NlcnQgbm90IChjYW5jZWxlZF9leGlzdHMgYW5kIGNhbmNlbGVkX2ZsYWcgPT0gMSksICJoYXNoIGNhbmNlbGVkIgogICAgIQogICAgYXNzZXJ0IC8vIGhhc2ggY2FuY2VsZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzM0CiAgICAvLyBhc3NldF9pZCwgZXhpc3RzID0gc2VsZi5hc3NldF9ieV9oYXNoLm1heWJlKGZpbGVfaGFzaCkKICAgIGJ5dGVjIDQgLy8gMHg2MTczNjE1ZgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzM1CiAgICAvLyBhc3NlcnQgZXhpc3RzLCAiaGFzaCBub3QgZm91bmQiCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gaGFzaCBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzM3CiAgICAvLyBhc3NlcnQgc2lnbmVyLmJ5dGVzID09IFR4bi5zZW5kZXIuYnl0ZXMsICJzZW5kZXIgbWlzbWF0Y2giCiAgICBmcmFtZV9kaWcgLTEKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gc2VuZGVyIG1pc21hdGNoCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjEwMwogICAgLy8gcmV0dXJuIG9wLnNoYTI1NihmaWxlX2hhc2guYnl0ZXMgKyBzaWduZXIuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBzaGEyNTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzM5CiAgICAvLyBhc3NlcnQgc2VsZi5fbWVtYmVyX2tleShmaWxlX2hhc2gsIHNpZ25lcikgaW4gc2VsZi5tZW1iZXJfYnlfa2V5LCAidW5hdXRob3JpemVkIHNpZ25lciIKICAgIGJ5dGVjIDUgLy8gMHg2ZDYyNzI1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyB1bmF1dGhvcml6ZWQgc2lnbmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM0MS0zNDMKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgY29uZmlnX2Fzc2V0PUFzc2V0KGFzc2V0X2lkKSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGR1cAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozNDEKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICBwdXNoaW50IDMgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18xIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM0MS0zNDMKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgY29uZmlnX2Fzc2V0PUFzc2V0KGFzc2V0X2lkKSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM0NQogICAgLy8gc2VsZi5jYW5jZWxlZF9ieV9oYXNoW2ZpbGVfaGFzaF0gPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAxCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozNDYKICAgIC8vIHNlbGYuX2NsZWFyX3NpZ25hdHVyZXMoZmlsZV9oYXNoKQogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIF9jbGVhcl9zaWduYXR1cmVzCiAgICBmcmFtZV9idXJ5IC0yCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM0OAogICAgLy8gcmV0dXJuIGFzc2V0X2lkCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKcmVqZWN0X2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMSAvLyAwCiAgICBiIHJlamVjdF9ib29sX21lcmdlQDQKCgovLyBzbWFydF9jb250cmFjdHMuYmxvY2tzaWduLmNvbnRyYWN0LkJsb2Nrc2lnbi5teV9jb250cmFjdHMoKSAtPiBieXRlczoKbXlfY29udHJhY3RzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozNTQtMzU1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIG15X2NvbnRyYWN0cyhzZWxmKSAtPiBCeXRlczoKICAgIHByb3RvIDAgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozNjEKICAgIC8vIGJsb2IsIGhhcyA9IHNlbGYudXNlcl9oYXNoZXMubWF5YmUoa2V5KQogICAgYnl0ZWMgNyAvLyAweDc1Njg3MzVmCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM2MAogICAgLy8ga2V5ID0gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIuYnl0ZXMpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM2MQogICAgLy8gYmxvYiwgaGFzID0gc2VsZi51c2VyX2hhc2hlcy5tYXliZShrZXkpCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzYyCiAgICAvLyBpZiBub3QgaGFzOgogICAgYm56IG15X2NvbnRyYWN0c19hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzYzCiAgICAvLyByZXR1cm4gQnl0ZXMoYiIiKQogICAgYnl0ZWNfMSAvLyAweAogICAgc3dhcAogICAgcmV0c3ViCgpteV9jb250cmFjdHNfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozNjQKICAgIC8vIHJldHVybiBibG9iCiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJsb2Nrc2lnbi5jb250cmFjdC5CbG9ja3NpZ24uZ2V0X2Fzc2V0X2lkKGZpbGVfaGFzaDogYnl0ZXMpIC0+IHVpbnQ2NDoKZ2V0X2Fzc2V0X2lkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozNjYtMzY4CiAgICAvLyAjIC0tLS0gQXlyxLEgb2t1bWEgbWV0b2RsYXLEsSAodHVwbGUgeWVyaW5lKSAtLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGdldF9hc3NldF9pZChzZWxmLCBmaWxlX2hhc2g6IGFyYzQuRHluYW1pY0J5dGVzKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzY5CiAgICAvLyBhc3NldF9pZCwgaGFzX2Fzc2V0ID0gc2VsZi5hc3NldF9ieV9oYXNoLm1heWJlKGZpbGVfaGFzaCkKICAgIGJ5dGVjIDQgLy8gMHg2MTczNjE1ZgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzcwCiAgICAvLyBpZiBub3QgaGFzX2Fzc2V0OgogICAgYm56IGdldF9hc3NldF9pZF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzcxCiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnRjXzEgLy8gMAogICAgc3dhcAogICAgcmV0c3ViCgpnZXRfYXNzZXRfaWRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozNzIKICAgIC8vIHJldHVybiBhc3NldF9pZAogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ibG9ja3NpZ24uY29udHJhY3QuQmxvY2tzaWduLmlzX2FjdGl2ZShmaWxlX2hhc2g6IGJ5dGVzKSAtPiB1aW50NjQ6CmlzX2FjdGl2ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6Mzc0LTM3NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBpc19hY3RpdmUoc2VsZiwgZmlsZV9oYXNoOiBhcmM0LkR5bmFtaWNCeXRlcykgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM3NgogICAgLy8gY2FuY2VsZWRfZmxhZywgY2FuY2VsZWRfZXhpc3RzID0gc2VsZi5jYW5jZWxlZF9ieV9oYXNoLm1heWJlKGZpbGVfaGFzaCkKICAgIGJ5dGVjXzIgLy8gMHg2NDY1NmM1ZgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6Mzc3CiAgICAvLyBpZiBjYW5jZWxlZF9leGlzdHMgYW5kIGNhbmNlbGVkX2ZsYWcgPT0gVUludDY0KDEpOgogICAgYnogaXNfYWN0aXZlX2FmdGVyX2lmX2Vsc2VAMwogICAgZnJhbWVfZGlnIDAKICAgIGludGNfMCAvLyAxCiAgICA9PQogICAgYnogaXNfYWN0aXZlX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozNzgKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludGNfMSAvLyAwCiAgICBzd2FwCiAgICByZXRzdWIKCmlzX2FjdGl2ZV9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM3OQogICAgLy8gcmV0dXJuIFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDEKICAgIHN3YXAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ibG9ja3NpZ24uY29udHJhY3QuQmxvY2tzaWduLnRvdGFsX3NpZ25lcnMoZmlsZV9oYXNoOiBieXRlcykgLT4gdWludDY0Ogp0b3RhbF9zaWduZXJzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozODEtMzgyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIHRvdGFsX3NpZ25lcnMoc2VsZiwgZmlsZV9oYXNoOiBhcmM0LkR5bmFtaWNCeXRlcykgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM4MwogICAgLy8gY291bnQsIGhhc19jb3VudCA9IHNlbGYuY291bnRfYnlfaGFzaC5tYXliZShmaWxlX2hhc2gpCiAgICBieXRlY18zIC8vIDB4NjM2ZTc0NWYKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM4NAogICAgLy8gaWYgbm90IGhhc19jb3VudDoKICAgIGJueiB0b3RhbF9zaWduZXJzX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozODUKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludGNfMSAvLyAwCiAgICBzd2FwCiAgICByZXRzdWIKCnRvdGFsX3NpZ25lcnNfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Jsb2Nrc2lnbi9jb250cmFjdC5weTozODYKICAgIC8vIHJldHVybiBjb3VudC50b3RhbC5uYXRpdmUKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIHN3YXAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ibG9ja3NpZ24uY29udHJhY3QuQmxvY2tzaWduLnNpZ25lZF9jb3VudChmaWxlX2hhc2g6IGJ5dGVzKSAtPiB1aW50NjQ6CnNpZ25lZF9jb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6Mzg4LTM4OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBzaWduZWRfY291bnQoc2VsZiwgZmlsZV9oYXNoOiBhcmM0LkR5bmFtaWNCeXRlcykgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM5MAogICAgLy8gY291bnQsIGhhc19jb3VudCA9IHNlbGYuY291bnRfYnlfaGFzaC5tYXliZShmaWxlX2hhc2gpCiAgICBieXRlY18zIC8vIDB4NjM2ZTc0NWYKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM5MQogICAgLy8gaWYgbm90IGhhc19jb3VudDoKICAgIGJueiBzaWduZWRfY291bnRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmxvY2tzaWduL2NvbnRyYWN0LnB5OjM5MgogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18xIC8vIDAKICAgIHN3YXAKICAgIHJldHN1YgoKc2lnbmVkX2NvdW50X2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ibG9ja3NpZ24vY29udHJhY3QucHk6MzkzCiAgICAvLyByZXR1cm4gY291bnQuc2lnbmVkLm5hdGl2ZQogICAgZnJhbWVfZGlnIDAKICAgIGludGNfMiAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgc3dhcAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [1194], "errorMessage": "Address length is 32 bytes"}, {"pc": [763, 1384, 1568, 1586], "errorMessage": "Index access is out of bounds"}, {"pc": [169, 189, 209, 229, 249, 273, 282, 305, 325, 345, 368, 388], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [1084], "errorMessage": "already canceled"}, {"pc": [1020], "errorMessage": "box_refs must target this app"}, {"pc": [416], "errorMessage": "can only call when creating"}, {"pc": [172, 192, 212, 232, 252, 276, 285, 308, 328, 348, 371, 391], "errorMessage": "can only call when not creating"}, {"pc": [1049], "errorMessage": "cancel must be Gtxn[0]"}, {"pc": [1382], "errorMessage": "check self.count_by_hash entry exists"}, {"pc": [1129], "errorMessage": "check self.signers_blob_by_hash entry exists"}, {"pc": [506], "errorMessage": "close not allowed"}, {"pc": [459], "errorMessage": "create_contract must be Gtxn[1]"}, {"pc": [454], "errorMessage": "group must start with Payment + AppCall"}, {"pc": [448, 1288, 1634], "errorMessage": "hash canceled"}, {"pc": [1062, 1297, 1644], "errorMessage": "hash not found"}, {"pc": [485], "errorMessage": "insufficient payment: need >= 5 ALGO"}, {"pc": [1267, 1457, 1532], "errorMessage": "invalid group size"}, {"pc": [1045], "errorMessage": "only app creator can cancel"}, {"pc": [1028], "errorMessage": "only box_refs may follow"}, {"pc": [492], "errorMessage": "payer must be the caller"}, {"pc": [475], "errorMessage": "payment must go to app address"}, {"pc": [1609], "errorMessage": "reject must be Gtxn[0]"}, {"pc": [499], "errorMessage": "rekey not allowed"}, {"pc": [1303, 1650], "errorMessage": "sender mismatch"}, {"pc": [1013], "errorMessage": "transaction type is appl"}, {"pc": [468], "errorMessage": "transaction type is pay"}, {"pc": [1318, 1664], "errorMessage": "unauthorized signer"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,6 +64,13 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class SignCount:
+    """Struct for SignCount"""
+    total: int
+    signed: int
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CreateContractArgs:
     """Dataclass for create_contract arguments"""
@@ -240,6 +247,17 @@ class BlocksignParams:
             "args": method_args,
         }))
 
+    def box_refs(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "box_refs()void",
+        }))
+
     def my_contracts(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -396,6 +414,17 @@ class BlocksignCreateTransactionParams:
             "args": method_args,
         }))
 
+    def box_refs(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "box_refs()void",
+        }))
+
     def my_contracts(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -570,6 +599,20 @@ class BlocksignSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
+    def box_refs(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "box_refs()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def my_contracts(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -677,7 +720,9 @@ class _BoxState:
         self.app_client = app_client
         
         # Pre-generated mapping of value types to their struct classes
-        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "SignCount": SignCount
+        }
 
     def get_all(self) -> dict[str, typing.Any]:
         """Get all current keyed values from box state"""
@@ -749,6 +794,33 @@ class _BoxState:
             None
         )
 
+    @property
+    def member_by_key(self) -> "_MapState[bytes, int]":
+        """Get values from the member_by_key map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "member_by_key",
+            None
+        )
+
+    @property
+    def signed_bits_by_hash(self) -> "_MapState[bytes | str, bytes]":
+        """Get values from the signed_bits_by_hash map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "signed_bits_by_hash",
+            None
+        )
+
+    @property
+    def count_by_hash(self) -> "_MapState[bytes | str, SignCount]":
+        """Get values from the count_by_hash map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "count_by_hash",
+            self._struct_classes.get("SignCount")
+        )
+
 _KeyType = typing.TypeVar("_KeyType")
 _ValueType = typing.TypeVar("_ValueType")
 
@@ -964,6 +1036,12 @@ class BlocksignClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["box_refs()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["my_contracts()byte[]"],
@@ -1295,6 +1373,25 @@ class BlocksignFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def box_refs(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the box_refs()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "box_refs()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def my_contracts(
         self,
         *,
@@ -1603,6 +1700,23 @@ class BlocksignComposer:
         )
         return self
 
+    def box_refs(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BlocksignComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.box_refs(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "box_refs()void", v
+            )
+        )
+        return self
+
     def my_contracts(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
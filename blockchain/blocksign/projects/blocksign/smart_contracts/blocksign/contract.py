@@ -11,39 +11,61 @@ from algopy import (
     Bytes,
     Asset,
     arc4,
+    op,
+    subroutine,
 )
 
 # Sabitler
 FIVE_ALGO = 5_000_000   # microAlgos
 PAYMENT_INDEX = 0       # Gtxn[0] ödeme
+CREATE_INDEX = 1        # Gtxn[1] create_contract; sonrası yalnızca box_refs çağrıları
+
+
+class SignCount(arc4.Struct, frozen=True):
+    """cnt_ değeri: tekil imzacı sayısı ve imzalayan sayısı."""
+    total: arc4.UInt64
+    signed: arc4.UInt64
+
 
 class Blocksign(ARC4Contract):
     """
     create_contract(file_hash, signers):
       - Gtxn[0]: Payment -> app address, amount >= 5 ALGO, sender == caller
       - Gtxn[1]: AppCall (bu method)
+      - Gtxn[2..]: (isteğe bağlı) box_refs çağrıları; yalnızca ek box referansı taşır
       - 1 adetlik NFT (ASA) mint eder, manager = app address
       - file_hash -> asset_id ve admin eşleşmesini box storage'da tutar
       - signers (address[]) -> tek box'ta (sgn_) ardışık 32B adres blob'u olarak saklanır
+      - her imzacı için mbr_ kutusu: sha256(file_hash || signer) -> sgn_ listesindeki sıra
+      - sbm_: sıraya göre imza bitmap'i (sıfırlı), cnt_: (tekil imzacı, imzalayan) sayaçları
       - asset_id döndürür
 
     cancel(file_hash):
       - Sadece uygulamayı oluşturan hesap (Global.creator_address) çağırabilir
       - (Mümkünse) ASA’yı siler, kaydı iptal eder
+      - Gtxn[0] olmalı; sonrası yalnızca box_refs çağrıları (imzacı başına mbr_ referansları)
+      - sgn_/sgh_ boşaltılır; sbm_, cnt_ ve tüm mbr_ kutuları silinir (MBR iade)
 
     sign(file_hash, signer):
-      - Sadece yetkili imzacılar (sgn_ blob’unda olan adresler) çağırabilir
+      - Sadece yetkili imzacılar (mbr_ kutusu olan adresler) çağırabilir
       - signer.bytes == Txn.sender.bytes olmalı
-      - İmza kaydını sgh_ kutusuna ekler (idempotent)
+      - sbm_'de imzacının bitini set eder, cnt_.signed'ı artırır ve sgh_ kutusuna ekler (idempotent)
+      - İmzacı sayısından bağımsız: mbr_ + bitmap'in tek baytı, sgh_ taranmaz
 
     issign(file_hash):
-      - Txn.sender bu hash’i imzalamış mı? (1/0)
+      - Txn.sender bu hash’i imzalamış mı? (1/0; iptal edilmişse 0)
 
     iscomplete(file_hash):
-      - Listedeki tüm imzacılar imzalamış mı? (1/0)
+      - Listedeki tüm imzacılar imzalamış mı? (1/0; cnt_.signed == cnt_.total)
 
     reject(file_hash, signer):
       - signers listesindeki herhangi bir kişi reddederse ASA silinip kayıt iptal edilir
+      - yetki kontrolü sign ile aynı (tek mbr_ okuması)
+      - temizlik ve grup düzeni cancel ile aynı
+
+    box_refs():
+      - Etkisiz; create_contract / cancel / reject grubunda 8'den fazla box referansı
+        gerektiğinde ek referansları taşır (grup içi kaynak paylaşımı)
 
     my_contracts():
       - Txn.sender’ın oluşturduğu sözleşme hash’lerini 32B ardışık blob olarak döner
@@ -51,8 +73,8 @@ class Blocksign(ARC4Contract):
     Aşağıdaki okuma metodları tek tek bilgi verir (tuple yerine):
       - get_asset_id(file_hash)  -> UInt64
       - is_active(file_hash)     -> UInt64 (iptal edilmemiş:1 / iptal:0)
-      - total_signers(file_hash) -> UInt64
-      - signed_count(file_hash)  -> UInt64
+      - total_signers(file_hash) -> UInt64 (tekil imzacı sayısı, cnt_)
+      - signed_count(file_hash)  -> UInt64 (cnt_)
     """
 
     def __init__(self) -> None:
@@ -68,6 +90,17 @@ class Blocksign(ARC4Contract):
         self.signed_blob_by_hash = BoxMap(arc4.DynamicBytes, Bytes, key_prefix=b"sgh_")
         # kullanıcı (address) -> kendi oluşturduğu hash’ler (32B’lik ardışık blob)
         self.user_hashes = BoxMap(arc4.Address, Bytes, key_prefix=b"uhs_")
+        # sha256(file_hash || signer) -> sgn_ listesindeki sıra; yetki tek kutu okuması
+        # (file_hash + adres 64B box adı sınırını aştığından key hash'lenir)
+        self.member_by_key = BoxMap(Bytes, UInt64, key_prefix=b"mbr_")
+        # file_hash -> imza bitmap'i; bit i = sgn_ listesinde i. sıradaki imzacı imzaladı
+        self.signed_bits_by_hash = BoxMap(arc4.DynamicBytes, Bytes, key_prefix=b"sbm_")
+        # file_hash -> (tekil imzacı, imzalayan) sayaçları
+        self.count_by_hash = BoxMap(arc4.DynamicBytes, SignCount, key_prefix=b"cnt_")
+
+    @subroutine
+    def _member_key(self, file_hash: arc4.DynamicBytes, signer: arc4.Address) -> Bytes:
+        return op.sha256(file_hash.bytes + signer.bytes)
 
     @arc4.abimethod()
     def create_contract(
@@ -80,7 +113,9 @@ class Blocksign(ARC4Contract):
         assert not (canceled_exists and canceled_flag == 1), "hash canceled"
 
         # --- 1) Ödeme doğrulama ---
-        assert Global.group_size == 2, "group must be size 2 (Payment + AppCall)"
+        assert Global.group_size >= 2, "group must start with Payment + AppCall"
+        assert Txn.group_index == CREATE_INDEX, "create_contract must be Gtxn[1]"
+        self._only_box_refs_after()
 
         pay = gtxn.PaymentTransaction(PAYMENT_INDEX)
         assert pay.receiver == Global.current_application_address, "payment must go to app address"
@@ -131,15 +166,23 @@ class Blocksign(ARC4Contract):
         self.asset_by_hash[file_hash] = asset_id
         self.admin_by_hash[file_hash] = Global.creator_address
 
-        # --- 5) İmzacıları (sgn_) sakla
+        # --- 5) İmzacıları (sgn_) ve üyelik kutularını (mbr_) sakla
         blob: Bytes = Bytes(b"")
         i = UInt64(0)
+        unique = UInt64(0)
         n = signers.length
         while i < n:
             addr = signers[i]          # arc4.Address
             blob = blob + addr.bytes   # 32 bayt ekle
+            member_key = self._member_key(file_hash, addr)
+            # listede tekrar eden adres: ilk sırası geçerli, bir kez sayılır
+            if member_key not in self.member_by_key:
+                self.member_by_key[member_key] = i
+                unique = unique + UInt64(1)
             i = i + UInt64(1)
         self.signers_blob_by_hash[file_hash] = blob
+        self.signed_bits_by_hash[file_hash] = op.bzero((n + UInt64(7)) // UInt64(8))
+        self.count_by_hash[file_hash] = SignCount(arc4.UInt64(unique), arc4.UInt64(0))
 
         # sgh_ (signed) başlangıçta boş
         self.signed_blob_by_hash[file_hash] = Bytes(b"")
@@ -162,9 +205,21 @@ class Blocksign(ARC4Contract):
         # --- 7) asset_id döndür ---
         return asset_id
 
+    @subroutine
+    def _only_box_refs_after(self) -> None:
+        # grupta bu çağrıdan sonra yalnızca aynı uygulamaya box_refs çağrıları olabilir
+        i = Txn.group_index + UInt64(1)
+        while i < Global.group_size:
+            call = gtxn.ApplicationCallTransaction(i)
+            assert call.app_id == Global.current_application_id, "box_refs must target this app"
+            assert call.app_args(0) == arc4.arc4_signature("box_refs()void"), "only box_refs may follow"
+            i = i + UInt64(1)
+
     @arc4.abimethod()
     def cancel(self, file_hash: arc4.DynamicBytes) -> UInt64:
         assert Txn.sender == Global.creator_address, "only app creator can cancel"
+        assert Txn.group_index == UInt64(0), "cancel must be Gtxn[0]"
+        self._only_box_refs_after()
 
         asset_id, exists = self.asset_by_hash.maybe(file_hash)
         assert exists, "hash not found"
@@ -178,11 +233,24 @@ class Blocksign(ARC4Contract):
         ).submit()
 
         self.canceled_by_hash[file_hash] = UInt64(1)
-        self.signers_blob_by_hash[file_hash] = Bytes(b"")
-        self.signed_blob_by_hash[file_hash] = Bytes(b"")
+        self._clear_signatures(file_hash)
 
         return asset_id
 
+    @subroutine
+    def _clear_signatures(self, file_hash: arc4.DynamicBytes) -> None:
+        # imzacı başına mbr_ kutuları silinir (tekrar eden adreste box_del ikinci kez etkisiz)
+        blob = self.signers_blob_by_hash[file_hash]
+        i = UInt64(0)
+        while i < blob.length:
+            del self.member_by_key[self._member_key(file_hash, arc4.Address(blob[i : i + UInt64(32)]))]
+            i = i + UInt64(32)
+        self.signers_blob_by_hash[file_hash] = Bytes(b"")
+        self.signed_blob_by_hash[file_hash] = Bytes(b"")
+        # bitmap ve sayaçların MBR'ı da geri alınır
+        del self.signed_bits_by_hash[file_hash]
+        del self.count_by_hash[file_hash]
+
     @arc4.abimethod()
     def sign(self, file_hash: arc4.DynamicBytes, signer: arc4.Address) -> UInt64:
         assert Global.group_size == 1, "invalid group size"
@@ -195,46 +263,50 @@ class Blocksign(ARC4Contract):
 
         assert signer.bytes == Txn.sender.bytes, "sender mismatch"
 
-        sgn_blob, has_sgn = self.signers_blob_by_hash.maybe(file_hash)
-        assert has_sgn, "no signers set"
-
-        i = UInt64(0)
-        authorized = UInt64(0)
-        while i < sgn_blob.length:
-            if sgn_blob[i : i + UInt64(32)] == signer.bytes:
-                authorized = UInt64(1)
-                break
-            i = i + UInt64(32)
-        assert authorized == UInt64(1), "unauthorized signer"
-
-        sgh_blob, has_sgh = self.signed_blob_by_hash.maybe(file_hash)
-        if not has_sgh:
-            sgh_blob = Bytes(b"")
-
-        j = UInt64(0)
-        while j < sgh_blob.length:
-            if sgh_blob[j : j + UInt64(32)] == signer.bytes:
-                return UInt64(1)  # idempotent
-            j = j + UInt64(32)
-
-        self.signed_blob_by_hash[file_hash] = sgh_blob + signer.bytes
+        position, authorized = self.member_by_key.maybe(self._member_key(file_hash, signer))
+        assert authorized, "unauthorized signer"
+
+        # bitmap'te yalnızca imzacının baytı okunup yazılır
+        bits_key = self.signed_bits_by_hash.key_prefix + file_hash.bytes
+        byte_index = position // UInt64(8)
+        bit_index = position % UInt64(8)
+        cur = op.Box.extract(bits_key, byte_index, UInt64(1))
+        if op.getbit(cur, bit_index) == UInt64(1):
+            return UInt64(1)  # idempotent
+        op.Box.replace(bits_key, byte_index, op.setbit_bytes(cur, bit_index, UInt64(1)))
+
+        count = self.count_by_hash[file_hash]
+        self.count_by_hash[file_hash] = SignCount(
+            count.total, arc4.UInt64(count.signed.native + UInt64(1))
+        )
+
+        # sgh_ sonuna yerinde ekle (blob okunmaz)
+        sgh_key = self.signed_blob_by_hash.key_prefix + file_hash.bytes
+        end, has_sgh = op.Box.length(sgh_key)
+        if not has_sgh or end == UInt64(0):
+            self.signed_blob_by_hash[file_hash] = signer.bytes
+        else:
+            op.Box.resize(sgh_key, end + UInt64(32))
+            op.Box.replace(sgh_key, end, signer.bytes)
         return UInt64(1)
 
     @arc4.abimethod()
     def issign(self, file_hash: arc4.DynamicBytes) -> UInt64:
         assert Global.group_size == 1, "invalid group size"
 
-        sgh_blob, has_sgh = self.signed_blob_by_hash.maybe(file_hash)
-        if not has_sgh:
+        canceled_flag, canceled_exists = self.canceled_by_hash.maybe(file_hash)
+        if canceled_exists and canceled_flag == UInt64(1):
             return UInt64(0)
 
-        i = UInt64(0)
-        while i < sgh_blob.length:
-            if sgh_blob[i : i + UInt64(32)] == Txn.sender.bytes:
-                return UInt64(1)
-            i = i + UInt64(32)
-
-        return UInt64(0)
+        position, has_member = self.member_by_key.maybe(
+            self._member_key(file_hash, arc4.Address(Txn.sender))
+        )
+        if not has_member:
+            return UInt64(0)
+        cur = op.Box.extract(
+            self.signed_bits_by_hash.key_prefix + file_hash.bytes, position // UInt64(8), UInt64(1)
+        )
+        return op.getbit(cur, position % UInt64(8))
 
     @arc4.abimethod()
     def iscomplete(self, file_hash: arc4.DynamicBytes) -> UInt64:
@@ -244,33 +316,17 @@ class Blocksign(ARC4Contract):
         if canceled_exists and canceled_flag == UInt64(1):
             return UInt64(0)
 
-        sgn_blob, has_sgn = self.signers_blob_by_hash.maybe(file_hash)
-        if not has_sgn or sgn_blob.length == UInt64(0):
+        count, has_count = self.count_by_hash.maybe(file_hash)
+        if not has_count or count.total == arc4.UInt64(0):
             return UInt64(0)
-
-        sgh_blob, has_sgh = self.signed_blob_by_hash.maybe(file_hash)
-        if not has_sgh or sgh_blob.length == UInt64(0):
-            return UInt64(0)
-
-        i = UInt64(0)
-        while i < sgn_blob.length:
-            signer_bytes = sgn_blob[i : i + UInt64(32)]
-            j = UInt64(0)
-            found = UInt64(0)
-            while j < sgh_blob.length:
-                if sgh_blob[j : j + UInt64(32)] == signer_bytes:
-                    found = UInt64(1)
-                    break
-                j = j + UInt64(32)
-            if found == UInt64(0):
-                return UInt64(0)
-            i = i + UInt64(32)
-
-        return UInt64(1)
+        if count.signed == count.total:
+            return UInt64(1)
+        return UInt64(0)
 
     @arc4.abimethod()
     def reject(self, file_hash: arc4.DynamicBytes, signer: arc4.Address) -> UInt64:
-        assert Global.group_size == 1, "invalid group size"
+        assert Txn.group_index == UInt64(0), "reject must be Gtxn[0]"
+        self._only_box_refs_after()
 
         canceled_flag, canceled_exists = self.canceled_by_hash.maybe(file_hash)
         assert not (canceled_exists and canceled_flag == 1), "hash canceled"
@@ -280,27 +336,21 @@ class Blocksign(ARC4Contract):
 
         assert signer.bytes == Txn.sender.bytes, "sender mismatch"
 
-        sgn_blob, has_sgn = self.signers_blob_by_hash.maybe(file_hash)
-        assert has_sgn, "no signers set"
-        i = UInt64(0)
-        authorized = UInt64(0)
-        while i < sgn_blob.length:
-            if sgn_blob[i : i + UInt64(32)] == signer.bytes:
-                authorized = UInt64(1)
-                break
-            i = i + UInt64(32)
-        assert authorized == UInt64(1), "unauthorized signer"
+        assert self._member_key(file_hash, signer) in self.member_by_key, "unauthorized signer"
 
         itxn.AssetConfig(
             config_asset=Asset(asset_id),
         ).submit()
 
         self.canceled_by_hash[file_hash] = UInt64(1)
-        self.signers_blob_by_hash[file_hash] = Bytes(b"")
-        self.signed_blob_by_hash[file_hash] = Bytes(b"")
+        self._clear_signatures(file_hash)
 
         return asset_id
 
+    @arc4.abimethod()
+    def box_refs(self) -> None:
+        """create_contract / cancel / reject grubunda ek box referansı taşıyıcısı; durum değiştirmez."""
+
     @arc4.abimethod()
     def my_contracts(self) -> Bytes:
         """
@@ -330,26 +380,14 @@ class Blocksign(ARC4Contract):
 
     @arc4.abimethod()
     def total_signers(self, file_hash: arc4.DynamicBytes) -> UInt64:
-        sgn_blob, has_sgn = self.signers_blob_by_hash.maybe(file_hash)
-        if not has_sgn:
+        count, has_count = self.count_by_hash.maybe(file_hash)
+        if not has_count:
             return UInt64(0)
-        # 32 baytlık parça say
-        i = UInt64(0)
-        cnt = UInt64(0)
-        while i < sgn_blob.length:
-            cnt = cnt + UInt64(1)
-            i = i + UInt64(32)
-        return cnt
+        return count.total.native
 
     @arc4.abimethod()
     def signed_count(self, file_hash: arc4.DynamicBytes) -> UInt64:
-        sgh_blob, has_sgh = self.signed_blob_by_hash.maybe(file_hash)
-        if not has_sgh:
+        count, has_count = self.count_by_hash.maybe(file_hash)
+        if not has_count:
             return UInt64(0)
-        # 32 baytlık parça say
-        i = UInt64(0)
-        cnt = UInt64(0)
-        while i < sgh_blob.length:
-            cnt = cnt + UInt64(1)
-            i = i + UInt64(32)
-        return cnt
+        return count.signed.native